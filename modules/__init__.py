@@ -11,16 +11,24 @@ A modular system for processing wrestling result markdown files:
 
 __version__ = "1.0.0"
 
-from .markdown_parser import MarkdownParser, ParsedMarkdown, ContentItem
+from .markdown_parser import MarkdownParser, ParsedMarkdown, ContentItem, MappedContentItems
 from .year_extractor import YearExtractor
+from .date_calendar import DateCalendar
 from .date_parser import DateParser, ExtractedDate
-from .format_converter import FormatConverter, WrestlingEvent, WrestlingMatch
+from .keyword_matcher import KeywordMatcher
+from .format_converter import FormatConverter, WrestlingEvent, WrestlingMatch, PARSER_VERSION
+from .build_manifest import BuildManifest
+from .parse_cache import ParseCache
+from .file_discovery import FileDiscovery
+from .progress import ProgressReporter
 from .file_merger import FileMerger, FileInfo, YearlyOutput
+from .directory_watcher import DirectoryWatcher
 
 __all__ = [
-    'MarkdownParser', 'ParsedMarkdown', 'ContentItem',
+    'MarkdownParser', 'ParsedMarkdown', 'ContentItem', 'MappedContentItems',
     'YearExtractor',
-    'DateParser', 'ExtractedDate',
-    'FormatConverter', 'WrestlingEvent', 'WrestlingMatch',
-    'FileMerger', 'FileInfo', 'YearlyOutput'
+    'DateCalendar', 'DateParser', 'ExtractedDate',
+    'KeywordMatcher', 'FormatConverter', 'WrestlingEvent', 'WrestlingMatch', 'PARSER_VERSION',
+    'BuildManifest', 'ParseCache', 'FileDiscovery', 'ProgressReporter',
+    'FileMerger', 'FileInfo', 'YearlyOutput', 'DirectoryWatcher'
 ]
\ No newline at end of file
@@ -0,0 +1,256 @@
+"""
+Build Manifest Module for Wrestling Results
+
+This module records what went into each yearly season file - every input's
+size, modification time, content hash and year, and the hash of the file
+written - so a later run can tell which years are already up to date.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = '.wrestling_manifest.json'
+MANIFEST_FORMAT = 1
+
+
+def hash_file(filepath: str) -> str:
+    """Get the SHA-256 hex digest of a file's content"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """Input and output state of the last build in an output directory"""
+    
+    def __init__(self, output_dir: str, parser_version: int):
+        """
+        Args:
+            output_dir: Directory holding the season files and the manifest
+            parser_version: Version of the parsing and formatting code; a
+                manifest written by another version is ignored
+        """
+        self.output_dir = output_dir
+        self.parser_version = parser_version
+        self.path = os.path.join(output_dir, MANIFEST_FILENAME)
+        
+        # Absolute input path -> size, mtime_ns, sha256, year, status,
+        # series_name, event_count
+        self.files: Dict[str, Dict[str, Any]] = {}
+        
+        # Year (as a string, like in the JSON) -> input paths, output_filename
+        # and the output's size, mtime_ns and sha256 (None without output)
+        self.years: Dict[str, Dict[str, Any]] = {}
+        
+        # Stat and hash of inputs that differ from their record, by path
+        self._fresh: Dict[str, Dict[str, Any]] = {}
+    
+    def load(self) -> bool:
+        """
+        Read the manifest from the output directory
+        
+        Returns:
+            True if a manifest of this format and parser version was loaded
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable manifest %s: %s", self.path, e)
+            return False
+        
+        if (not isinstance(data, dict) or data.get('format') != MANIFEST_FORMAT or
+                data.get('parser_version') != self.parser_version):
+            return False
+        
+        self.files = data.get('files', {})
+        self.years = data.get('years', {})
+        return True
+    
+    def save(self):
+        """Write the manifest, replacing the previous one atomically"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        data = {
+            'format': MANIFEST_FORMAT,
+            'parser_version': self.parser_version,
+            'files': self.files,
+            'years': self.years,
+        }
+        
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(temp_path, self.path)
+    
+    def is_year_current(self, year: int, filepaths: List[str]) -> bool:
+        """
+        Check whether a year's season file is up to date with its inputs
+        
+        A year is current when it was built from exactly these files, each
+        of them still mapped to this year and unchanged, and its output file
+        was not touched since. An input whose size or mtime changed is
+        hashed, so a file that was only touched still counts as unchanged.
+        
+        Args:
+            year: Year to check
+            filepaths: Input files currently mapped to the year
+        
+        Returns:
+            True if the year does not need to be rebuilt
+        """
+        record = self.years.get(str(year))
+        paths = [os.path.abspath(filepath) for filepath in filepaths]
+        
+        current = record is not None and record['files'] == paths
+        
+        # Check every file, even after a mismatch, so changed inputs are
+        # hashed once here and recorded after the rebuild
+        for path in paths:
+            if not self._is_file_current(path, year):
+                current = False
+        
+        return current and self._is_output_current(record)
+    
+    def _is_file_current(self, path: str, year: int) -> bool:
+        """Check one input against its record, remembering its new state if it changed"""
+        record = self.files.get(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        
+        if record and record['size'] == stat.st_size and record['mtime_ns'] == stat.st_mtime_ns:
+            return record['year'] == year
+        
+        try:
+            sha256 = hash_file(path)
+        except OSError:
+            return False
+        
+        self._fresh[path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256}
+        
+        if record and record['sha256'] == sha256:
+            # Only touched: keep the record but remember the new stat
+            record.update(self._fresh.pop(path))
+            return record['year'] == year
+        
+        return False
+    
+    def _is_output_current(self, record: Dict[str, Any]) -> bool:
+        """Check that a year's season file is still the one written by the last build"""
+        output = record['output']
+        if output is None:
+            return True
+        
+        try:
+            stat = os.stat(os.path.join(self.output_dir, record['output_filename']))
+        except OSError:
+            return False
+        
+        return stat.st_size == output['size'] and stat.st_mtime_ns == output['mtime_ns']
+    
+    def record_year(self, year: int, filepaths: List[str], parsed_files: List[Any],
+                    output_filename: str, output_hash: Optional[str]):
+        """
+        Record the inputs and output of a rebuilt year
+        
+        Args:
+            year: Year that was rebuilt
+            filepaths: Input files of the year, in processing order
+            parsed_files: FileInfo objects of the files that parsed successfully
+            output_filename: Name of the season file in the output directory
+            output_hash: SHA-256 of the text written to the season file, or
+                None if no file was written
+        """
+        parsed_by_path = {os.path.abspath(file_info.filepath): file_info for file_info in parsed_files}
+        paths = [os.path.abspath(filepath) for filepath in filepaths]
+        
+        for path in paths:
+            state = self._fresh.pop(path, None) or self._stat_and_hash(path)
+            if state is None:
+                self.files.pop(path, None)
+                continue
+            
+            file_info = parsed_by_path.get(path)
+            state.update({
+                'year': year,
+                'status': 'ok' if file_info else 'error',
+                'series_name': file_info.series_name if file_info else '',
+                'event_count': file_info.event_count if file_info else 0,
+            })
+            self.files[path] = state
+        
+        output = None
+        if output_hash is not None:
+            stat = os.stat(os.path.join(self.output_dir, output_filename))
+            output = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': output_hash,
+            }
+        
+        recorded = [path for path in paths if path in self.files]
+        self.years[str(year)] = {'files': recorded, 'output_filename': output_filename, 'output': output}
+    
+    def file_hash(self, filepath: str) -> Optional[str]:
+        """
+        Get the content hash of an input, hashing it only if its record is stale
+        
+        Returns:
+            SHA-256 hex digest, or None if the file cannot be read
+        """
+        path = os.path.abspath(filepath)
+        state = self._fresh.get(path) or self._stat_and_hash(path)
+        if state is None:
+            return None
+        
+        self._fresh[path] = state
+        return state['sha256']
+    
+    def _stat_and_hash(self, path: str) -> Optional[Dict[str, Any]]:
+        """Get the current state of an input that has no fresh state yet"""
+        record = self.files.get(path)
+        try:
+            stat = os.stat(path)
+            if record and record['size'] == stat.st_size and record['mtime_ns'] == stat.st_mtime_ns:
+                return {key: record[key] for key in ('size', 'mtime_ns', 'sha256')}
+            return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': hash_file(path)}
+        except OSError:
+            return None
+    
+    def recorded_files(self, year: int) -> List[Dict[str, Any]]:
+        """
+        Get the records of a year's successfully parsed inputs
+        
+        Returns:
+            Records with 'path' added, in processing order; empty if the year
+            produced no output
+        """
+        record = self.years[str(year)]
+        if record['output'] is None:
+            return []
+        
+        return [dict(self.files[path], path=path) for path in record['files']
+                if self.files[path]['status'] == 'ok']
+    
+    def forget_years_except(self, years: List[int]):
+        """Drop years and inputs that are no longer part of the build"""
+        keep = {str(year) for year in years}
+        for year in list(self.years):
+            if year not in keep:
+                del self.years[year]
+        
+        paths = {path for record in self.years.values() for path in record['files']}
+        for path in list(self.files):
+            if path not in paths:
+                del self.files[path]
@@ -0,0 +1,109 @@
+"""
+Date Calendar Module for Wrestling Results
+
+This module precomputes lookup tables for every day in the supported wrestling
+date range, so dates can be validated, ordered and rendered without building
+new datetime objects or strings for each event.
+"""
+
+from array import array
+from datetime import date, datetime
+from functools import lru_cache
+from typing import List
+
+
+class DateCalendar:
+    """Precomputed rendering, ordering and validity tables for a range of years"""
+    
+    MONTH_NAMES = [
+        'January', 'February', 'March', 'April', 'May', 'June',
+        'July', 'August', 'September', 'October', 'November', 'December'
+    ]
+    
+    def __init__(self, start_year: int = 1990, end_year: int = 2030):
+        """
+        Args:
+            start_year: First year covered by the tables
+            end_year: Last year covered by the tables
+        """
+        self.start_year = start_year
+        self.end_year = end_year
+        self.first_ordinal = date(start_year, 1, 1).toordinal()
+        self.last_ordinal = date(end_year, 12, 31).toordinal()
+        
+        # (year, month, day) slot -> day ordinal, 0 for impossible dates.
+        # Every month gets 31 slots so the slot is plain arithmetic.
+        self._ordinals = array('l', [0]) * ((end_year - start_year + 1) * 12 * 31)
+        
+        # Per-day tables indexed by ordinal - first_ordinal
+        self._datetimes: List[datetime] = []
+        self._rendered: List[str] = []
+        
+        for ordinal in range(self.first_ordinal, self.last_ordinal + 1):
+            day = datetime.fromordinal(ordinal)
+            self._ordinals[self._slot(day.year, day.month, day.day)] = ordinal
+            self._datetimes.append(day)
+            self._rendered.append(self.render_date(day))
+    
+    def _slot(self, year: int, month: int, day: int) -> int:
+        return ((year - self.start_year) * 12 + month - 1) * 31 + day - 1
+    
+    def ordinal(self, year: int, month: int, day: int) -> int:
+        """
+        Get the day ordinal of a date
+        
+        Ordinals match date.toordinal(), so they order chronologically and
+        can be compared with ordinals of dates outside the range.
+        
+        Args:
+            year: Year
+            month: Month (1-12)
+            day: Day of the month
+            
+        Returns:
+            The ordinal, or 0 if the date is impossible or outside the range
+        """
+        if not (self.start_year <= year <= self.end_year and 1 <= month <= 12 and 1 <= day <= 31):
+            return 0
+        return self._ordinals[self._slot(year, month, day)]
+    
+    def is_valid(self, year: int, month: int, day: int) -> bool:
+        """Check if a date exists and lies within the range"""
+        return self.ordinal(year, month, day) != 0
+    
+    def contains(self, ordinal: int) -> bool:
+        """Check if a day ordinal lies within the range"""
+        return self.first_ordinal <= ordinal <= self.last_ordinal
+    
+    def to_datetime(self, ordinal: int) -> datetime:
+        """Get the shared datetime for an in-range day ordinal"""
+        return self._datetimes[ordinal - self.first_ordinal]
+    
+    def format(self, ordinal: int) -> str:
+        """Get the Dragon Gate style rendering of an in-range day ordinal"""
+        return self._rendered[ordinal - self.first_ordinal]
+    
+    @classmethod
+    def render_date(cls, date_obj: date) -> str:
+        """
+        Format any date in Dragon Gate style (Month DDth, YYYY)
+        
+        Args:
+            date_obj: Date to format
+            
+        Returns:
+            Formatted date string
+        """
+        day = date_obj.day
+        if 10 <= day % 100 <= 20:
+            suffix = 'th'
+        else:
+            suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
+        
+        return f"{cls.MONTH_NAMES[date_obj.month - 1]} {day}{suffix}, {date_obj.year}"
+
+
+@lru_cache(maxsize=None)
+def default_calendar() -> DateCalendar:
+    """Shared calendar for the 1990-2030 wrestling date range"""
+    return DateCalendar()
@@ -6,9 +6,15 @@ supporting multiple date formats commonly found in wrestling results.
 """
 
 import re
+from collections import OrderedDict
 from datetime import datetime, date
-from typing import List, Optional, Tuple
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, replace
+
+from .date_calendar import DateCalendar, default_calendar
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 @dataclass
@@ -18,12 +24,29 @@ class ExtractedDate:
     original_text: str
     confidence: float  # 0.0 to 1.0, higher means more confident
     line_number: Optional[int] = None
+    start: Optional[int] = None  # Offsets of original_text in the scanned text
+    end: Optional[int] = None
 
 
 class DateParser:
     """Parser for extracting and normalizing dates from wrestling content"""
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 0, calendar: Optional[DateCalendar] = None):
+        """
+        Args:
+            cache_size: Number of distinct lines whose extracted dates are
+                memoized (least recently used are evicted). 0 disables the cache
+            calendar: Precomputed calendar used to validate and render dates;
+                the shared 1990-2030 calendar if omitted
+                
+        Raises:
+            ValueError: If cache_size is negative
+        """
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be 0 or more, got {cache_size}")
+        
+        self.calendar = calendar or default_calendar()
+        
         # Month mappings for text-based months
         self.months_full = {
             'january': 1, 'february': 2, 'march': 3, 'april': 4,
@@ -52,11 +75,47 @@ class DateParser:
             (r'(\d{1,2})/(\d{1,2})/(\d{2})', 'mdy_slash_2digit', 0.6),  # MM/DD/YY
             (r'(\d{1,2})-(\d{1,2})-(\d{2})', 'mdy_dash_2digit', 0.6),   # MM-DD-YY
         ]
+        
+        # All forms compiled into one alternation so a line is scanned once.
+        # Alternatives are ordered so the longest form wins at a position:
+        # 4-digit years before their 2-digit variants, full month names
+        # before abbreviations.
+        scan_order = [
+            'ymd_dash', 'mdy_slash', 'mdy_slash_2digit', 'mdy_dash',
+            'mdy_dash_2digit', 'mdy_dot', 'month_full', 'month_abbrev'
+        ]
+        patterns = {pattern_type: pattern for pattern, pattern_type, _ in self.date_patterns}
+        self.date_scanner = re.compile(
+            '|'.join(f'(?P<{pattern_type}>{patterns[pattern_type]})' for pattern_type in scan_order),
+            re.IGNORECASE
+        )
+        
+        # Outer group index -> (pattern_type, confidence, priority), where
+        # priority is the position in date_patterns used to order results
+        self._scanner_forms = {
+            self.date_scanner.groupindex[pattern_type]: (pattern_type, confidence, priority)
+            for priority, (_, pattern_type, confidence) in enumerate(self.date_patterns)
+        }
+        
+        # Cheap prefilters: every form contains a digit, and either a digit,
+        # separator, digit sequence or a month name, whitespace and a digit
+        self._has_digit = re.compile(r'\d').search
+        self._may_contain_date = re.compile(r'\d[-/.]\d|[a-z]\s+\d', re.IGNORECASE).search
+        
+        # Bounded LRU memo of extraction results keyed on the line text.
+        # Results are stored without a line number.
+        self.cache_size = cache_size
+        self._cache: 'OrderedDict[str, List[ExtractedDate]]' = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
     
     def extract_dates_from_text(self, text: str, line_number: Optional[int] = None) -> List[ExtractedDate]:
         """
         Extract all dates from a text string
         
+        When the cache is enabled, results for a repeated line are served
+        from it as fresh copies, so callers may modify them.
+        
         Args:
             text: Text to search for dates
             line_number: Optional line number for tracking
@@ -64,51 +123,193 @@ class DateParser:
         Returns:
             List of ExtractedDate objects found in the text
         """
-        dates = []
-        
-        for pattern, pattern_type, confidence in self.date_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            
-            for match in matches:
-                try:
-                    parsed_date = self._parse_date_match(match, pattern_type)
-                    if parsed_date and self._is_valid_wrestling_date(parsed_date):
-                        dates.append(ExtractedDate(
-                            date=parsed_date,
-                            original_text=match.group(0),
-                            confidence=confidence,
-                            line_number=line_number
-                        ))
-                except (ValueError, IndexError):
-                    continue
-        
-        # Remove duplicates and sort by confidence
-        dates = self._remove_duplicate_dates(dates)
+        # Most lines have no date at all
+        if not self._has_digit(text) or not self._may_contain_date(text):
+            return []
+        
+        if not self.cache_size:
+            return self._scan_dates(text, line_number)
+        
+        dates = self._cache.get(text)
+        if dates is None:
+            self.cache_misses += 1
+            dates = self._scan_dates(text)
+            self._cache[text] = dates
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self.cache_hits += 1
+            self._cache.move_to_end(text)
+        
+        return [replace(date_obj, line_number=line_number) for date_obj in dates]
+    
+    def _scan_dates(self, text: str, line_number: Optional[int] = None) -> List[ExtractedDate]:
+        """
+        Scan a line for dates, bypassing the cache
+        
+        Args:
+            text: Text to search for dates
+            line_number: Optional line number for tracking
+            
+        Returns:
+            List of ExtractedDate objects found in the text
+        """
+        found = []
+        
+        for match in self.date_scanner.finditer(text):
+            group = match.lastindex
+            pattern_type, confidence, priority = self._scanner_forms[group]
+            
+            try:
+                parsed_date = self._parse_date_match(match.group(group + 1, group + 2, group + 3), pattern_type)
+                if parsed_date and self._is_valid_wrestling_date(parsed_date):
+                    found.append((priority, ExtractedDate(
+                        date=parsed_date,
+                        original_text=match.group(0),
+                        confidence=confidence,
+                        line_number=line_number,
+                        start=match.start(),
+                        end=match.end()
+                    )))
+            except (ValueError, IndexError):
+                continue
+        
+        if len(found) <= 1:
+            return [date_obj for _, date_obj in found]
+        
+        # Keep pattern order for ties, then remove duplicates and sort by confidence
+        found.sort(key=lambda entry: entry[0])
+        dates = self._remove_duplicate_dates([date_obj for _, date_obj in found])
         dates.sort(key=lambda x: x.confidence, reverse=True)
         
         return dates
     
-    def _parse_date_match(self, match: re.Match, pattern_type: str) -> Optional[datetime]:
+    def extract_dates_batch(self, lines: Sequence[str]) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
         """
-        Parse a regex match into a datetime object based on pattern type
+        Extract dates from many lines at once into NumPy arrays
+        
+        Lines are scanned with the same compiled scanner as
+        extract_dates_from_text, but matches are collected as plain integers.
+        Two-digit year expansion, calendar and year-range validation and
+        duplicate removal are then done as array operations, without
+        creating a datetime or ExtractedDate per match. Requires NumPy.
         
         Args:
-            match: Regex match object
+            lines: Lines of text to search
+            
+        Returns:
+            Tuple of (dates as datetime64[D], confidences, line indices). Rows
+            are ordered by line index and, within a line, in the same order
+            extract_dates_from_text returns them
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("extract_dates_batch requires NumPy (pip install numpy)") from e
+        
+        line_indices, priorities, starts = [], [], []
+        years, months, days, confidences, two_digit = [], [], [], [], []
+        
+        for line_index, text in enumerate(lines):
+            if not self._has_digit(text) or not self._may_contain_date(text):
+                continue
+            
+            for match in self.date_scanner.finditer(text):
+                group = match.lastindex
+                pattern_type, confidence, priority = self._scanner_forms[group]
+                first, second, third = match.group(group + 1, group + 2, group + 3)
+                
+                if pattern_type == 'ymd_dash':
+                    year, month, day = int(first), int(second), int(third)
+                elif pattern_type in ('month_full', 'month_abbrev'):
+                    names = self.months_full if pattern_type == 'month_full' else self.months_abbrev
+                    month = names.get(first.lower())
+                    if month is None:
+                        continue
+                    year, day = int(third), int(second)
+                else:
+                    month, day, year = int(first), int(second), int(third)
+                
+                line_indices.append(line_index)
+                priorities.append(priority)
+                starts.append(match.start())
+                years.append(year)
+                months.append(month)
+                days.append(day)
+                confidences.append(confidence)
+                two_digit.append(pattern_type in ('mdy_slash_2digit', 'mdy_dash_2digit'))
+        
+        line_index = np.array(line_indices, dtype=np.int64)
+        year = np.array(years, dtype=np.int64)
+        month = np.array(months, dtype=np.int64)
+        day = np.array(days, dtype=np.int64)
+        confidence = np.array(confidences, dtype=np.float64)
+        
+        # Convert 2-digit years: 00-29 is 2000-2029, 30-99 is 1930-1999
+        year = np.where(np.array(two_digit, dtype=bool), np.where(year < 30, year + 2000, year + 1900), year)
+        
+        # Calendar and wrestling-range validation
+        days_in_month = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+        month_index = np.clip(month - 1, 0, 11)
+        leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+        month_length = days_in_month[month_index] + (leap & (month_index == 1))
+        valid = ((month >= 1) & (month <= 12) & (day >= 1) & (day <= month_length) &
+                 (year >= 1990) & (year <= 2030))
+        
+        # Order matches like the scalar path: by line, then pattern order, then position
+        order = np.lexsort((np.array(starts, dtype=np.int64)[valid],
+                            np.array(priorities, dtype=np.int64)[valid],
+                            line_index[valid]))
+        line_index = line_index[valid][order]
+        confidence = confidence[valid][order]
+        dates = (((year - 1970) * 12 + month - 1)[valid][order].astype('datetime64[M]').astype('datetime64[D]')
+                 + (day - 1)[valid][order].astype('timedelta64[D]'))
+        
+        # Remove duplicates per line, keeping the highest confidence; a date
+        # keeps the position of its first occurrence for tie ordering
+        keys = (line_index << 32) + dates.astype(np.int64)
+        unique_keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        best = np.full(len(unique_keys), -np.inf)
+        np.maximum.at(best, inverse.ravel(), confidence)
+        
+        unique_lines = unique_keys >> 32
+        order = np.lexsort((first, -best, unique_lines))
+        
+        return dates[first][order], best[order], unique_lines[order]
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Get date cache counters
+        
+        Returns:
+            Dictionary with hits, misses, entries and capacity
+        """
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'entries': len(self._cache),
+            'capacity': self.cache_size
+        }
+    
+    def _parse_date_match(self, groups: Tuple[str, str, str], pattern_type: str) -> Optional[datetime]:
+        """
+        Parse the captured date fields into a datetime object based on pattern type
+        
+        Args:
+            groups: The three captured fields of the matched form
             pattern_type: Type of pattern that matched
             
         Returns:
             Parsed datetime or None if parsing failed
         """
-        groups = match.groups()
-        
         try:
             if pattern_type == 'ymd_dash':
                 year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
-                return datetime(year, month, day)
+                return self._make_date(year, month, day)
                 
             elif pattern_type in ['mdy_slash', 'mdy_dash', 'mdy_dot']:
                 month, day, year = int(groups[0]), int(groups[1]), int(groups[2])
-                return datetime(year, month, day)
+                return self._make_date(year, month, day)
                 
             elif pattern_type in ['mdy_slash_2digit', 'mdy_dash_2digit']:
                 month, day, year = int(groups[0]), int(groups[1]), int(groups[2])
@@ -117,23 +318,30 @@ class DateParser:
                     year += 2000
                 else:  # Assume 30-99 is 1930-1999
                     year += 1900
-                return datetime(year, month, day)
+                return self._make_date(year, month, day)
                 
             elif pattern_type == 'month_full':
                 month_name, day, year = groups[0], int(groups[1]), int(groups[2])
                 month = self.months_full[month_name.lower()]
-                return datetime(year, month, day)
+                return self._make_date(year, month, day)
                 
             elif pattern_type == 'month_abbrev':
                 month_name, day, year = groups[0], int(groups[1]), int(groups[2])
                 month = self.months_abbrev[month_name.lower()]
-                return datetime(year, month, day)
+                return self._make_date(year, month, day)
                 
         except (ValueError, KeyError):
             pass
             
         return None
     
+    def _make_date(self, year: int, month: int, day: int) -> datetime:
+        """Get the datetime for a date, shared from the calendar when in range"""
+        ordinal = self.calendar.ordinal(year, month, day)
+        if ordinal:
+            return self.calendar.to_datetime(ordinal)
+        return datetime(year, month, day)
+    
     def _is_valid_wrestling_date(self, date_obj: datetime) -> bool:
         """
         Check if a date is reasonable for wrestling events
@@ -206,30 +414,21 @@ class DateParser:
         Returns:
             Formatted date string
         """
-        month_names = [
-            'January', 'February', 'March', 'April', 'May', 'June',
-            'July', 'August', 'September', 'October', 'November', 'December'
-        ]
-        
-        day = date_obj.day
-        ordinal = self._get_ordinal_suffix(day)
-        
-        return f"{month_names[date_obj.month - 1]} {day}{ordinal}, {date_obj.year}"
+        return self.format_date_ordinal(date_obj.toordinal())
     
-    def _get_ordinal_suffix(self, day: int) -> str:
+    def format_date_ordinal(self, ordinal: int) -> str:
         """
-        Get ordinal suffix for a day (st, nd, rd, th)
+        Format a day ordinal (as from date.toordinal) in Dragon Gate style
         
         Args:
-            day: Day of the month
+            ordinal: Day ordinal to format
             
         Returns:
-            Ordinal suffix string
+            Formatted date string, looked up in the calendar when in range
         """
-        if 10 <= day % 100 <= 20:
-            return 'th'
-        else:
-            return {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
+        if self.calendar.contains(ordinal):
+            return self.calendar.format(ordinal)
+        return DateCalendar.render_date(date.fromordinal(ordinal))
     
     def extract_dates_from_content_items(self, content_items) -> List[Tuple[int, ExtractedDate]]:
         """
@@ -0,0 +1,241 @@
+"""
+Directory Watcher Module for Wrestling Results
+
+This module keeps a merger running on an input directory, polling it for
+changed files and rebuilding only the years those files belong to, with the
+events of every other file kept in memory.
+"""
+
+import logging
+import os
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from .build_manifest import BuildManifest
+from .file_merger import FileMerger, FileInfo, YearlyOutput
+from .format_converter import PARSER_VERSION
+
+
+logger = logging.getLogger(__name__)
+
+
+class DirectoryWatcher:
+    """Rebuilds the season files of an input directory as its files change"""
+    
+    def __init__(self, merger: FileMerger, input_dir: str, output_dir: str, interval: float = 1.0):
+        """
+        Args:
+            merger: Merger used for parsing and rendering, kept warm between rebuilds
+            input_dir: Directory containing markdown files
+            output_dir: Directory to write yearly output files
+            interval: Seconds between polls of input_dir
+        """
+        self.merger = merger
+        self.input_dir = input_dir
+        
+        # Rebuilds reuse the events of unchanged files
+        merger.keep_events = True
+        self.output_dir = output_dir
+        self.interval = interval
+        
+        # Current output of every year, as in process_directory's result
+        self.outputs: Dict[int, YearlyOutput] = {}
+        
+        # (size, mtime_ns) of every input at the last poll
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+        
+        # Year every input was mapped to at the last poll
+        self._years: Dict[str, int] = {}
+        
+        # Parsed inputs with their events, by path
+        self._parsed: Dict[str, FileInfo] = {}
+        
+        # (size, mtime_ns) of inputs that failed to parse, so they are only
+        # retried once they change
+        self._failed: Dict[str, Tuple[int, int]] = {}
+        
+        self.manifest = BuildManifest(output_dir, PARSER_VERSION)
+    
+    def build(self, workers: int = 1, force: bool = False) -> List[YearlyOutput]:
+        """
+        Bring the output directory up to date before watching
+        
+        The inputs of years that were already up to date are parsed here
+        too, so a later change only re-parses the files that changed. Inputs
+        the manifest records as failed are not parsed again until they change.
+        
+        Args:
+            workers: Number of worker processes for this first build
+            force: Rebuild every year regardless of the manifest
+        
+        Returns:
+            List of YearlyOutput objects, as from process_directory
+        """
+        # Snapshot first, so changes made during the build are seen by the first poll
+        self._snapshot = self._scan()
+        
+        yearly_outputs = self.merger.process_directory(self.input_dir, self.output_dir, workers=workers, force=force)
+        files_by_year = self.merger._group_files_by_year(list(self._snapshot))
+        self._years = self._map_years(files_by_year)
+        self.manifest.load()
+        
+        rebuilt = set()
+        for yearly_output in yearly_outputs:
+            self.outputs[yearly_output.year] = yearly_output
+            if yearly_output.rebuilt:
+                rebuilt.add(yearly_output.year)
+                for file_info in yearly_output.series_files:
+                    self._keep(file_info)
+        
+        unparsed = []
+        for year in sorted(files_by_year):
+            for file_info in files_by_year[year]:
+                if file_info.filepath in self._parsed:
+                    continue
+                if year in rebuilt or self._recorded_failure(file_info.filepath):
+                    self._failed[file_info.filepath] = self._snapshot[file_info.filepath]
+                else:
+                    unparsed.append(file_info)
+        
+        if unparsed:
+            logger.info("Parsing %d files of up to date years", len(unparsed))
+            self._seed(unparsed, workers)
+        
+        return yearly_outputs
+    
+    def run(self, on_rebuild: Optional[Callable[[List[int]], None]] = None):
+        """
+        Poll input_dir until interrupted
+        
+        Args:
+            on_rebuild: Called with the rebuilt years after every rebuild
+        """
+        logger.info("Watching %s for changes (Ctrl+C to stop)", self.input_dir)
+        while True:
+            time.sleep(self.interval)
+            years = self.poll()
+            if years and on_rebuild:
+                on_rebuild(years)
+    
+    def poll(self) -> List[int]:
+        """
+        Check input_dir once and rebuild the years of changed files
+        
+        A file moving to another year, e.g. after a rename, rebuilds both
+        its old and its new year.
+        
+        Returns:
+            The years that were rebuilt or dropped, in order
+        """
+        snapshot = self._scan()
+        changed = {path for path in snapshot.keys() | self._snapshot.keys()
+                   if snapshot.get(path) != self._snapshot.get(path)}
+        if not changed:
+            return []
+        
+        self._snapshot = snapshot
+        files_by_year = self.merger._group_files_by_year(list(snapshot))
+        years = self._map_years(files_by_year)
+        
+        affected: Set[int] = set()
+        for path in changed:
+            self._parsed.pop(path, None)
+            self._failed.pop(path, None)
+            for year in (self._years.get(path), years.get(path)):
+                if year:
+                    affected.add(year)
+        self._years = years
+        if not affected:
+            # Only files outside the selection or without a year changed
+            return []
+        
+        logger.info("%d changed files, rebuilding %s", len(changed), sorted(affected))
+        
+        for year in sorted(affected):
+            if year not in files_by_year:
+                # Last file of the year is gone; its old season file is left as is
+                self.outputs.pop(year, None)
+                continue
+            
+            file_infos = files_by_year[year]
+            file_results = (self._result(file_info) for file_info in file_infos)
+            
+            yearly_output = self.merger._process_year(year, file_infos, self.output_dir, file_results)
+            if yearly_output:
+                self.outputs[year] = yearly_output
+            else:
+                self.outputs.pop(year, None)
+            
+            self.manifest.record_year(
+                year, [file_info.filepath for file_info in file_infos],
+                yearly_output.series_files if yearly_output else [],
+                f"{year}_season.md",
+                yearly_output.content_hash if yearly_output else None
+            )
+        
+        self.manifest.forget_years_except(sorted(self.merger._input_years(list(snapshot))))
+        self.manifest.save()
+        
+        return sorted(affected)
+    
+    def yearly_outputs(self) -> List[YearlyOutput]:
+        """Get the current output of every year, in year order"""
+        return [self.outputs[year] for year in sorted(self.outputs)]
+    
+    def _result(self, file_info: FileInfo) -> Optional[FileInfo]:
+        """Get a file's kept events, parsing it only if it changed since it was last parsed"""
+        path = file_info.filepath
+        if path in self._parsed:
+            return self._parsed[path]
+        if path in self._failed and self._failed[path] == self._snapshot.get(path):
+            return None
+        return self._parse(file_info)
+    
+    def _parse(self, file_info: FileInfo) -> Optional[FileInfo]:
+        """Parse a file and keep its events for later rebuilds"""
+        parsed = self.merger._parse_file(file_info)
+        self._remember(file_info, parsed)
+        return parsed
+    
+    def _seed(self, file_infos: List[FileInfo], workers: int):
+        """Parse files whose years were not rebuilt, keeping their events"""
+        if workers <= 1:
+            for file_info in file_infos:
+                self._parse(file_info)
+            return
+        
+        with self.merger._worker_pool(workers) as executor:
+            for file_info, parsed in zip(file_infos, self.merger._parse_files_in_pool(file_infos, executor, workers)):
+                self._remember(file_info, parsed)
+    
+    def _remember(self, file_info: FileInfo, parsed: Optional[FileInfo]):
+        """Keep a parse result, or the state of the file if it failed"""
+        if parsed:
+            self._keep(parsed)
+        elif file_info.filepath in self._snapshot:
+            self._failed[file_info.filepath] = self._snapshot[file_info.filepath]
+    
+    def _recorded_failure(self, filepath: str) -> bool:
+        """Check whether the manifest records this unchanged input as failing to parse"""
+        record = self.manifest.files.get(os.path.abspath(filepath))
+        return (record is not None and record['status'] == 'error' and
+                (record['size'], record['mtime_ns']) == self._snapshot.get(filepath))
+    
+    def _keep(self, file_info: FileInfo):
+        """Keep a parsed file's events for later rebuilds"""
+        self._parsed[file_info.filepath] = file_info
+    
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """Get (size, mtime_ns) of every markdown file in input_dir"""
+        snapshot = {}
+        for filepath in self.merger._find_markdown_files(self.input_dir, self.output_dir):
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                continue
+            snapshot[filepath] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+    
+    def _map_years(self, files_by_year: Dict[int, List[FileInfo]]) -> Dict[str, int]:
+        """Map every input to its year, leaving out files without one"""
+        return {file_info.filepath: year for year, file_infos in files_by_year.items() for file_info in file_infos}
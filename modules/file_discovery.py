@@ -0,0 +1,150 @@
+"""
+File Discovery Module for Wrestling Results
+
+This module finds the markdown files of an input tree with os.scandir,
+applying include/exclude globs, leaving out the output directory and
+optionally following symlinks, with subdirectories scanned in parallel.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from fnmatch import fnmatchcase
+from typing import Iterable, List, Optional, Set, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class FileDiscovery:
+    """Finds the markdown files of an input directory tree"""
+    
+    def __init__(self, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None,
+                 follow_symlinks: bool = False, workers: int = 1):
+        """
+        Args:
+            include: Globs a file must match (any of them) besides ending in
+                .md; matched against the path relative to the input directory
+                and against the bare filename
+            exclude: Globs of files and directories to leave out, matched the
+                same way; an excluded directory is not scanned at all
+            follow_symlinks: Descend into symlinked directories; every
+                directory is scanned at most once, so symlink loops end
+            workers: Number of threads scanning directories
+        """
+        self.include = list(include or [])
+        self.exclude = list(exclude or [])
+        self.follow_symlinks = follow_symlinks
+        self.workers = max(1, workers)
+        
+        # Directories already scanned during find(), by (device, inode)
+        self._seen: Set[Tuple[int, int]] = set()
+        self._lock = threading.Lock()
+    
+    def find(self, directory: str, skip_dirs: Iterable[Optional[str]] = ()) -> List[str]:
+        """
+        Find all matching .md files under a directory
+        
+        Args:
+            directory: Input directory
+            skip_dirs: Directories not to scan, such as the output directory
+        
+        Returns:
+            File paths (joined onto directory), sorted by relative path
+        """
+        skip = {self._identity(path) for path in skip_dirs if path}
+        skip.discard(None)
+        
+        root_identity = self._identity(directory)
+        if root_identity is None or root_identity in skip:
+            return []
+        
+        self._seen = {root_identity} | skip
+        
+        found: List[Tuple[str, str]] = []
+        if self.workers == 1:
+            pending = [(directory, "")]
+            while pending:
+                files, subdirs = self._scan(*pending.pop())
+                found.extend(files)
+                pending.extend(subdirs)
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures: List[Future] = [executor.submit(self._scan, directory, "")]
+                while futures:
+                    files, subdirs = futures.pop().result()
+                    found.extend(files)
+                    futures.extend(executor.submit(self._scan, path, relpath) for path, relpath in subdirs)
+        
+        found.sort()
+        return [path for _, path in found]
+    
+    def _scan(self, path: str, relpath: str) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """
+        List one directory
+        
+        Returns:
+            Tuple of ((relative path, path) of matching files,
+            (path, relative path) of subdirectories to scan)
+        """
+        files = []
+        subdirs = []
+        
+        try:
+            entries = list(os.scandir(path))
+        except OSError as e:
+            logger.warning("Cannot scan %s: %s", path, e)
+            return files, subdirs
+        
+        for entry in entries:
+            entry_relpath = f"{relpath}/{entry.name}" if relpath else entry.name
+            
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            
+            if is_dir:
+                if self._matches(self.exclude, entry_relpath, entry.name):
+                    continue
+                if entry.is_symlink() and not self.follow_symlinks:
+                    continue
+                if self._claim(entry):
+                    subdirs.append((entry.path, entry_relpath))
+                continue
+            
+            if not entry.name.lower().endswith('.md'):
+                continue
+            if self.include and not self._matches(self.include, entry_relpath, entry.name):
+                continue
+            if self._matches(self.exclude, entry_relpath, entry.name):
+                continue
+            
+            files.append((entry_relpath, entry.path))
+        
+        return files, subdirs
+    
+    def _claim(self, entry: os.DirEntry) -> bool:
+        """Mark a directory as scanned, returning False if it already was"""
+        try:
+            stat = entry.stat()
+        except OSError:
+            return False
+        
+        identity = (stat.st_dev, stat.st_ino)
+        with self._lock:
+            if identity in self._seen:
+                return False
+            self._seen.add(identity)
+        return True
+    
+    def _identity(self, path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_dev, stat.st_ino
+    
+    def _matches(self, patterns: List[str], relpath: str, name: str) -> bool:
+        return any(fnmatchcase(relpath, pattern) or fnmatchcase(name, pattern) for pattern in patterns)
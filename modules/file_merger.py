@@ -5,15 +5,31 @@ This module handles merging multiple wrestling result files by year,
 sorting events chronologically, and organizing series headers.
 """
 
+import contextlib
+import hashlib
+import heapq
+import logging
+import logging.handlers
 import os
-from typing import List, Dict, Optional
+import queue
+from fnmatch import fnmatchcase
+from collections import deque
+from itertools import islice
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Deque, Iterable, Iterator, List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass
-from datetime import datetime
 
-from .markdown_parser import MarkdownParser, ParsedMarkdown, ContentItem
+from .markdown_parser import MarkdownParser, ParsedMarkdown, ContentItem, MappedContentItems
 from .year_extractor import YearExtractor
 from .date_parser import DateParser, ExtractedDate
-from .format_converter import FormatConverter, WrestlingEvent
+from .format_converter import FormatConverter, WrestlingEvent, PARSER_VERSION, _use_chunk_converter
+from .build_manifest import BuildManifest, hash_file
+from .parse_cache import DEFAULT_MAX_BYTES, ParseCache
+from .file_discovery import FileDiscovery
+from .progress import ProgressReporter
+
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -25,6 +41,8 @@ class FileInfo:
     series_name: str
     parsed_data: Optional[ParsedMarkdown] = None
     events: List[WrestlingEvent] = None
+    event_count: int = 0
+    content_hash: Optional[str] = None  # SHA-256 of the file, the parse cache key
 
 
 @dataclass
@@ -32,71 +50,422 @@ class YearlyOutput:
     """Represents the merged output for a single year"""
     year: int
     series_files: List[FileInfo]
-    merged_content: str
+    merged_content: Optional[str]  # Only kept when the merger is asked to
     output_filename: str
+    output_path: str = ""
+    byte_count: int = 0
+    event_count: int = 0
+    content_hash: Optional[str] = None  # SHA-256 of the season file's text
+    rebuilt: bool = True  # False when the year was up to date and not rewritten
 
 
 class FileMerger:
     """Merges wrestling results files by year"""
     
-    def __init__(self):
+    # Files at least this large are split into chunks across all workers
+    # instead of being parsed by a single worker
+    LARGE_FILE_BYTES = 4 * 1024 * 1024
+    
+    # Files submitted to the pool ahead of the one being collected, per worker
+    PARSE_WINDOW_PER_WORKER = 2
+    
+    def __init__(self, use_mmap: bool = False, date_cache_size: int = 0, cache_dir: Optional[str] = None,
+                 keep_content: bool = False, discovery: Optional[FileDiscovery] = None,
+                 years: Optional[Iterable[int]] = None, series: Optional[List[str]] = None,
+                 progress: Optional[ProgressReporter] = None, cache_max_bytes: int = DEFAULT_MAX_BYTES,
+                 keep_events: bool = False):
+        """
+        Args:
+            use_mmap: Parse files into memory-mapped, offset-based content
+                items instead of one string per line
+            date_cache_size: Size of the LRU cache of extracted dates per line
+                shared by the merger and its format converter (0 disables it)
+            cache_dir: Directory of the on-disk cache of events extracted per
+                file, or None to always parse
+            keep_content: Keep each season file's text in
+                YearlyOutput.merged_content; otherwise it is only written out
+            discovery: How input files are found (filters, symlinks, threads);
+                every .md file by default
+            years: Only build these years (all years if omitted)
+            series: Only build years with a file whose name matches one of
+                these globs, case-insensitively; the series title itself is
+                only known after reading a file, so it cannot be used. Each
+                selected year is built from all of its files
+            progress: Display counting the files parsed by process_directory
+                and summarize_directory; nothing is drawn if omitted
+            cache_max_bytes: Size the on-disk cache is pruned to after a build
+            keep_events: Keep each file's events in YearlyOutput.series_files
+                after its season file is written, as watch mode needs; otherwise
+                only its series name and event count are kept (unless
+                keep_content is set)
+        """
+        self.use_mmap = use_mmap
+        self.keep_content = keep_content
+        self.keep_events = keep_events
+        
+        # Constructor arguments that affect parsing, used to build equivalent
+        # mergers in worker processes
+        self.options = {'use_mmap': use_mmap, 'date_cache_size': date_cache_size, 'cache_dir': cache_dir,
+                        'keep_content': keep_content}
+        
+        self.parse_cache = ParseCache(cache_dir, PARSER_VERSION, cache_max_bytes) if cache_dir else None
+        self.discovery = discovery or FileDiscovery()
+        
+        # Selection applied while grouping, before any file is opened
+        self.selected_years = set(years) if years is not None else None
+        self.series_patterns = [pattern.lower() for pattern in series or []]
+        
+        self.progress = progress or ProgressReporter(enabled=False)
+        
         self.markdown_parser = MarkdownParser()
         self.year_extractor = YearExtractor()
-        self.date_parser = DateParser()
-        self.format_converter = FormatConverter()
+        self.date_parser = DateParser(cache_size=date_cache_size)
+        self.format_converter = FormatConverter(date_parser=self.date_parser)
     
-    def process_directory(self, input_dir: str, output_dir: str) -> List[YearlyOutput]:
+    def process_directory(self, input_dir: str, output_dir: str, workers: int = 1,
+                          force: bool = False) -> List[YearlyOutput]:
         """
         Process all markdown files in a directory and merge them by year
         
+        A manifest in output_dir records the inputs and output of every
+        year, and only years whose inputs were added, removed, changed or
+        mapped to another year (or whose season file was modified) are
+        rebuilt.
+        
         Args:
             input_dir: Directory containing markdown files
             output_dir: Directory to write yearly output files
+            workers: Number of worker processes; files are parsed in
+                parallel when greater than 1
+            force: Rebuild every year regardless of the manifest
             
         Returns:
-            List of YearlyOutput objects
+            List of YearlyOutput objects, including up-to-date years
         """
         # Find all markdown files
-        md_files = self._find_markdown_files(input_dir)
-        print(f"Found {len(md_files)} markdown files")
+        md_files = self._find_markdown_files(input_dir, output_dir)
+        logger.info("Found %d markdown files", len(md_files))
         
         # Group files by year
         files_by_year = self._group_files_by_year(md_files)
-        print(f"Grouped into {len(files_by_year)} years: {sorted(files_by_year.keys())}")
+        logger.info("Grouped into %d years: %s", len(files_by_year), sorted(files_by_year.keys()))
+        
+        manifest = BuildManifest(output_dir, PARSER_VERSION)
+        # Loaded even when forced, so records of years outside the selection survive
+        manifest.load()
+        
+        stale_years = {
+            year: file_infos for year, file_infos in files_by_year.items()
+            if force or not manifest.is_year_current(year, [file_info.filepath for file_info in file_infos])
+        }
+        current_years = sorted(set(files_by_year) - set(stale_years))
+        if current_years:
+            logger.info("Up to date, skipping %d years: %s", len(current_years), current_years)
+        
+        # Key the parse cache by content hashes the manifest already knows
+        if self.parse_cache:
+            for file_infos in stale_years.values():
+                for file_info in file_infos:
+                    file_info.content_hash = manifest.file_hash(file_info.filepath)
+        
+        self.progress.start(sum(len(file_infos) for file_infos in stale_years.values()))
+        try:
+            if workers > 1 and stale_years:
+                rebuilt = self._process_years_parallel(stale_years, output_dir, workers)
+            else:
+                # Process each year
+                rebuilt = []
+                for year in sorted(stale_years.keys()):
+                    year_files = stale_years[year]
+                    
+                    yearly_output = self._process_year(year, year_files, output_dir)
+                    if yearly_output:
+                        rebuilt.append(yearly_output)
+        finally:
+            self.progress.finish()
+        
+        # Record what the rebuilt years were made from
+        outputs_by_year = {yearly_output.year: yearly_output for yearly_output in rebuilt}
+        for year, file_infos in stale_years.items():
+            yearly_output = outputs_by_year.get(year)
+            manifest.record_year(
+                year, [file_info.filepath for file_info in file_infos],
+                yearly_output.series_files if yearly_output else [],
+                f"{year}_season.md",
+                yearly_output.content_hash if yearly_output else None
+            )
+        
+        # Years outside the selection keep their records; only years without
+        # any input files are forgotten
+        input_years = self._input_years(md_files)
+        manifest.forget_years_except(sorted(input_years))
+        manifest.save()
+        
+        if self.parse_cache and stale_years:
+            self.parse_cache.prune()
+        
+        for year in current_years:
+            yearly_output = self._recorded_yearly_output(year, manifest)
+            if yearly_output:
+                outputs_by_year[year] = yearly_output
+        
+        for yearly_output in self._unselected_outputs(manifest, files_by_year, input_years):
+            outputs_by_year[yearly_output.year] = yearly_output
+        
+        return [outputs_by_year[year] for year in sorted(outputs_by_year)]
+    
+    def summarize_directory(self, input_dir: str, output_dir: str) -> List[YearlyOutput]:
+        """
+        Gather what get_processing_summary needs without building anything
+        
+        No season file is rendered or written and the manifest is left as
+        is. Years the manifest shows as up to date are described from it;
+        for the others each file gets a header scan for its series name and
+        a streaming pass that counts its dated lines, which is exactly the
+        number of events parsing it would give.
+        
+        Args:
+            input_dir: Directory containing markdown files
+            output_dir: Directory holding the season files and manifest
+            
+        Returns:
+            List of YearlyOutput objects with rebuilt=False
+        """
+        md_files = self._find_markdown_files(input_dir, output_dir)
+        logger.info("Found %d markdown files", len(md_files))
+        
+        files_by_year = self._group_files_by_year(md_files)
+        logger.info("Grouped into %d years: %s", len(files_by_year), sorted(files_by_year.keys()))
+        
+        manifest = BuildManifest(output_dir, PARSER_VERSION)
+        manifest.load()
+        
+        current = {
+            year: manifest.is_year_current(year, [file_info.filepath for file_info in file_infos])
+            for year, file_infos in files_by_year.items()
+        }
+        
+        yearly_outputs = []
+        self.progress.start(sum(len(files_by_year[year]) for year in files_by_year if not current[year]))
+        try:
+            for year in sorted(files_by_year.keys()):
+                if current[year]:
+                    yearly_output = self._recorded_yearly_output(year, manifest)
+                else:
+                    yearly_output = self._count_year(year, files_by_year[year], output_dir)
+                
+                if yearly_output:
+                    yearly_outputs.append(yearly_output)
+        finally:
+            self.progress.finish()
+        
+        yearly_outputs.extend(self._unselected_outputs(manifest, files_by_year, self._input_years(md_files)))
+        yearly_outputs.sort(key=lambda yearly_output: yearly_output.year)
+        
+        return yearly_outputs
+    
+    def _count_year(self, year: int, file_infos: List[FileInfo], output_dir: str) -> Optional[YearlyOutput]:
+        """Describe a year from header scans and event counts of its files"""
+        logger.info("Counting events in %d files for %d", len(file_infos), year)
+        
+        series_files = [file_info for file_info in map(self._count_events, file_infos) if file_info]
+        if not series_files:
+            return None
+        
+        output_filename = f"{year}_season.md"
+        
+        return YearlyOutput(
+            year=year,
+            series_files=series_files,
+            merged_content=None,
+            output_filename=output_filename,
+            output_path=os.path.join(output_dir, output_filename),
+            event_count=sum(file_info.event_count for file_info in series_files),
+            rebuilt=False
+        )
+    
+    def _count_events(self, file_info: FileInfo) -> Optional[FileInfo]:
+        """
+        Fill in a file's series name and event count without parsing its events
+        
+        Every dated line starts an event, so counting the cleaned lines with
+        a date gives the number of events _extract_events would return.
+        
+        Returns:
+            The updated file_info, or None if the file could not be read
+        """
+        try:
+            file_info.series_name, _ = self.markdown_parser.scan_header(file_info.filepath)
+            
+            body_items = (item for item in self.markdown_parser.iter_items(file_info.filepath) if item.type != 'yaml')
+            extract_dates = self.date_parser.extract_dates_from_text
+            file_info.event_count = sum(
+                1 for item in self.markdown_parser.iter_cleaned_content(body_items) if extract_dates(item.content)
+            )
+            
+            self.progress.update(1, file_info.event_count)
+            return file_info
+            
+        except Exception as e:
+            logger.error("Cannot read %s: %s", file_info.filename, e)
+            self.progress.update(1)
+            return None
+    
+    def _recorded_yearly_output(self, year: int, manifest: BuildManifest) -> Optional[YearlyOutput]:
+        """Describe an up-to-date year from the manifest, without parsing its files"""
+        records = manifest.recorded_files(year)
+        if not records:
+            return None
         
-        # Process each year
+        series_files = [
+            FileInfo(
+                filepath=record['path'],
+                filename=os.path.basename(record['path']),
+                year=year,
+                series_name=record['series_name'],
+                event_count=record['event_count']
+            )
+            for record in records
+        ]
+        
+        output = manifest.years[str(year)]['output']
+        output_filename = f"{year}_season.md"
+        
+        return YearlyOutput(
+            year=year,
+            series_files=series_files,
+            merged_content=None,
+            output_filename=output_filename,
+            output_path=os.path.join(manifest.output_dir, output_filename),
+            byte_count=output['size'],
+            event_count=sum(file_info.event_count for file_info in series_files),
+            content_hash=output['sha256'],
+            rebuilt=False
+        )
+    
+    def _process_years_parallel(self, files_by_year: Dict[int, List[FileInfo]], output_dir: str,
+                                workers: int) -> List[YearlyOutput]:
+        """
+        Parse files in a pool of worker processes and merge each year here
+        
+        Files are parsed in year and filename order with a bounded number
+        submitted ahead (see _parse_files_in_pool), so a single busy year is
+        spread over all workers while the parent never holds more than a
+        window of parse results. Results are consumed in order, so the output
+        matches a serial run. Each year's season file is rendered and written
+        on a separate thread while the next year's files are collected.
+        """
+        years = sorted(files_by_year.keys())
         yearly_outputs = []
-        for year in sorted(files_by_year.keys()):
-            print(f"\n=== Processing {year} ===")
-            year_files = files_by_year[year]
+        
+        with self._worker_pool(workers) as executor, ThreadPoolExecutor(max_workers=1) as writer:
+            file_results = self._parse_files_in_pool(
+                [file_info for year in years for file_info in files_by_year[year]], executor, workers)
             
-            yearly_output = self._process_year(year, year_files, output_dir)
-            if yearly_output:
-                yearly_outputs.append(yearly_output)
+            def finish_writing(writing: Optional[Future]):
+                if writing is not None:
+                    yearly_outputs.append(writing.result())
+                    logger.info("Written to %s", yearly_outputs[-1].output_path)
+            
+            writing: Optional[Future] = None
+            for year in years:
+                year_files = files_by_year[year]
+                parsed_files = self._collect_year(year, year_files, islice(file_results, len(year_files)))
+                
+                # Keep at most one year being written while the next is collected
+                finish_writing(writing)
+                writing = None
+                if parsed_files is not None:
+                    writing = writer.submit(self._write_year, year, parsed_files, output_dir)
+            
+            finish_writing(writing)
         
         return yearly_outputs
     
-    def _find_markdown_files(self, directory: str) -> List[str]:
-        """Find all .md files in directory"""
-        md_files = []
+    def _worker_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Start worker processes that parse with this merger's options"""
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(self.options, logging.getLogger(__package__).getEffectiveLevel()))
+    
+    def _parse_files_in_pool(self, file_infos: List[FileInfo], executor: Executor,
+                             workers: int) -> Iterator[Optional[FileInfo]]:
+        """
+        Parse files in worker processes, yielding results in file_infos order
         
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.lower().endswith('.md'):
-                    filepath = os.path.join(root, file)
-                    md_files.append(filepath)
+        At most PARSE_WINDOW_PER_WORKER files per worker are submitted ahead
+        of the one being yielded. Files of LARGE_FILE_BYTES or more are
+        parsed here when their turn comes, with their events extracted in
+        chunks over the pool.
         
-        return md_files
+        Yields:
+            Parsed file with its events, or None if the file could not be
+            parsed
+        """
+        tasks = iter(file_infos)
+        window = self.PARSE_WINDOW_PER_WORKER * workers
+        pending: Deque[Optional[Future]] = deque()
+        
+        for file_info in file_infos:
+            while len(pending) < window:
+                task = next(tasks, None)
+                if task is None:
+                    break
+                pending.append(None if self._is_large_file(task) else executor.submit(_parse_file_in_worker, task))
+            
+            future = pending.popleft()
+            if future is None:
+                # Chunks only pay for shipping lines and events between
+                # processes when they run on CPUs of their own
+                yield self._parse_file(file_info, executor, min(workers, _usable_cpus()))
+            else:
+                yield self._collect_worker_result(file_info, future)
+    
+    def _is_large_file(self, file_info: FileInfo) -> bool:
+        """Check whether a file should be extracted in chunks across workers"""
+        try:
+            return os.path.getsize(file_info.filepath) >= self.LARGE_FILE_BYTES
+        except OSError:
+            return False
+    
+    def _collect_worker_result(self, file_info: FileInfo, future: Future) -> Optional[FileInfo]:
+        """Wait for a worker's parse result, replaying its log records"""
+        result, records, (hits, misses) = future.result()
+        for record in records:
+            logging.getLogger(record.name).handle(record)
+        
+        # Fold the worker's date cache counters into ours for the summary
+        self.date_parser.cache_hits += hits
+        self.date_parser.cache_misses += misses
+        
+        if result is None:
+            self.progress.update(1)
+            return None
+        
+        file_info.series_name, file_info.events = result
+        file_info.event_count = len(file_info.events)
+        self.progress.update(1, file_info.event_count)
+        return file_info
+    
+    def _find_markdown_files(self, directory: str, output_dir: Optional[str] = None) -> List[str]:
+        """Find all .md files in directory, leaving out output_dir if it is inside"""
+        return self.discovery.find(directory, skip_dirs=[output_dir])
     
     def _group_files_by_year(self, filepaths: List[str]) -> Dict[int, List[FileInfo]]:
-        """Group files by extracted year"""
+        """
+        Group files by extracted year
+        
+        Only selected years are returned, each with all of its files, so a
+        season file is never built from part of its year. Years are chosen
+        from filenames alone; files of other years are never opened.
+        """
         files_by_year = {}
         
-        for filepath in filepaths:
-            filename = os.path.basename(filepath)
-            year = self.year_extractor.extract_year(filename)
-            
-            if year:
+        filenames = [os.path.basename(filepath) for filepath in filepaths]
+        years = self.year_extractor.extract_years(filenames)
+        selected = self._select_years(filenames, years)
+        
+        for filepath, filename, year in zip(filepaths, filenames, years):
+            if year in selected:
                 if year not in files_by_year:
                     files_by_year[year] = []
                 
@@ -115,140 +484,324 @@ class FileMerger:
         
         return files_by_year
     
-    def _process_year(self, year: int, file_infos: List[FileInfo], output_dir: str) -> Optional[YearlyOutput]:
-        """Process all files for a single year"""
-        print(f"Processing {len(file_infos)} files for {year}")
+    def _select_years(self, filenames: List[str], years: List[Optional[int]]) -> Set[int]:
+        """
+        Get the years to build: those within --years that have at least one
+        file matching the --series globs
+        """
+        return {
+            year for filename, year in zip(filenames, years)
+            if year and self._is_year_selected(year) and self._is_series_selected(filename)
+        }
+    
+    def _is_series_selected(self, filename: str) -> bool:
+        """Check a file against the --series globs"""
+        if not self.series_patterns:
+            return True
+        name = filename.lower()
+        return any(fnmatchcase(name, pattern) for pattern in self.series_patterns)
+    
+    def _is_year_selected(self, year: int) -> bool:
+        """Check a year against the --years selection"""
+        return self.selected_years is None or year in self.selected_years
+    
+    def _input_years(self, filepaths: List[str]) -> Set[int]:
+        """Get the years of all input files, selected or not"""
+        years = self.year_extractor.extract_years([os.path.basename(filepath) for filepath in filepaths])
+        return {year for year in years if year}
+    
+    def _unselected_outputs(self, manifest: BuildManifest, files_by_year: Dict[int, List[FileInfo]],
+                            input_years: Set[int]) -> List[YearlyOutput]:
+        """
+        Describe the years a filtered run left alone from the manifest
+        
+        Their season files are not touched, so the summary reports them as
+        the last build recorded them.
+        """
+        yearly_outputs = []
+        for year in sorted(input_years - set(files_by_year)):
+            if str(year) in manifest.years:
+                yearly_output = self._recorded_yearly_output(year, manifest)
+                if yearly_output:
+                    yearly_outputs.append(yearly_output)
+        return yearly_outputs
+    
+    def _process_year(self, year: int, file_infos: List[FileInfo], output_dir: str,
+                      file_results: Optional[Iterator[Optional[FileInfo]]] = None) -> Optional[YearlyOutput]:
+        """
+        Process all files for a single year
+        
+        Args:
+            year: Year being processed
+            file_infos: Files for the year, sorted by filename
+            output_dir: Directory to write the season file to
+            file_results: Parsed files in file_infos order (None for files
+                that failed), e.g. from worker processes. Files are parsed
+                here when omitted
+        """
+        parsed_files = self._collect_year(year, file_infos, file_results)
+        if parsed_files is None:
+            return None
+        
+        yearly_output = self._write_year(year, parsed_files, output_dir)
+        logger.info("Written to %s", yearly_output.output_path)
+        return yearly_output
+    
+    def _collect_year(self, year: int, file_infos: List[FileInfo],
+                      file_results: Optional[Iterator[Optional[FileInfo]]] = None) -> Optional[List[FileInfo]]:
+        """
+        Gather the parsed files of a year, each file a chronological stream
+        
+        Returns:
+            The files that parsed, in file_infos order, or None if none did
+        """
+        logger.info("Merging %d files for %d", len(file_infos), year)
+        
+        if file_results is None:
+            file_results = (self._parse_file(file_info) for file_info in file_infos)
         
-        # Parse all files and extract events
         parsed_files = []
-        all_events = []
+        total_events = 0
         
-        for file_info in file_infos:
-            try:
-                print(f"  Parsing: {file_info.filename}")
-                
-                # Parse markdown file
-                parsed_data = self.markdown_parser.parse_file(file_info.filepath)
-                file_info.parsed_data = parsed_data
-                file_info.series_name = parsed_data.series_name
-                
-                # Extract events from the file
-                events = self._extract_events_from_file(parsed_data, file_info)
-                file_info.events = events
-                all_events.extend(events)
-                
-                parsed_files.append(file_info)
-                
-                print(f"    Series: {file_info.series_name}")
-                print(f"    Events: {len(events)}")
-                
-            except Exception as e:
-                print(f"    ❌ Error parsing {file_info.filename}: {e}")
+        for file_info in file_results:
+            if file_info is None:
                 continue
+            
+            file_info.events.sort(key=lambda e: e.date_key)
+            parsed_files.append(file_info)
+            total_events += len(file_info.events)
         
         if not parsed_files:
-            print(f"  No valid files for {year}")
+            logger.warning("No valid files for %d", year)
             return None
         
-        # Sort all events chronologically
-        all_events.sort(key=lambda e: e.date if e.date else datetime.min)
-        
-        print(f"  Total events across all series: {len(all_events)}")
-        
-        # Group events by series and generate output
-        merged_content = self._generate_merged_output(year, parsed_files, all_events)
-        
-        # Write output file
+        logger.info("Total events across all series: %d", total_events)
+        return parsed_files
+    
+    def _write_year(self, year: int, parsed_files: List[FileInfo], output_dir: str) -> YearlyOutput:
+        """Merge each series' files chronologically and stream the season file"""
         output_filename = f"{year}_season.md"
         output_path = os.path.join(output_dir, output_filename)
         
         os.makedirs(output_dir, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(merged_content)
+        content_hash, merged_content = self._write_merged_output(year, parsed_files, output_path)
         
-        print(f"  ✅ Written to: {output_path}")
+        # The year is written; don't hold its events for the rest of the run
+        if not (self.keep_events or self.keep_content):
+            for file_info in parsed_files:
+                file_info.events = None
         
         return YearlyOutput(
             year=year,
             series_files=parsed_files,
             merged_content=merged_content,
-            output_filename=output_filename
+            output_filename=output_filename,
+            output_path=output_path,
+            byte_count=os.path.getsize(output_path),
+            event_count=sum(file_info.event_count for file_info in parsed_files),
+            content_hash=content_hash
         )
     
-    def _extract_events_from_file(self, parsed_data: ParsedMarkdown, file_info: FileInfo) -> List[WrestlingEvent]:
+    def _write_merged_output(self, year: int, parsed_files: List[FileInfo],
+                             output_path: str) -> Tuple[str, Optional[str]]:
+        """
+        Render a year straight into its season file
+        
+        Text is written to a temporary file next to the target, which then
+        replaces it atomically, so readers see either the old or the new
+        season file and never a partial one.
+        
+        Args:
+            year: Year being rendered
+            parsed_files: Parsed files in filename order, their events sorted by date_key
+            output_path: Path of the season file
+            
+        Returns:
+            Tuple of (SHA-256 of the text, the text if keep_content is set, else None)
+        """
+        digest = hashlib.sha256()
+        kept = [] if self.keep_content else None
+        
+        def chunks(lines: Iterator[str]) -> Iterator[str]:
+            # Lines are separated by newlines, with none after the last one
+            for index, line in enumerate(lines):
+                chunk = "\n" + line if index else line
+                digest.update(chunk.encode('utf-8'))
+                if kept is not None:
+                    kept.append(chunk)
+                yield chunk
+        
+        temp_path = f"{output_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.writelines(chunks(self._iter_merged_lines(year, parsed_files)))
+            os.replace(temp_path, output_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+        
+        return digest.hexdigest(), "".join(kept) if kept is not None else None
+    
+    def _parse_file(self, file_info: FileInfo, executor: Optional[Executor] = None,
+                    chunks: int = 1) -> Optional[FileInfo]:
+        """
+        Parse one file and extract its events
+        
+        Args:
+            file_info: File to parse; series_name and events are filled in. Its
+                parsed markdown is dropped once the events are extracted
+            executor: Process pool to extract events in chunks, or None to extract them here
+            chunks: Number of chunks to split the file into when an executor is given
+            
+        Returns:
+            The updated file_info, or None if the file could not be parsed
+        """
+        try:
+            if self.parse_cache and file_info.content_hash is None:
+                file_info.content_hash = hash_file(file_info.filepath)
+            
+            cached = self.parse_cache.load(file_info.content_hash) if self.parse_cache else None
+            if cached:
+                logger.debug("Cached: %s", file_info.filename)
+                file_info.series_name, events = cached
+                self._tag_events(events, file_info)
+            else:
+                logger.debug("Parsing: %s", file_info.filename)
+                
+                # Parse markdown file
+                if self.use_mmap:
+                    parsed_data = self.markdown_parser.parse_file_mapped(file_info.filepath)
+                else:
+                    parsed_data = self.markdown_parser.parse_file(file_info.filepath, keep_raw=False)
+                file_info.series_name = parsed_data.series_name
+                
+                # Extract events from the file
+                try:
+                    events = self._extract_events_from_file(parsed_data, file_info, executor, chunks)
+                finally:
+                    # Don't hold one open mapping per file for the whole run
+                    if isinstance(parsed_data.content_items, MappedContentItems):
+                        parsed_data.content_items.close()
+                
+                if self.parse_cache:
+                    self.parse_cache.store(file_info.content_hash, file_info.series_name, events)
+            
+            file_info.events = events
+            file_info.event_count = len(events)
+            
+            logger.debug("%s: series %r, %d events", file_info.filename, file_info.series_name, len(events))
+            
+            self.progress.update(1, len(events))
+            return file_info
+            
+        except Exception as e:
+            logger.error("Cannot parse %s: %s", file_info.filename, e)
+            self.progress.update(1)
+            return None
+    
+    def _extract_events_from_file(self, parsed_data: ParsedMarkdown, file_info: FileInfo,
+                                  executor: Optional[Executor] = None, chunks: int = 1) -> List[WrestlingEvent]:
         """Extract wrestling events from a parsed markdown file"""
         # Clean content for processing
         cleaned_content = self.markdown_parser.clean_content_for_processing(parsed_data.content_items)
         
         # Extract events using the format converter
-        events = self.format_converter._extract_events(cleaned_content)
+        if executor is not None:
+            events = self.format_converter._extract_events_parallel(cleaned_content, executor, chunks)
+        else:
+            events = self.format_converter._extract_events(cleaned_content)
+        
+        self._tag_events(events, file_info)
         
-        # Add file metadata to events
+        return events
+    
+    def _tag_events(self, events: List[WrestlingEvent], file_info: FileInfo):
+        """Add file metadata to events"""
         for event in events:
             event.series_name = file_info.series_name
             event.source_file = file_info.filename
+    
+    def merge_events(self, event_streams: Iterable[Iterable[WrestlingEvent]]) -> Iterator[WrestlingEvent]:
+        """
+        Merge chronologically sorted event streams into one
         
-        return events
+        Events on the same day keep the order of their streams, then their
+        order within a stream, exactly like a stable sort of the
+        concatenated streams - without building that list.
+        
+        Args:
+            event_streams: Streams of events, each sorted by date_key
+            
+        Returns:
+            Iterator over all events in chronological order
+        """
+        return heapq.merge(*event_streams, key=lambda e: e.date_key)
     
-    def _generate_merged_output(self, year: int, parsed_files: List[FileInfo], all_events: List[WrestlingEvent]) -> str:
-        """Generate the merged output content for a year"""
-        output_lines = []
+    def _iter_merged_lines(self, year: int, parsed_files: List[FileInfo]) -> Iterator[str]:
+        """
+        Generate the lines of the merged output for a year
         
+        Args:
+            year: Year being rendered
+            parsed_files: Parsed files in filename order, their events sorted by date_key
+        """
         # Year header
-        output_lines.append(f"# {year} Season")
-        output_lines.append("")
-        output_lines.append(f"Combined wrestling results for {year}")
-        output_lines.append("")
-        
-        # Group events by series to maintain series headers
-        events_by_series = {}
-        series_order = []  # Track order of first appearance
-        
-        for event in all_events:
-            series_name = getattr(event, 'series_name', 'Unknown Series')
-            if series_name not in events_by_series:
-                events_by_series[series_name] = []
-                series_order.append(series_name)
-            events_by_series[series_name].append(event)
+        yield f"# {year} Season"
+        yield ""
+        yield f"Combined wrestling results for {year}"
+        yield ""
+        
+        # Series appear in the order of their first event across all files;
+        # a file's first event is its earliest, ties go to the earlier file
+        files_by_series: Dict[str, List[FileInfo]] = {}
+        first_event: Dict[str, Tuple[int, int]] = {}
+        
+        for index, file_info in enumerate(parsed_files):
+            if not file_info.events:
+                continue
+            series_name = file_info.series_name
+            files_by_series.setdefault(series_name, []).append(file_info)
+            first_event[series_name] = min(first_event.get(series_name, (file_info.events[0].date_key, index)),
+                                           (file_info.events[0].date_key, index))
+        
+        series_order = sorted(files_by_series, key=first_event.get)
         
         # Generate output by series, but with chronological ordering within
         for series_name in series_order:
-            series_events = events_by_series[series_name]
+            series_events = self.merge_events(file_info.events for file_info in files_by_series[series_name])
             
             # Add series header
-            output_lines.append(f"## {series_name}")
-            output_lines.append("")
+            yield f"## {series_name}"
+            yield ""
             
             # Format events for this series
             for i, event in enumerate(series_events):
                 if i > 0:
-                    output_lines.append("——")
-                    output_lines.append("")
+                    yield "——"
+                    yield ""
                 
                 # Event header
                 if event.date:
-                    date_str = self.date_parser.format_date_dragon_gate_style(event.date)
-                    output_lines.append(date_str)
+                    date_str = self.date_parser.format_date_ordinal(event.date_key)
+                    yield date_str
                 
                 if event.city and event.venue:
-                    output_lines.append(f"{event.city}, {event.venue}")
+                    yield f"{event.city}, {event.venue}"
                 elif event.venue:
-                    output_lines.append(event.venue)
+                    yield event.venue
                 
                 if event.attendance:
-                    output_lines.append(f"Attendance: {event.attendance}")
+                    yield f"Attendance: {event.attendance}"
                 
-                output_lines.append("")
+                yield ""
                 
                 # Format matches
                 for match in event.matches:
-                    match_lines = self.format_converter._format_match(match)
-                    output_lines.extend(match_lines)
-                    output_lines.append("")
+                    yield from self.format_converter._format_match(match)
+                    yield ""
             
-            output_lines.append("")  # Extra space between series
-        
-        return "\n".join(output_lines)
+            yield ""  # Extra space between series
     
     def get_processing_summary(self, yearly_outputs: List[YearlyOutput]) -> str:
         """Generate a summary of the processing results"""
@@ -261,6 +814,16 @@ class FileMerger:
         
         summary_lines.append(f"**Total Years Processed:** {total_years}")
         summary_lines.append(f"**Total Files Processed:** {total_files}")
+        
+        cache = self.date_parser.cache_stats()
+        if cache['capacity']:
+            lookups = cache['hits'] + cache['misses']
+            hit_rate = cache['hits'] / lookups if lookups else 0.0
+            summary_lines.append(
+                f"**Date Cache:** {cache['hits']} hits, {cache['misses']} misses "
+                f"({hit_rate:.1%} hit rate, capacity {cache['capacity']})"
+            )
+        
         summary_lines.append("")
         
         # Year-by-year breakdown
@@ -273,7 +836,7 @@ class FileMerger:
             
             # List series
             for file_info in yearly_output.series_files:
-                total_events = len(file_info.events) if file_info.events else 0
+                total_events = file_info.event_count
                 summary_lines.append(f"- **{file_info.series_name}** ({file_info.filename}) - {total_events} events")
             
             summary_lines.append("")
@@ -282,4 +845,68 @@ class FileMerger:
     
     def add_year_mapping(self, filename: str, year: int):
         """Add a manual year mapping for a specific file"""
-        self.year_extractor.add_manual_mapping(filename, year)
\ No newline at end of file
+        self.year_extractor.add_manual_mapping(filename, year)
+    
+    def load_year_mappings(self, path: str) -> int:
+        """Add the manual year mappings of a YAML, JSON or CSV file, returning how many"""
+        return self.year_extractor.load_mapping_file(path)
+
+
+def _usable_cpus() -> int:
+    """Number of CPUs this process may run on"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# Merger owned by each worker process, created by _init_worker
+_worker_merger: Optional[FileMerger] = None
+
+# Log records of the file being parsed in a worker, sent back to the parent
+_worker_log: Optional[queue.SimpleQueue] = None
+
+
+def _init_worker(options: Dict[str, Any], log_level: int):
+    """
+    Create the per-process merger for a worker
+    
+    Records of the package's loggers are queued instead of written, at the
+    parent's level, and returned with each result for the parent to log.
+    """
+    global _worker_merger, _worker_log
+    _worker_merger = FileMerger(**options)
+    
+    # Chunks of large files are extracted with the same converter and date cache
+    _use_chunk_converter(_worker_merger.format_converter)
+    
+    _worker_log = queue.SimpleQueue()
+    package_logger = logging.getLogger(__package__)
+    package_logger.handlers = [logging.handlers.QueueHandler(_worker_log)]
+    package_logger.setLevel(log_level)
+    package_logger.propagate = False
+
+
+def _parse_file_in_worker(file_info: FileInfo) -> Tuple[Optional[Tuple[str, List[WrestlingEvent]]],
+                                                         List[logging.LogRecord], Tuple[int, int]]:
+    """
+    Parse one file in a worker process
+    
+    Only the series name and events are sent back; the parsed lines stay
+    in the worker.
+    
+    Returns:
+        Tuple of ((series_name, events) or None if the file could not be
+        parsed, its log records, (date cache hits, misses))
+    """
+    date_parser = _worker_merger.date_parser
+    hits, misses = date_parser.cache_hits, date_parser.cache_misses
+    
+    parsed = _worker_merger._parse_file(file_info)
+    result = (parsed.series_name, parsed.events) if parsed else None
+    
+    records = []
+    while not _worker_log.empty():
+        records.append(_worker_log.get())
+    
+    return result, records, (date_parser.cache_hits - hits, date_parser.cache_misses - misses)
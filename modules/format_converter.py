@@ -6,12 +6,33 @@ including match type detection, winner/loser marking, and proper formatting.
 """
 
 import re
+from concurrent.futures import Executor
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
 from .markdown_parser import ContentItem
 from .date_parser import DateParser, ExtractedDate
+from .keyword_matcher import KeywordMatcher
+
+# Version of the event extraction and formatting; bump it whenever a change
+# alters the events parsed from a file or the text written for them, so
+# results recorded by earlier versions are not reused
+PARSER_VERSION = 3
+
+# Line classes used by the event parser
+LINE_TEXT = 0
+LINE_BLANK = 1
+LINE_MATCH = 2
+LINE_HEADER = 3
+
+_ATTENDANCE = re.compile(r'\s*(\d+)\s+attendance', re.IGNORECASE)
+_MATCH_NUMBER = re.compile(r'^[①②③④⑤⑥⑦⑧⑨⑩]')
+_MATCH_NUMBER_PREFIX = re.compile(r'^[①②③④⑤⑥⑦⑧⑨⑩]\s*')
+_MATCH_TYPE_PREFIX = re.compile(r'(Singles|Tag Team|Championship|Battle Royal|Elimination) Match\s*', re.IGNORECASE)
+_TIME_AND_FINISH = re.compile(r'\(([^)]*)\)$')
+_TEAM_MEMBER_SEPARATOR = re.compile(r'\s*[&,]\s*|\s+and\s+')
+_PARTICIPANT_SEPARATOR = re.compile(r'\s*[&,]\s*|\s+and\s+|\s+vs\s+')
 
 
 @dataclass
@@ -23,6 +44,11 @@ class WrestlingEvent:
     attendance: Optional[int]
     matches: List['WrestlingMatch']
     original_content: List[ContentItem]
+    
+    @property
+    def date_key(self) -> int:
+        """Day ordinal of date for sorting, 0 when undated"""
+        return self.date.toordinal() if self.date else 0
 
 
 @dataclass
@@ -41,8 +67,13 @@ class WrestlingMatch:
 class FormatConverter:
     """Converts wrestling results to Dragon Gate format"""
     
-    def __init__(self):
-        self.date_parser = DateParser()
+    def __init__(self, date_parser: Optional[DateParser] = None):
+        """
+        Args:
+            date_parser: DateParser to use, so its cache can be shared; a new
+                one is created if omitted
+        """
+        self.date_parser = date_parser or DateParser()
         
         # Circled numbers for match numbering
         self.circled_numbers = ['①', '②', '③', '④', '⑤', '⑥', '⑦', '⑧', '⑨', '⑩']
@@ -79,7 +110,39 @@ class FormatConverter:
             (r'disqualification', 'Disqualification'),
             (r'count\s+out', 'Count Out'),
             (r'submission', 'Submission'),
+            (r'draw', 'Draw'),
         ]
+        
+        # Special results that give every participant the same symbol; a no
+        # contest anywhere in the finish or result wins over a draw
+        self.special_result_symbols = {
+            'No Contest': 'no_contest',
+            'Double Count Out': 'no_contest',
+            'Time Limit Draw': 'draw',
+            'Double Pinfall': 'draw',
+            'Draw': 'draw',
+        }
+        
+        self._compile_keywords()
+    
+    def _compile_keywords(self):
+        """Compile the keyword vocabularies into single-scan matchers"""
+        self.match_type_matcher = KeywordMatcher(self.match_type_patterns, re.IGNORECASE)
+        self.special_result_matcher = KeywordMatcher(self.special_results, re.IGNORECASE)
+    
+    def add_match_type_pattern(self, pattern: str, match_type, index: Optional[int] = None):
+        """
+        Add a match type to the vocabulary
+        
+        Args:
+            pattern: Regular expression found anywhere in a match line
+            match_type: Match type name, or a callable building it from the re.Match
+            index: Priority position in the vocabulary, last if omitted
+        """
+        if index is None:
+            index = len(self.match_type_patterns)
+        self.match_type_patterns.insert(index, (pattern, match_type))
+        self._compile_keywords()
     
     def convert_to_dragon_gate_format(self, content_items: List[ContentItem], series_name: str) -> str:
         """
@@ -96,7 +159,7 @@ class FormatConverter:
         events = self._extract_events(content_items)
         
         # Sort events chronologically
-        events.sort(key=lambda e: e.date if e.date else datetime.min)
+        events.sort(key=lambda e: e.date_key)
         
         # Generate formatted output
         output_lines = []
@@ -114,7 +177,7 @@ class FormatConverter:
             
             # Add event header
             if event.date:
-                date_str = self.date_parser.format_date_dragon_gate_style(event.date)
+                date_str = self.date_parser.format_date_ordinal(event.date_key)
                 output_lines.append(date_str)
             
             if event.city and event.venue:
@@ -134,36 +197,52 @@ class FormatConverter:
         
         return "\n".join(output_lines)
     
-    def _extract_events(self, content_items: List[ContentItem]) -> List[WrestlingEvent]:
-        """Extract wrestling events from content items"""
+    def _extract_events(self, content_items: List[ContentItem],
+                        item_dates: Optional[List[List[ExtractedDate]]] = None) -> List[WrestlingEvent]:
+        """
+        Extract wrestling events from content items
+        
+        Args:
+            content_items: Cleaned content items of one document
+            item_dates: Dates per item from _annotate_dates, computed here if omitted
+            
+        Returns:
+            Events in document order
+        """
+        if item_dates is None:
+            item_dates = self._annotate_dates(content_items)
+        
+        # Classify every line once; the loop below only moves forward
+        line_kinds = self._classify_lines(content_items, item_dates)
+        
         events = []
         current_event = None
         current_match_number = 0
         
         i = 0
         while i < len(content_items):
-            item = content_items[i]
+            kind = line_kinds[i]
             
-            # Check if this starts a new event (contains date)
-            dates = self.date_parser.extract_dates_from_text(item.content)
-            if dates:
-                # Finalize previous event
+            if kind == LINE_HEADER:
+                # Finalize previous event and start a new one
                 if current_event:
                     events.append(current_event)
                 
-                # Start new event
-                current_event = self._parse_event_header(item, dates[0])
+                current_event = self._parse_event_header(content_items[i], item_dates[i][0])
                 current_match_number = 0
+                i += 1
                 
-            elif current_event and self._is_match_line(item.content):
-                # Parse match
-                match, consumed_lines = self._parse_match(content_items[i:], current_match_number + 1)
+            elif kind == LINE_MATCH and current_event:
+                # Lines up to the end of a match are neither headers nor
+                # match starts, so the cursor can skip them even if no match
+                # could be parsed from them
+                match, i = self._parse_match(content_items, line_kinds, i, current_match_number + 1)
                 if match:
                     current_event.matches.append(match)
                     current_match_number += 1
-                    i += consumed_lines - 1  # Skip consumed lines
-            
-            i += 1
+                
+            else:
+                i += 1
         
         # Add final event
         if current_event:
@@ -171,6 +250,94 @@ class FormatConverter:
         
         return events
     
+    def _classify_lines(self, content_items: List[ContentItem],
+                        item_dates: List[List[ExtractedDate]]) -> List[int]:
+        """
+        Classify each content item for the event parser
+        
+        Args:
+            content_items: Cleaned content items of one document
+            item_dates: Dates per item from _annotate_dates
+            
+        Returns:
+            One of LINE_HEADER, LINE_MATCH, LINE_BLANK or LINE_TEXT per item
+        """
+        line_kinds = []
+        for item, dates in zip(content_items, item_dates):
+            content = item.content
+            if dates:
+                line_kinds.append(LINE_HEADER)
+            elif self._is_match_line(content):
+                line_kinds.append(LINE_MATCH)
+            elif not content.strip():
+                line_kinds.append(LINE_BLANK)
+            else:
+                line_kinds.append(LINE_TEXT)
+        return line_kinds
+    
+    def _extract_events_parallel(self, content_items: List[ContentItem], executor: Executor,
+                                 chunks: int) -> List[WrestlingEvent]:
+        """
+        Extract events from one large document using worker processes
+        
+        The document is cut into chunks that each start at a dated line (an
+        event header), the only place where the parser's state is fully
+        reset: the previous event is finalized, match numbering restarts and
+        no match spans the cut. Cuts are found here by date-scanning forward
+        from equal slice boundaries, which touches only a few lines since
+        most have no digit. Each chunk goes to a worker once, as its line
+        strings only, and comes back as events. Stitching them in order gives
+        exactly the serial _extract_events result. '——' separators are not
+        used as cuts since they can be part of a match block.
+        
+        Args:
+            content_items: Cleaned content items of one document
+            executor: Process pool to run the chunks in
+            chunks: Number of chunks to aim for
+            
+        Returns:
+            Events in document order
+        """
+        if chunks <= 1 or len(content_items) < 2 * chunks:
+            return self._extract_events(content_items)
+        
+        # Move each equal slice boundary forward to the next event header
+        extract_dates = self.date_parser.extract_dates_from_text
+        size = -(-len(content_items) // chunks)
+        cuts = [0]
+        for start in range(size, len(content_items), size):
+            cut = max(start, cuts[-1] + 1)
+            while cut < len(content_items) and not extract_dates(content_items[cut].content):
+                cut += 1
+            if cut < len(content_items):
+                cuts.append(cut)
+        cuts.append(len(content_items))
+        
+        events = []
+        chunk_lines = ([item.content for item in content_items[start:end]] for start, end in zip(cuts, cuts[1:]))
+        for start, (chunk_events, headers, (hits, misses)) in zip(cuts, executor.map(_extract_chunk, chunk_lines)):
+            # Workers leave out the header items; put the document's own back
+            for event, header in zip(chunk_events, headers):
+                event.original_content = [content_items[start + header]]
+            events.extend(chunk_events)
+            self.date_parser.cache_hits += hits
+            self.date_parser.cache_misses += misses
+        
+        return events
+    
+    def _annotate_dates(self, content_items: List[ContentItem]) -> List[List[ExtractedDate]]:
+        """
+        Date-scan every item of a document exactly once
+        
+        Args:
+            content_items: Content items of one document
+            
+        Returns:
+            List parallel to content_items; an empty list marks an item without a date
+        """
+        extract_dates = self.date_parser.extract_dates_from_text
+        return [extract_dates(item.content) for item in content_items]
+    
     def _parse_event_header(self, item: ContentItem, date: ExtractedDate) -> WrestlingEvent:
         """Parse an event header line"""
         event = WrestlingEvent(
@@ -185,14 +352,28 @@ class FormatConverter:
         # Extract venue and attendance from the line
         content = item.content
         
-        # Look for attendance pattern
-        attendance_match = re.search(r'(\d+)\s+attendance', content, re.IGNORECASE)
-        if attendance_match:
-            event.attendance = int(attendance_match.group(1))
-            content = re.sub(r'\s*\d+\s+attendance', '', content, flags=re.IGNORECASE)
-        
-        # Remove date from content to get venue
-        content = re.sub(date.original_text, '', content).strip()
+        # Spans to cut out of the line: the date and every attendance figure,
+        # the first of which is the event's attendance
+        date_start = date.start
+        if date_start is None:
+            date_start = content.find(date.original_text)
+        cuts = [(date_start, date_start + len(date.original_text))] if date_start >= 0 else []
+        
+        for attendance_match in _ATTENDANCE.finditer(content):
+            if event.attendance is None:
+                event.attendance = int(attendance_match.group(1))
+            cuts.append(attendance_match.span())
+        
+        # Venue is whatever remains
+        cuts.sort()
+        pieces = []
+        position = 0
+        for cut_start, cut_end in cuts:
+            if cut_start > position:
+                pieces.append(content[position:cut_start])
+            position = max(position, cut_end)
+        pieces.append(content[position:])
+        content = "".join(pieces).strip()
         
         # Parse city, venue format
         if ',' in content:
@@ -207,55 +388,52 @@ class FormatConverter:
     def _is_match_line(self, content: str) -> bool:
         """Check if a line represents the start of a match"""
         # Look for circled numbers or match type indicators
-        if re.match(r'^[①②③④⑤⑥⑦⑧⑨⑩]', content):
+        if _MATCH_NUMBER.match(content):
             return True
         
-        # Look for match type keywords
-        for pattern, _ in self.match_type_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-        
-        return False
+        return self.match_type_matcher.contains_any(content)
     
-    def _parse_match(self, content_items: List[ContentItem], match_number: int) -> Tuple[Optional[WrestlingMatch], int]:
+    def _parse_match(self, content_items: List[ContentItem], line_kinds: List[int], start: int,
+                     match_number: int) -> Tuple[Optional[WrestlingMatch], int]:
         """
         Parse a match from content items
         
+        Args:
+            content_items: Cleaned content items of one document
+            line_kinds: Line classes from _classify_lines
+            start: Index of the match line
+            match_number: Number of the match within its event
+        
         Returns:
-            Tuple of (match or None, number of lines consumed)
+            Tuple of (match or None, index of the first line after the match)
         """
-        if not content_items:
-            return None, 0
-        
-        consumed = 1
-        first_line = content_items[0].content
+        first_line = content_items[start].content
         
         # Determine match type
         match_type = self._determine_match_type(first_line)
         
-        # Collect match lines until we hit another match or event
+        # Collect match lines until we hit another match or event, or a blank
+        # line right before one
         match_lines = [first_line]
         
-        for i in range(1, len(content_items)):
-            line = content_items[i].content
-            
-            # Stop if we hit another match or event
-            if (self._is_match_line(line) or 
-                self.date_parser.extract_dates_from_text(line) or
-                line.strip() == "" and i < len(content_items) - 1 and 
-                (self._is_match_line(content_items[i + 1].content) or 
-                 self.date_parser.extract_dates_from_text(content_items[i + 1].content))):
+        end = start + 1
+        last = len(content_items) - 1
+        while end <= last:
+            kind = line_kinds[end]
+            if kind >= LINE_MATCH:
                 break
-            
-            if line.strip():
-                match_lines.append(line)
-            consumed += 1
+            if kind == LINE_BLANK:
+                if end < last and line_kinds[end + 1] >= LINE_MATCH:
+                    break
+            else:
+                match_lines.append(content_items[end].content)
+            end += 1
         
         # Parse participants and result
         participants, result_info = self._parse_match_participants_and_result(match_lines)
         
         if not participants:
-            return None, consumed
+            return None, end
         
         match = WrestlingMatch(
             match_number=match_number,
@@ -267,27 +445,21 @@ class FormatConverter:
             winner_symbols=self._determine_winner_symbols(participants, result_info)
         )
         
-        return match, consumed
+        return match, end
     
     def _determine_match_type(self, line: str) -> str:
         """Determine match type from line content"""
         # Remove circled number if present
-        clean_line = re.sub(r'^[①②③④⑤⑥⑦⑧⑨⑩]\s*', '', line)
-        
-        # Check for explicit match types
-        for pattern, match_type in self.match_type_patterns:
-            if callable(match_type):
-                match = re.search(pattern, clean_line, re.IGNORECASE)
-                if match:
-                    return match_type(match)
-            elif re.search(pattern, clean_line, re.IGNORECASE):
-                return match_type
+        clean_line = _MATCH_NUMBER_PREFIX.sub('', line)
         
-        # Default based on common results that aren't match types
-        if re.search(r'^(No Contest|Time Limit Draw|Double Count Out|Disqualification|Draw)$', clean_line, re.IGNORECASE):
-            return 'Singles Match'  # Most common default
+        # Check for explicit match types, earliest vocabulary entry first
+        found = self.match_type_matcher.first(clean_line)
+        if found:
+            match_type, match = found
+            return match_type(match) if callable(match_type) else match_type
         
-        # If it already contains "Match", keep as is
+        # If it already contains "Match", keep as is; bare results such as
+        # "No Contest" fall through to the default
         if 'Match' in clean_line:
             return clean_line
         
@@ -302,11 +474,11 @@ class FormatConverter:
         content = " ".join(match_lines)
         
         # Remove match type and number
-        content = re.sub(r'^[①②③④⑤⑥⑦⑧⑨⑩]\s*', '', content)
-        content = re.sub(r'(Singles|Tag Team|Championship|Battle Royal|Elimination) Match\s*', '', content, flags=re.IGNORECASE)
+        content = _MATCH_NUMBER_PREFIX.sub('', content)
+        content = _MATCH_TYPE_PREFIX.sub('', content)
         
         # Extract time and finish (in parentheses at end)
-        time_match = re.search(r'\(([^)]*)\)$', content)
+        time_match = _TIME_AND_FINISH.search(content)
         if time_match:
             time_info = time_match.group(1)
             content = content[:time_match.start()].strip()
@@ -325,11 +497,11 @@ class FormatConverter:
             teams = content.split(' vs ')
             for team in teams:
                 # Split team members (assume separated by &, and, or commas)
-                members = re.split(r'\s*[&,]\s*|\s+and\s+', team.strip())
+                members = _TEAM_MEMBER_SEPARATOR.split(team.strip())
                 participants.extend([m.strip() for m in members if m.strip()])
         else:
             # Single line of participants
-            participants = re.split(r'\s*[&,]\s*|\s+and\s+|\s+vs\s+', content)
+            participants = _PARTICIPANT_SEPARATOR.split(content)
             participants = [p.strip() for p in participants if p.strip()]
         
         return participants, result_info
@@ -339,14 +511,19 @@ class FormatConverter:
         symbols = {}
         
         # Check for special results
-        finish = result_info.get('finish', '').lower()
-        result = result_info.get('result', '').lower()
+        finish = result_info.get('finish', '')
+        result = result_info.get('result', '')
+        
+        # Keywords never span lines, so both fields can be scanned at once
+        found = self.special_result_matcher.find_all(f"{finish}\n{result}")
+        categories = {self.special_result_symbols.get(name) for name, _ in found}
+        special = 'no_contest' if 'no_contest' in categories else 'draw' if 'draw' in categories else None
         
-        if any(special in finish or special in result for special in ['no contest', 'double count out']):
+        if special == 'no_contest':
             # No contest or double count out - all get ▲
             for participant in participants:
                 symbols[participant] = self.symbols['no_contest']
-        elif any(special in finish or special in result for special in ['time limit draw', 'double pinfall', 'draw']):
+        elif special == 'draw':
             # Draw - all get △
             for participant in participants:
                 symbols[participant] = self.symbols['draw']
@@ -400,4 +577,47 @@ class FormatConverter:
         if result_parts:
             lines.append(f"({' '.join(result_parts)})")
         
-        return lines
\ No newline at end of file
+        return lines
+
+
+# Converter used by worker processes for chunked extraction, set by the
+# worker initializer or created on first use
+_chunk_converter: Optional[FormatConverter] = None
+
+
+def _use_chunk_converter(converter: FormatConverter):
+    """Extract chunks in this process with converter, e.g. to share its date cache"""
+    global _chunk_converter
+    _chunk_converter = converter
+
+
+def _get_chunk_converter() -> FormatConverter:
+    global _chunk_converter
+    if _chunk_converter is None:
+        _chunk_converter = FormatConverter()
+    return _chunk_converter
+
+
+def _extract_chunk(lines: List[str]) -> Tuple[List[WrestlingEvent], List[int], Tuple[int, int]]:
+    """
+    Extract events from one chunk of a document in a worker process
+    
+    Args:
+        lines: Content of the chunk's cleaned items, starting at an event header
+    
+    Returns:
+        Tuple of (events without their original content, index of each
+        event's header line, (date cache hits, misses) of this chunk)
+    """
+    converter = _get_chunk_converter()
+    date_parser = converter.date_parser
+    hits, misses = date_parser.cache_hits, date_parser.cache_misses
+    
+    events = converter._extract_events([ContentItem('content', line, line_number=index)
+                                        for index, line in enumerate(lines)])
+    
+    headers = []
+    for event in events:
+        headers.append(event.original_content[0].line_number)
+        event.original_content = []
+    return events, headers, (date_parser.cache_hits - hits, date_parser.cache_misses - misses)
@@ -0,0 +1,204 @@
+"""
+Keyword Matcher Module for Wrestling Results
+
+This module finds which of an ordered vocabulary of keyword patterns occur in
+a line. Every pattern is indexed by a literal it cannot match without, and
+the literals are compiled into one trie-shaped regular expression, so a line
+is scanned once and only the patterns whose literal it contains are tried.
+The cost per line stays flat as the vocabulary grows.
+"""
+
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+# Characters that end a run of literal characters in a pattern
+_REGEX_SYNTAX = set('\\.^$|?*+()[]{}')
+
+# Quantifiers that make the character before them optional
+_OPTIONAL_QUANTIFIERS = set('?*')
+
+# Inline flags change how the rest of a pattern matches
+_INLINE_FLAGS = re.compile(r'\(\?[-aiLmsux]')
+
+# Non-ASCII characters that an ASCII letter matches when ignoring case
+_ASCII_FOLDS = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+
+
+class KeywordMatcher:
+    """Finds the keyword patterns occurring in a text in one scan"""
+    
+    def __init__(self, keywords: List[Tuple[str, Any]], flags: int = 0):
+        """
+        Args:
+            keywords: (pattern, value) pairs, highest priority first
+            flags: Regular expression flags for all patterns
+        """
+        self.keywords = list(keywords)
+        self.flags = flags
+        self._patterns = [re.compile(pattern, flags) for pattern, _ in self.keywords]
+        self._ignore_case = bool(flags & re.IGNORECASE)
+        
+        # Each pattern is indexed by the required literal that the fewest
+        # other patterns share; patterns without one are always tried
+        runs = [self._required_literals(pattern) for pattern, _ in self.keywords]
+        shared = Counter(literal for pattern_runs in runs for literal in set(pattern_runs))
+        
+        self._always: List[int] = []
+        self._by_literal: Dict[str, List[int]] = {}
+        for index, pattern_runs in enumerate(runs):
+            if not pattern_runs:
+                self._always.append(index)
+                continue
+            literal = min(pattern_runs, key=lambda run: (shared[run], -len(run)))
+            self._by_literal.setdefault(literal, []).append(index)
+        
+        # At a position the scanner matches the longest literal, so every
+        # shorter literal it starts with is found there as well
+        self._prefixes: Dict[str, List[str]] = {
+            literal: [literal[:end] for end in range(1, len(literal)) if literal[:end] in self._by_literal]
+            for literal in self._by_literal
+        }
+        
+        self._scanner = None
+        if self._by_literal:
+            self._scanner = re.compile(self._trie_pattern(sorted(self._by_literal)),
+                                       re.IGNORECASE if self._ignore_case else 0)
+    
+    def contains_any(self, text: str) -> bool:
+        """Check whether any keyword occurs in text"""
+        return self.first(text) is not None
+    
+    def first(self, text: str) -> Optional[Tuple[Any, re.Match]]:
+        """
+        Find the highest-priority keyword occurring anywhere in text
+        
+        This gives the same answer as trying each pattern in order with
+        re.search, so earlier keywords win over longer later ones.
+        
+        Args:
+            text: Text to scan
+        
+        Returns:
+            Tuple of (value of the keyword, leftmost match of its pattern),
+            or None if no keyword occurs
+        """
+        for index in self._candidates(text):
+            match = self._patterns[index].search(text)
+            if match:
+                return self.keywords[index][1], match
+        return None
+    
+    def find_all(self, text: str) -> List[Tuple[Any, re.Match]]:
+        """
+        Find every keyword occurring in text
+        
+        Args:
+            text: Text to scan
+        
+        Returns:
+            (value, leftmost match) of each keyword found, highest priority first
+        """
+        found = []
+        for index in self._candidates(text):
+            match = self._patterns[index].search(text)
+            if match:
+                found.append((self.keywords[index][1], match))
+        return found
+    
+    def _candidates(self, text: str) -> List[int]:
+        """Get the indices of the patterns whose literal occurs in text, in priority order"""
+        if self._scanner is None:
+            return self._always
+        
+        literals: Set[str] = set()
+        search = self._scanner.search
+        found = search(text)
+        while found:
+            literal = found.group()
+            if self._ignore_case:
+                literal = literal.translate(_ASCII_FOLDS).lower()
+            literals.add(literal)
+            literals.update(self._prefixes[literal])
+            found = search(text, found.start() + 1)
+        
+        if not literals:
+            return self._always
+        
+        candidates = list(self._always)
+        for literal in literals:
+            candidates.extend(self._by_literal[literal])
+        candidates.sort()
+        return candidates
+    
+    def _required_literals(self, pattern: str) -> List[str]:
+        """
+        Get runs of plain characters that every match of a pattern contains
+        
+        Only top-level runs are used: text inside groups, classes and
+        escapes is skipped, and a character followed by an optional
+        quantifier is left out. Patterns with a top-level alternation,
+        inline flags or verbose syntax have no required literals.
+        """
+        if self.flags & re.VERBOSE or _INLINE_FLAGS.search(pattern):
+            return []
+        
+        runs = []
+        run = ""
+        depth = 0
+        index = 0
+        while index < len(pattern):
+            char = pattern[index]
+            if char == '\\':
+                runs.append(run)
+                run = ""
+                index += 2
+                continue
+            if char in '[{':
+                if char == '{':
+                    run = run[:-1]
+                runs.append(run)
+                run = ""
+                close = pattern.find(']' if char == '[' else '}', index + 2)
+                index = close + 1 if close >= 0 else len(pattern)
+                continue
+            if char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+            elif char == '|' and depth == 0:
+                return []
+            
+            if depth == 0 and char not in _REGEX_SYNTAX:
+                run += char
+            else:
+                if char in _OPTIONAL_QUANTIFIERS:
+                    run = run[:-1]
+                runs.append(run)
+                run = ""
+            index += 1
+        runs.append(run)
+        
+        if self._ignore_case:
+            runs = [run.lower() for run in runs if run.isascii()]
+        return [run for run in runs if run]
+    
+    def _trie_pattern(self, literals: List[str]) -> str:
+        """Compile literals into a regex that walks them as a trie, longest first"""
+        children: Dict[str, List[str]] = {}
+        terminal = False
+        for literal in literals:
+            if literal:
+                children.setdefault(literal[0], []).append(literal[1:])
+            else:
+                terminal = True
+        
+        branches = [re.escape(char) + self._trie_pattern(rests) for char, rests in sorted(children.items())]
+        if not branches:
+            return ""
+        
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if terminal:
+            body = "(?:" + body + ")?"
+        return body
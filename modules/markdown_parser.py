@@ -5,11 +5,27 @@ This module handles parsing of markdown files containing wrestling match results
 extracting structured content including headers, YAML frontmatter, and content blocks.
 """
 
+import itertools
+import mmap
+import os
 import re
 import yaml
-from typing import Dict, List, Optional, Any
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass
 
+# Use the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Whitespace removed by str.strip() within the ASCII range
+_ASCII_WHITESPACE = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
+
+# Inline markup delimiters: group 1 bold, group 2 italic, group 3 code
+_MARKUP_TOKEN = re.compile(r'(\*\*)|(\*)|(`)')
+
+# Matches a carriage return used as a line break on its own (old Mac files)
+_LONE_CR = re.compile(rb'\r(?!\n)')
+
 
 @dataclass
 class ContentItem:
@@ -29,9 +45,83 @@ class ParsedMarkdown:
     raw_content: str
 
 
+class MappedContentItems(Sequence):
+    """
+    Read-only sequence of content items backed by a memory-mapped file
+    
+    Each item is stored as a byte offset, byte length, type, header level
+    and line number in compact arrays. The text is only decoded when an
+    item is accessed, so holding on to a parsed file costs a few bytes per
+    line instead of one string and one ContentItem per line.
+    
+    The mapping can be released with close(); it is reopened on the next
+    access. Offsets refer to the file as it was when it was parsed.
+    """
+    
+    _TYPES = ('content', 'header')
+    
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.offsets = array('q')
+        self.lengths = array('I')
+        self.types = array('b')
+        self.levels = array('I')  # 0 means no level
+        self.line_numbers = array('I')
+        self._buffer: Optional[mmap.mmap] = None
+    
+    def append(self, offset: int, length: int, item_type: int, level: int, line_number: int):
+        """Record one item span"""
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.types.append(item_type)
+        self.levels.append(level)
+        self.line_numbers.append(line_number)
+    
+    def __len__(self) -> int:
+        return len(self.offsets)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        
+        if index < 0:
+            index += len(self)
+        
+        offset = self.offsets[index]
+        return ContentItem(
+            type=self._TYPES[self.types[index]],
+            content=self.buffer[offset:offset + self.lengths[index]].decode('utf-8'),
+            level=self.levels[index] or None,
+            line_number=self.line_numbers[index]
+        )
+    
+    @property
+    def buffer(self) -> mmap.mmap:
+        """The file mapping, reopened if it was closed"""
+        if self._buffer is None:
+            with open(self.file_path, 'rb') as f:
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._buffer
+    
+    def close(self):
+        """Release the file mapping"""
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_buffer'] = None
+        return state
+
+
 class MarkdownParser:
     """Parser for wrestling results markdown files"""
     
+    # Frontmatter longer than this is treated as regular content, so an
+    # unterminated '---' block never buffers the whole file
+    MAX_FRONTMATTER_LINES = 1000
+    
     def __init__(self):
         self.date_patterns = [
             # Various date formats found in wrestling files
@@ -43,16 +133,22 @@ class MarkdownParser:
             r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})',  # Mon DD, YYYY
         ]
     
-    def parse_file(self, file_path: str) -> ParsedMarkdown:
+    def parse_file(self, file_path: str, keep_raw: bool = True) -> ParsedMarkdown:
         """
         Parse a markdown file and return structured content
         
         Args:
             file_path: Path to the markdown file
+            keep_raw: Keep the full file text in raw_content. When False the
+                file is streamed line by line and raw_content is left empty
             
         Returns:
             ParsedMarkdown object containing structured content
         """
+        if not keep_raw:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return self._parse_lines(line.rstrip('\n') for line in f)
+        
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
@@ -68,20 +164,241 @@ class MarkdownParser:
         Returns:
             ParsedMarkdown object containing structured content
         """
-        lines = content.split('\n')
+        return self._parse_lines(iter(content.split('\n')), raw_content=content)
+    
+    def iter_items(self, file_path: str) -> Iterator[ContentItem]:
+        """
+        Stream content items from a markdown file without loading it whole
+        
+        The file is read line by line, so memory use depends on the longest
+        line rather than the file size. YAML frontmatter, when present, is
+        yielded first as a single 'yaml' item holding the frontmatter text.
+        
+        Args:
+            file_path: Path to the markdown file
+            
+        Yields:
+            ContentItem objects in file order
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            lines = (line.rstrip('\n') for line in f)
+            _, yaml_text, replay, start = self._split_frontmatter(lines)
+            
+            if yaml_text is not None:
+                yield ContentItem(type='yaml', content=yaml_text, line_number=1)
+            
+            yield from self._iter_body_items(itertools.chain(replay, lines), start)
+    
+    def scan_header(self, file_path: str) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """
+        Read only the series title and frontmatter of a markdown file
+        
+        Reading stops after the frontmatter when it provides a title, or at
+        the first level 1-2 header otherwise, so the body is never parsed.
+        The series name matches what parse_file would report.
+        
+        Args:
+            file_path: Path to the markdown file
+            
+        Returns:
+            Tuple of (series_name, yaml_frontmatter)
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            lines = (line.rstrip('\n') for line in f)
+            series_name = ""
+            yaml_frontmatter = None
+            
+            yaml_content, _, replay, _ = self._split_frontmatter(lines)
+            if yaml_content:
+                yaml_frontmatter = yaml_content
+                if 'title' in yaml_content:
+                    series_name = yaml_content['title']
+            
+            if series_name:
+                return series_name, yaml_frontmatter
+            
+            # Fall back to the first non-empty level 1-2 header
+            for line in itertools.chain(replay, lines):
+                line = line.strip()
+                if not line.startswith('#'):
+                    continue
+                
+                header_content = line.lstrip('#')
+                if len(line) - len(header_content) <= 2 and header_content.strip():
+                    return header_content.strip(), yaml_frontmatter
+        
+        return series_name, yaml_frontmatter
+    
+    def parse_file_mapped(self, file_path: str) -> ParsedMarkdown:
+        """
+        Parse a markdown file into offset-based, lazily decoded content items
+        
+        The file is memory-mapped and content_items is a MappedContentItems
+        sequence instead of a list. raw_content is left empty.
+        
+        Args:
+            file_path: Path to the markdown file
+            
+        Returns:
+            ParsedMarkdown object whose content_items decode on access
+        """
+        if os.path.getsize(file_path) == 0:
+            return self.parse_file(file_path, keep_raw=False)
+        
+        items = MappedContentItems(file_path)
+        buffer = items.buffer
+        
+        # Lone carriage returns are line breaks in text mode; keep those
+        # files on the regular path so both modes see the same lines
+        if buffer.find(b'\r') != -1 and _LONE_CR.search(buffer):
+            items.close()
+            return self.parse_file(file_path, keep_raw=False)
+        
+        try:
+            # Check for YAML frontmatter
+            series_name = ""
+            yaml_frontmatter = None
+            yaml_content, _, _, start = self._split_frontmatter(
+                raw.rstrip(b'\r').decode('utf-8') for _, raw in self._iter_mapped_lines(buffer)
+            )
+            if yaml_content:
+                yaml_frontmatter = yaml_content
+                if 'title' in yaml_content:
+                    series_name = yaml_content['title']
+            
+            # Process remaining content
+            lines = self._iter_mapped_lines(buffer)
+            for line_number, (offset, raw) in enumerate(itertools.islice(lines, start - 1, None), start):
+                span = self._content_span(raw)
+                if span is None:
+                    continue
+                
+                begin, end, level = span
+                items.append(offset + begin, end - begin, 1 if level else 0, level, line_number)
+                
+                # If no series name from YAML, use first header
+                if level and not series_name and level <= 2:
+                    series_name = buffer[offset + begin:offset + end].decode('utf-8')
+        except BaseException:
+            # Release the mapping of a file that cannot be parsed
+            items.close()
+            raise
+        
+        return ParsedMarkdown(
+            series_name=series_name,
+            yaml_frontmatter=yaml_frontmatter,
+            content_items=items,
+            raw_content=""
+        )
+    
+    def _iter_mapped_lines(self, buffer: mmap.mmap) -> Iterator[Tuple[int, bytes]]:
+        """Yield (byte_offset, line_bytes) for each line of a mapped file"""
+        position = 0
+        size = len(buffer)
+        
+        while position <= size:
+            end = buffer.find(b'\n', position)
+            if end == -1:
+                end = size
+            yield position, buffer[position:end]
+            position = end + 1
+    
+    def _content_span(self, raw: bytes) -> Optional[Tuple[int, int, int]]:
+        """
+        Locate the item text within a raw line
+        
+        Mirrors the stripping done by _iter_body_items, but in bytes.
+        
+        Args:
+            raw: Line bytes without the newline
+            
+        Returns:
+            Tuple of (start_byte, end_byte, header_level) or None for blank lines
+        """
+        if not raw.isascii():
+            return self._content_span_text(raw.decode('utf-8'))
+        
+        stripped = raw.lstrip(_ASCII_WHITESPACE)
+        if not stripped:
+            return None
+        
+        begin = len(raw) - len(stripped)
+        end = len(raw.rstrip(_ASCII_WHITESPACE))
+        level = 0
+        
+        if stripped.startswith(b'#'):
+            header = raw[begin:end].lstrip(b'#')
+            level = (end - begin) - len(header)
+            begin = end - len(header.lstrip(_ASCII_WHITESPACE))
+        
+        return begin, end, level
+    
+    def _content_span_text(self, line: str) -> Optional[Tuple[int, int, int]]:
+        """Non-ASCII variant of _content_span working on the decoded line"""
+        stripped = line.strip()
+        if not stripped:
+            return None
+        
+        begin = len(line) - len(line.lstrip())
+        end = begin + len(stripped)
+        level = 0
+        
+        if stripped.startswith('#'):
+            header = stripped.lstrip('#')
+            level = len(stripped) - len(header)
+            begin = end - len(header.lstrip())
+        
+        return len(line[:begin].encode('utf-8')), len(line[:end].encode('utf-8')), level
+    
+    def _parse_lines(self, lines: Iterator[str], raw_content: str = "") -> ParsedMarkdown:
+        """
+        Build a ParsedMarkdown from an iterator of lines (without newlines)
+        
+        Args:
+            lines: Iterator over the file lines
+            raw_content: Raw text to keep on the result, if any
+            
+        Returns:
+            ParsedMarkdown object containing structured content
+        """
         content_items = []
         yaml_frontmatter = None
         series_name = ""
         
         # Check for YAML frontmatter
-        yaml_content, content_start = self._extract_yaml_frontmatter(lines)
+        yaml_content, _, replay, start = self._split_frontmatter(lines)
         if yaml_content:
             yaml_frontmatter = yaml_content
             if 'title' in yaml_content:
                 series_name = yaml_content['title']
         
         # Process remaining content
-        for i, line in enumerate(lines[content_start:], content_start):
+        for item in self._iter_body_items(itertools.chain(replay, lines), start):
+            content_items.append(item)
+            
+            # If no series name from YAML, use first header
+            if item.type == 'header' and not series_name and item.level <= 2:
+                series_name = item.content
+        
+        return ParsedMarkdown(
+            series_name=series_name,
+            yaml_frontmatter=yaml_frontmatter,
+            content_items=content_items,
+            raw_content=raw_content
+        )
+    
+    def _iter_body_items(self, lines: Iterable[str], first_line_number: int) -> Iterator[ContentItem]:
+        """
+        Turn body lines into header and content items
+        
+        Args:
+            lines: Body lines (without newlines)
+            first_line_number: 1-based line number of the first body line
+            
+        Yields:
+            ContentItem objects, skipping blank lines
+        """
+        for line_number, line in enumerate(lines, first_line_number):
             line = line.strip()
             
             if not line:
@@ -89,64 +406,57 @@ class MarkdownParser:
                 
             # Check if it's a header
             if line.startswith('#'):
-                level = len(line) - len(line.lstrip('#'))
-                header_content = line.lstrip('#').strip()
-                content_items.append(ContentItem(
+                header_content = line.lstrip('#')
+                yield ContentItem(
                     type='header',
-                    content=header_content,
-                    level=level,
-                    line_number=i + 1
-                ))
-                
-                # If no series name from YAML, use first header
-                if not series_name and level <= 2:
-                    series_name = header_content
-                    
+                    content=header_content.strip(),
+                    level=len(line) - len(header_content),
+                    line_number=line_number
+                )
             else:
                 # Regular content
-                content_items.append(ContentItem(
+                yield ContentItem(
                     type='content',
                     content=line,
-                    line_number=i + 1
-                ))
-        
-        return ParsedMarkdown(
-            series_name=series_name,
-            yaml_frontmatter=yaml_frontmatter,
-            content_items=content_items,
-            raw_content=content
-        )
+                    line_number=line_number
+                )
     
-    def _extract_yaml_frontmatter(self, lines: List[str]) -> tuple[Optional[Dict[str, Any]], int]:
+    def _split_frontmatter(self, lines: Iterator[str]) -> Tuple[Optional[Any], Optional[str], List[str], int]:
         """
-        Extract YAML frontmatter from the beginning of the file
+        Consume YAML frontmatter from the beginning of a line iterator
+        
+        Only the frontmatter block is buffered, and at most
+        MAX_FRONTMATTER_LINES of it. If the block is unterminated within that
+        limit or not valid YAML, the lines read so far are handed back so
+        they can be processed as regular content.
         
         Args:
-            lines: List of file lines
+            lines: Iterator over the file lines
             
         Returns:
-            Tuple of (yaml_dict, content_start_line)
+            Tuple of (yaml_content, yaml_text, replay_lines, first_body_line_number)
         """
-        if not lines or not lines[0].strip() == '---':
-            return None, 0
+        first_line = next(lines, None)
+        if first_line is None:
+            return None, None, [], 1
+        if not first_line.strip() == '---':
+            return None, None, [first_line], 1
         
         yaml_lines = []
-        yaml_end = None
         
-        for i, line in enumerate(lines[1:], 1):
+        for line in lines:
             if line.strip() == '---':
-                yaml_end = i + 1
-                break
+                yaml_text = '\n'.join(yaml_lines)
+                try:
+                    yaml_content = yaml.load(yaml_text, Loader=_YAML_LOADER)
+                    return yaml_content, yaml_text, [], len(yaml_lines) + 3
+                except yaml.YAMLError:
+                    return None, None, [first_line] + yaml_lines + [line], 1
             yaml_lines.append(line)
+            if len(yaml_lines) >= self.MAX_FRONTMATTER_LINES:
+                break
         
-        if yaml_end is None:
-            return None, 0
-        
-        try:
-            yaml_content = yaml.safe_load('\n'.join(yaml_lines))
-            return yaml_content, yaml_end
-        except yaml.YAMLError:
-            return None, 0
+        return None, None, [first_line] + yaml_lines, 1
     
     def extract_dates_from_content(self, content_items: List[ContentItem]) -> List[ContentItem]:
         """
@@ -183,24 +493,90 @@ class MarkdownParser:
         Returns:
             Cleaned content items
         """
-        cleaned = []
+        return list(self.iter_cleaned_content(content_items))
+    
+    def iter_cleaned_content(self, content_items: Iterable[ContentItem]) -> Iterator[ContentItem]:
+        """
+        Clean and filter content items one at a time
         
+        Args:
+            content_items: Raw content items, e.g. from iter_items
+            
+        Yields:
+            Cleaned content items, as in clean_content_for_processing
+        """
         for item in content_items:
+            content = item.content
+            stripped = content.strip()
+            
             # Skip empty content
-            if not item.content.strip():
+            if not stripped:
+                continue
+            
+            # Clean up common markdown artifacts; most lines have none
+            if '*' in content or '`' in content:
+                stripped = self._strip_inline_markup(content).strip()
+            
+            if stripped == content:
+                yield item
                 continue
-                
-            # Clean up common markdown artifacts
-            content = item.content
-            content = re.sub(r'\*\*(.*?)\*\*', r'\1', content)  # Remove bold
-            content = re.sub(r'\*(.*?)\*', r'\1', content)      # Remove italic
-            content = re.sub(r'`(.*?)`', r'\1', content)        # Remove code
             
-            cleaned.append(ContentItem(
+            yield ContentItem(
                 type=item.type,
-                content=content.strip(),
+                content=stripped,
                 level=item.level,
                 line_number=item.line_number
-            ))
+            )
+    
+    def _strip_inline_markup(self, text: str) -> str:
+        """
+        Remove bold, italic and code markers in one left-to-right scan
+        
+        Delimiters pair up exactly as the former bold, italic and code
+        substitutions paired them: '**' tokens pair first, the remaining
+        asterisks pair as italics and backticks pair as code spans. Only the
+        delimiters are dropped, so the cost is linear in the line length.
+        
+        Args:
+            text: Line to clean
+            
+        Returns:
+            Text with paired delimiters removed
+        """
+        if '\n' in text:
+            return '\n'.join(self._strip_inline_markup(line) for line in text.split('\n'))
+        
+        tokens = [(m.start(), m.lastindex) for m in _MARKUP_TOKEN.finditer(text)]
+        counts = [0, 0, 0, 0]
+        for _, kind in tokens:
+            counts[kind] += 1
+        
+        # An unpaired '**' is left for the italic pass as two asterisks
+        bold_pairs = counts[1] - counts[1] % 2
+        stars = counts[2] + 2 * (counts[1] % 2)
+        star_pairs = stars - stars % 2
+        tick_pairs = counts[3] - counts[3] % 2
+        
+        pieces = []
+        last = 0
+        seen_bold = seen_stars = seen_ticks = 0
+        
+        for start, kind in tokens:
+            if kind == 1 and seen_bold < bold_pairs:
+                seen_bold += 1
+                pieces.append(text[last:start])
+                last = start + 2
+            elif kind == 3:
+                if seen_ticks < tick_pairs:
+                    pieces.append(text[last:start])
+                    last = start + 1
+                seen_ticks += 1
+            else:
+                for position in range(start, start + (2 if kind == 1 else 1)):
+                    if seen_stars < star_pairs:
+                        pieces.append(text[last:position])
+                        last = position + 1
+                    seen_stars += 1
         
-        return cleaned
\ No newline at end of file
+        pieces.append(text[last:])
+        return ''.join(pieces)
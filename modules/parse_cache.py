@@ -0,0 +1,165 @@
+"""
+Parse Cache Module for Wrestling Results
+
+This module keeps the events extracted from each input file on disk, keyed by
+the file's content hash and the parser version, so unchanged files do not
+have to be parsed again when their year is rebuilt.
+"""
+
+import logging
+import os
+import pickle
+import tempfile
+import time
+from typing import List, Optional, Tuple
+
+from .format_converter import WrestlingEvent
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Temporary files younger than this may still be written by another process
+STALE_TEMP_SECONDS = 60 * 60
+
+
+def default_cache_dir() -> str:
+    """Get the per-user cache directory for parsed files"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'wrestling_results', 'parse')
+
+
+class ParseCache:
+    """Content-addressed on-disk cache of the events extracted from files"""
+    
+    def __init__(self, cache_dir: str, parser_version: int, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Directory holding the cache entries
+            parser_version: Version of the event extraction; entries of other
+                versions are never read and age out of the cache
+            max_bytes: Size the cache is pruned to, least recently used first
+        """
+        self.cache_dir = cache_dir
+        self.parser_version = parser_version
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+    
+    def _entry_path(self, content_hash: str) -> str:
+        return os.path.join(self.cache_dir, content_hash[:2], f"{content_hash}-v{self.parser_version}.pickle")
+    
+    def load(self, content_hash: str) -> Optional[Tuple[str, List[WrestlingEvent]]]:
+        """
+        Get the cached parse result of a file
+        
+        Args:
+            content_hash: SHA-256 hex digest of the file's content
+        
+        Returns:
+            Tuple of (series_name, events), or None if not cached
+        """
+        path = self._entry_path(content_hash)
+        try:
+            with open(path, 'rb') as f:
+                series_name, events = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # Unreadable entry, e.g. written by incompatible code
+            self.misses += 1
+            self._remove(path)
+            return None
+        
+        # Mark as recently used for pruning
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        
+        self.hits += 1
+        return series_name, events
+    
+    def store(self, content_hash: str, series_name: str, events: List[WrestlingEvent]):
+        """
+        Cache the parse result of a file
+        
+        The entry is written to a temporary file and renamed into place, so
+        concurrent workers and interrupted runs never leave partial entries.
+        
+        Args:
+            content_hash: SHA-256 hex digest of the file's content
+            series_name: Series name read from the file
+            events: Events extracted from the file
+        """
+        path = self._entry_path(content_hash)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((series_name, events), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning("Could not write parse cache entry %s: %s", path, e)
+    
+    def _entry_paths(self) -> List[str]:
+        """List the entry files of every parser version in the cache"""
+        return self._paths_ending_with('.pickle')
+    
+    def _stale_temp_paths(self) -> List[str]:
+        """List temporary files left behind by interrupted stores"""
+        stale = []
+        cutoff = time.time() - STALE_TEMP_SECONDS
+        for path in self._paths_ending_with('.tmp'):
+            try:
+                if os.stat(path).st_mtime < cutoff:
+                    stale.append(path)
+            except OSError:
+                continue
+        return stale
+    
+    def _paths_ending_with(self, suffix: str) -> List[str]:
+        paths = []
+        for root, dirs, files in os.walk(self.cache_dir):
+            paths.extend(os.path.join(root, file) for file in files if file.endswith(suffix))
+        return paths
+    
+    def prune(self):
+        """
+        Remove least recently used entries until the cache fits max_bytes
+        
+        Temporary files are only removed once they are STALE_TEMP_SECONDS
+        old, so stores in progress in other processes are left alone.
+        """
+        for path in self._stale_temp_paths():
+            self._remove(path)
+        
+        entries = []
+        total = 0
+        for path in self._entry_paths():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+        
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+    
+    def clear(self):
+        """Remove every entry, and stale temporary files, from the cache"""
+        for path in self._entry_paths() + self._stale_temp_paths():
+            self._remove(path)
+    
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,113 @@
+"""
+Progress Module for Wrestling Results
+
+This module draws a single, rate-limited status line with files/sec,
+events/sec and the estimated time left, so large runs show how they are
+doing without writing a line per file.
+"""
+
+import logging
+import sys
+import time
+from typing import Optional, TextIO
+
+
+class ProgressReporter:
+    """Single-line progress display, redrawn at most once per interval"""
+    
+    def __init__(self, stream: Optional[TextIO] = None, interval: float = 0.5, enabled: Optional[bool] = None):
+        """
+        Args:
+            stream: Where the line is drawn; stderr by default
+            interval: Minimum number of seconds between redraws
+            enabled: Draw the line; by default only when stream is a terminal.
+                Files and events are counted either way
+        """
+        self.stream = stream or sys.stderr
+        self.interval = interval
+        if enabled is None:
+            isatty = getattr(self.stream, 'isatty', None)
+            enabled = bool(isatty and isatty())
+        self.enabled = enabled
+        
+        self.total_files = 0
+        self.files = 0
+        self.events = 0
+        
+        # Set by start(); updates outside a start()/finish() pair are ignored
+        self._started: Optional[float] = None
+        self._next_draw = 0.0
+        self._width = 0
+    
+    def start(self, total_files: int):
+        """Begin counting towards total_files"""
+        self.total_files = total_files
+        self.files = 0
+        self.events = 0
+        self._started = time.monotonic()
+        self._next_draw = self._started + self.interval
+    
+    def update(self, files: int = 1, events: int = 0):
+        """
+        Count finished files and their events
+        
+        Cheap enough to call once per file: the line is only formatted when
+        it is due for a redraw.
+        """
+        if self._started is None:
+            return
+        
+        self.files += files
+        self.events += events
+        
+        if self.enabled:
+            now = time.monotonic()
+            if now >= self._next_draw:
+                self._draw(now)
+    
+    def finish(self):
+        """Stop counting and remove the line"""
+        self._clear()
+        self._started = None
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Clear the line before a log record is written
+        
+        Add the reporter as a filter to the handlers that share its terminal,
+        so log lines never run into the progress line; it is redrawn on the
+        next update.
+        """
+        self._clear()
+        self._next_draw = 0.0
+        return True
+    
+    def _draw(self, now: float):
+        elapsed = max(now - self._started, 1e-9)
+        files_per_second = self.files / elapsed
+        line = (f"{self.files}/{self.total_files} files  {files_per_second:.1f} files/s  "
+                f"{self.events / elapsed:.0f} events/s  ETA {self._format_eta(files_per_second)}")
+        
+        padding = ' ' * max(0, self._width - len(line))
+        self.stream.write('\r' + line + padding)
+        self.stream.flush()
+        
+        self._width = len(line)
+        self._next_draw = now + self.interval
+    
+    def _clear(self):
+        if self._width:
+            self.stream.write('\r' + ' ' * self._width + '\r')
+            self.stream.flush()
+            self._width = 0
+    
+    def _format_eta(self, files_per_second: float) -> str:
+        remaining = self.total_files - self.files
+        if remaining <= 0:
+            return "0:00"
+        if files_per_second <= 0:
+            return "?"
+        
+        minutes, seconds = divmod(int(remaining / files_per_second), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
@@ -3,10 +3,20 @@ Year Extractor Module for Wrestling Results
 
 This module handles extraction of years from wrestling result filenames,
 including manual mappings for specific files and pattern-based detection.
+Mappings can be loaded in bulk from YAML, JSON or CSV files.
 """
 
+import csv
+import json
+import logging
+import os
 import re
-from typing import Optional, Dict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+
+logger = logging.getLogger(__name__)
 
 
 class YearExtractor:
@@ -31,6 +41,13 @@ class YearExtractor:
             r'(\d{2})$',          # 2-digit year at end: "finalgate07"
             r'(\d{2})(?!.*\d{2})' # Last 2-digit number (fallback for 2-digit years)
         ]
+        
+        # Compiled self.patterns, recompiled if the list is changed
+        self._compiled: List[re.Pattern] = []
+        self._compiled_from: List[str] = []
+        
+        # Extracted year by normalized filename; cleared when mappings change
+        self._cache: Dict[str, Optional[int]] = {}
     
     def extract_year(self, filename: str) -> Optional[int]:
         """
@@ -42,29 +59,52 @@ class YearExtractor:
         Returns:
             Year as integer, or None if no year could be determined
         """
-        # Normalize filename
-        base_name = filename.lower()
-        if not base_name.endswith('.md'):
-            base_name += '.md'
+        return self.extract_years([filename])[0]
+    
+    def extract_years(self, filenames: Iterable[str]) -> List[Optional[int]]:
+        """
+        Extract the years of many filenames at once
         
+        Each distinct filename is resolved once per extractor and remembered,
+        so regrouping the same tree only costs a dictionary lookup per file.
+        
+        Args:
+            filenames: Names of the files (with or without .md extension)
+            
+        Returns:
+            Year of each filename (None where no year could be determined),
+            in the order given
+        """
+        if self._compiled_from != self.patterns:
+            self._compiled = [re.compile(pattern) for pattern in self.patterns]
+            self._compiled_from = list(self.patterns)
+        
+        cache = self._cache
+        normalize = self._normalize
+        resolve = self._resolve
+        years = []
+        for filename in filenames:
+            base_name = normalize(filename)
+            
+            # The cache itself marks a miss, since None is a cached result
+            year = cache.get(base_name, cache)
+            if year is cache:
+                year = cache[base_name] = resolve(base_name)
+            years.append(year)
+        return years
+    
+    def _resolve(self, base_name: str) -> Optional[int]:
+        """Determine the year of a normalized filename"""
         # Check manual mappings first
         if base_name in self.manual_mappings:
-            mapped_year = self.manual_mappings[base_name]
-            if mapped_year:
-                print(f"📋 Used manual mapping: {filename} -> {mapped_year}")
-                return mapped_year
-            else:
-                print(f"⚠️ Manual mapping indicates no year for: {filename}")
-                return None
+            return self.manual_mappings[base_name] or None
         
         # Remove file extension for pattern matching
         base_name_no_ext = base_name.replace('.md', '')
         
-        print(f"Parsing year from: {filename} -> {base_name_no_ext}")
-        
         # Try each pattern
-        for pattern in self.patterns:
-            match = re.search(pattern, base_name_no_ext)
+        for pattern in self._compiled:
+            match = pattern.search(base_name_no_ext)
             if match:
                 year = int(match.group(1))
                 
@@ -79,14 +119,17 @@ class YearExtractor:
                 
                 # Validate reasonable year range (wrestling promotion likely 1990-2030)
                 if self._is_valid_year(year):
-                    print(f"✅ Parsed year {year} from {filename}")
                     return year
-                else:
-                    print(f"⚠️ Year {year} outside valid range for {filename}")
         
-        print(f"❌ Could not parse year from {filename}")
         return None
     
+    def _normalize(self, filename: str) -> str:
+        """Get the lowercase .md name mappings and the cache are keyed by"""
+        base_name = filename.lower()
+        if not base_name.endswith('.md'):
+            base_name += '.md'
+        return base_name
+    
     def _is_valid_year(self, year: int) -> bool:
         """
         Check if year is in valid range for wrestling results
@@ -99,7 +142,7 @@ class YearExtractor:
         """
         return 1990 <= year <= 2030
     
-    def group_files_by_year(self, filenames: list[str]) -> Dict[int, list[str]]:
+    def group_files_by_year(self, filenames: Iterable[str]) -> Dict[int, list[str]]:
         """
         Group filenames by their extracted years
         
@@ -110,15 +153,15 @@ class YearExtractor:
             Dictionary mapping years to lists of filenames
         """
         files_by_year = {}
+        filenames = list(filenames)
         
-        for filename in filenames:
-            year = self.extract_year(filename)
+        for filename, year in zip(filenames, self.extract_years(filenames)):
             if year:
                 if year not in files_by_year:
                     files_by_year[year] = []
                 files_by_year[year].append(filename)
             else:
-                print(f"⚠️ Skipping file with no extractable year: {filename}")
+                logger.warning("Skipping file with no extractable year: %s", filename)
         
         # Sort files within each year
         for year in files_by_year:
@@ -138,8 +181,82 @@ class YearExtractor:
         if not filename.lower().endswith('.md'):
             filename += '.md'
         
-        self.manual_mappings[filename.lower()] = year
-        print(f"Added manual mapping: {filename} -> {year}")
+        base_name = self._normalize(filename)
+        self.manual_mappings[base_name] = year
+        self._cache.pop(base_name, None)
+        logger.debug("Added manual mapping: %s -> %s", filename, year)
+    
+    def load_mapping_file(self, path: str) -> int:
+        """
+        Add the filename-to-year mappings of a YAML, JSON or CSV file
+        
+        YAML and JSON files hold a mapping of filename to year; CSV files hold
+        filename,year rows, optionally under a header row. A null, empty or
+        'none' year marks a file as having no year.
+        
+        Args:
+            path: Mapping file, its format taken from the extension
+            
+        Returns:
+            Number of mappings added
+            
+        Raises:
+            ValueError: If the file is not a valid mapping file
+        """
+        extension = os.path.splitext(path)[1].lower()
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            if extension in ('.yaml', '.yml'):
+                try:
+                    entries = self._mapping_entries(yaml.safe_load(f), path)
+                except yaml.YAMLError as e:
+                    raise ValueError(f"{path}: invalid YAML: {e}")
+            elif extension == '.json':
+                try:
+                    entries = self._mapping_entries(json.load(f), path)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}: invalid JSON: {e}")
+            elif extension == '.csv':
+                entries = self._csv_entries(f, path)
+            else:
+                raise ValueError(f"{path}: unknown mapping file type, use .yaml, .yml, .json or .csv")
+        
+        mappings = {self._normalize(filename): self._parse_year(year, path, filename) for filename, year in entries}
+        self.manual_mappings.update(mappings)
+        self._cache.clear()
+        return len(mappings)
+    
+    def _mapping_entries(self, data: Any, path: str) -> List[Tuple[str, Any]]:
+        """Get the (filename, year) entries of a loaded YAML or JSON document"""
+        if data is None:
+            return []
+        if not isinstance(data, dict):
+            raise ValueError(f"{path}: expected a mapping of filename to year")
+        return [(str(filename), year) for filename, year in data.items()]
+    
+    def _csv_entries(self, f, path: str) -> List[Tuple[str, Any]]:
+        """Get the (filename, year) entries of a CSV file, skipping a header row"""
+        entries = []
+        for row_number, row in enumerate(csv.reader(f), 1):
+            if not row or not ''.join(row).strip():
+                continue
+            if len(row) != 2:
+                raise ValueError(f"{path}:{row_number}: expected filename,year")
+            filename, year = row[0].strip(), row[1].strip()
+            if row_number == 1 and not year.isdigit() and year.lower() not in ('', 'none'):
+                continue
+            entries.append((filename, year))
+        return entries
+    
+    def _parse_year(self, year: Any, path: str, filename: str) -> Optional[int]:
+        """Convert a mapping file's year value, with None for 'no year'"""
+        if year is None or (isinstance(year, str) and year.strip().lower() in ('', 'none', 'null')):
+            return None
+        if isinstance(year, bool) or (isinstance(year, float) and not year.is_integer()):
+            raise ValueError(f"{path}: invalid year {year!r} for {filename}")
+        try:
+            return int(year)
+        except (TypeError, ValueError):
+            raise ValueError(f"{path}: invalid year {year!r} for {filename}")
     
     def get_manual_mappings(self) -> Dict[str, Optional[int]]:
         """
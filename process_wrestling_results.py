@@ -19,6 +19,7 @@ Usage:
 """
 
 import argparse
+import logging
 import sys
 import os
 from pathlib import Path
@@ -27,6 +28,11 @@ from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'modules'))
 
 from modules.file_merger import FileMerger
+from modules.directory_watcher import DirectoryWatcher
+from modules.file_discovery import FileDiscovery
+from modules.format_converter import PARSER_VERSION
+from modules.parse_cache import DEFAULT_MAX_BYTES, ParseCache, default_cache_dir
+from modules.progress import ProgressReporter
 from modules.year_extractor import YearExtractor
 from modules.markdown_parser import MarkdownParser
 from modules.date_parser import DateParser
@@ -49,6 +55,24 @@ Examples:
   # Add custom year mapping for a specific file
   python process_wrestling_results.py input/ yearly/ --add-mapping "specialfile.md=2005"
   
+  # Load many year mappings at once (YAML, JSON or CSV)
+  python process_wrestling_results.py input/ yearly/ --mapping-file mappings.csv
+  
+  # Rebuild every year, ignoring what the last run recorded
+  python process_wrestling_results.py input/ yearly/ --force
+  
+  # Reuse events parsed by earlier runs for unchanged files
+  python process_wrestling_results.py input/ yearly/ --cache
+  
+  # Keep running and rebuild only the years of files that change
+  python process_wrestling_results.py input/ yearly/ --watch
+  
+  # Only process files under 2005/, skipping drafts
+  python process_wrestling_results.py input/ yearly/ --include "2005/*" --exclude "*draft*"
+  
+  # Rebuild only 2005 to 2007
+  python process_wrestling_results.py input/ yearly/ --years 2005-2007
+  
   # Generate only the processing summary
   python process_wrestling_results.py input/ yearly/ --summary-only
         """
@@ -60,20 +84,108 @@ Examples:
                        help='Directory to write yearly merged files')
     parser.add_argument('--verbose', '-v', 
                        action='store_true',
-                       help='Enable verbose output')
+                       help='Enable verbose output (log every file parsed)')
+    parser.add_argument('--quiet', '-q', 
+                       action='store_true',
+                       help='Only log warnings and errors while processing')
+    parser.add_argument('--no-progress', 
+                       action='store_true',
+                       help='Do not draw the progress line (only drawn when stderr is a terminal)')
     parser.add_argument('--add-mapping', 
                        action='append',
                        metavar='FILENAME=YEAR',
                        help='Add manual year mapping (format: filename.md=2005)')
+    parser.add_argument('--mapping-file', 
+                       action='append',
+                       metavar='FILE',
+                       help='Load manual year mappings from a YAML, JSON or CSV file (filename to year)')
     parser.add_argument('--summary-only', 
                        action='store_true',
-                       help='Generate only processing summary, no output files')
+                       help='Generate only processing summary, no season files (events are counted, not rendered)')
     parser.add_argument('--dry-run', 
                        action='store_true',
                        help='Show what would be processed without writing files')
+    parser.add_argument('--include', 
+                       action='append',
+                       metavar='GLOB',
+                       help='Only process .md files whose relative path or name matches GLOB (repeatable)')
+    parser.add_argument('--exclude', 
+                       action='append',
+                       metavar='GLOB',
+                       help='Skip files and directories whose relative path or name matches GLOB (repeatable)')
+    parser.add_argument('--follow-symlinks', 
+                       action='store_true',
+                       help='Descend into symlinked directories (each directory is scanned once)')
+    parser.add_argument('--scan-threads', 
+                       type=int,
+                       default=1,
+                       metavar='N',
+                       help='Scan input directories with N threads (default 1)')
+    parser.add_argument('--years', 
+                       type=parse_year_selection,
+                       metavar='YEARS',
+                       help='Only rebuild these years, e.g. 2005-2007 or 2001,2005-2007')
+    parser.add_argument('--series', 
+                       action='append',
+                       metavar='GLOB',
+                       help='Only rebuild years with a file whose name matches GLOB, e.g. "final*" (repeatable)')
+    parser.add_argument('--watch', 
+                       action='store_true',
+                       help='Keep running and rebuild the years of input files as they change')
+    parser.add_argument('--interval', 
+                       type=float,
+                       default=1.0,
+                       metavar='SECONDS',
+                       help='Seconds between checks for changed files in watch mode (default 1)')
+    parser.add_argument('--force', 
+                       action='store_true',
+                       help='Rebuild every year, even those whose inputs are unchanged since the last run')
+    parser.add_argument('--cache', 
+                       action='store_true',
+                       help='Reuse events parsed by earlier runs from an on-disk cache of pickles. Off by '
+                            'default, so a plain run writes nothing outside the output directory')
+    parser.add_argument('--clear-cache', 
+                       action='store_true',
+                       help='Empty the parse cache before processing')
+    parser.add_argument('--cache-dir', 
+                       metavar='DIR',
+                       help=f'Directory of the parse cache, implies --cache (default: {default_cache_dir()})')
+    parser.add_argument('--cache-max-mb', 
+                       type=parse_non_negative_int,
+                       default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                       metavar='MB',
+                       help='Prune the parse cache to MB megabytes after each build, least recently used '
+                            f'first (default {DEFAULT_MAX_BYTES // (1024 * 1024)})')
+    parser.add_argument('--mmap', 
+                       action='store_true',
+                       help='Memory-map input files and decode lines lazily (lower memory for large archives)')
+    parser.add_argument('--jobs', '-j', 
+                       type=parse_non_negative_int,
+                       default=1,
+                       metavar='N',
+                       help='Parse files in N worker processes (0 uses all CPUs, default 1)')
+    parser.add_argument('--date-cache-size', 
+                       type=parse_non_negative_int,
+                       default=0,
+                       metavar='N',
+                       help='Cache extracted dates for up to N distinct lines (0 disables, default)')
     
     args = parser.parse_args()
     
+    if args.watch and (args.dry_run or args.summary_only):
+        parser.error("--watch cannot be combined with --dry-run or --summary-only")
+    if args.verbose and args.quiet:
+        parser.error("--verbose cannot be combined with --quiet")
+    
+    # Per-file messages are debug records, never formatted at the default level
+    log_level = logging.DEBUG if args.verbose else logging.WARNING if args.quiet else logging.INFO
+    logging.basicConfig(level=log_level, format='%(levelname)-8s%(message)s', stream=sys.stdout)
+    
+    progress = ProgressReporter(enabled=False if args.no_progress else None)
+    if progress.enabled:
+        for handler in logging.getLogger().handlers:
+            handler.addFilter(progress)
+    
     # Validate input directory
     if not os.path.isdir(args.input_dir):
         print(f"❌ Error: Input directory '{args.input_dir}' does not exist")
@@ -83,8 +195,32 @@ Examples:
     if not args.dry_run and not args.summary_only:
         os.makedirs(args.output_dir, exist_ok=True)
     
+    workers = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    
+    # The parse cache is only used when asked for
+    cache_dir = args.cache_dir or (default_cache_dir() if args.cache else None)
+    
+    if args.clear_cache:
+        clear_dir = cache_dir or default_cache_dir()
+        ParseCache(clear_dir, PARSER_VERSION).clear()
+        print(f"Cleared parse cache: {clear_dir}")
+    
     # Initialize the file merger
-    merger = FileMerger()
+    discovery = FileDiscovery(include=args.include, exclude=args.exclude,
+                              follow_symlinks=args.follow_symlinks, workers=args.scan_threads)
+    merger = FileMerger(use_mmap=args.mmap, date_cache_size=args.date_cache_size,
+                        cache_dir=cache_dir, discovery=discovery,
+                        years=args.years, series=args.series, progress=progress,
+                        cache_max_bytes=args.cache_max_mb * 1024 * 1024)
+    
+    # Load mapping files first, so --add-mapping can override single entries
+    for mapping_file in args.mapping_file or []:
+        try:
+            count = merger.load_year_mappings(mapping_file)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error: Cannot load mapping file: {e}")
+            sys.exit(1)
+        print(f"Loaded {count} mappings from {mapping_file}")
     
     # Add any manual year mappings
     if args.add_mapping:
@@ -110,32 +246,42 @@ Examples:
             print("🧪 DRY RUN MODE - No files will be written")
             print()
             
-            yearly_outputs = run_dry_run(merger, args.input_dir)
+            yearly_outputs = run_dry_run(merger, args.input_dir, args.output_dir)
             
         elif args.summary_only:
             # Generate summary only
             print("📊 SUMMARY ONLY MODE")
             print()
             
-            yearly_outputs = merger.process_directory(args.input_dir, args.output_dir)
+            yearly_outputs = merger.summarize_directory(args.input_dir, args.output_dir)
             
             # Write only the summary
-            summary = merger.get_processing_summary(yearly_outputs)
-            summary_path = os.path.join(args.output_dir, 'processing_summary.md')
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                f.write(summary)
+            summary_path = write_summary(merger, yearly_outputs, args.output_dir)
             
             print(f"📋 Summary written to: {summary_path}")
             
+        elif args.watch:
+            watcher = DirectoryWatcher(merger, args.input_dir, args.output_dir, interval=args.interval)
+            yearly_outputs = watcher.build(workers=workers, force=args.force)
+            summary_path = write_summary(merger, yearly_outputs, args.output_dir)
+            print(f"\n📋 Processing summary written to: {summary_path}")
+            
+            def on_rebuild(years):
+                write_summary(merger, watcher.yearly_outputs(), args.output_dir)
+                print(f"✅ Rebuilt {years}, summary updated")
+            
+            try:
+                watcher.run(on_rebuild)
+            except KeyboardInterrupt:
+                print("\n⏹️ Stopped watching")
+                return
+            
         else:
             # Full processing
-            yearly_outputs = merger.process_directory(args.input_dir, args.output_dir)
+            yearly_outputs = merger.process_directory(args.input_dir, args.output_dir, workers=workers, force=args.force)
             
             # Generate and write processing summary
-            summary = merger.get_processing_summary(yearly_outputs)
-            summary_path = os.path.join(args.output_dir, 'processing_summary.md')
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                f.write(summary)
+            summary_path = write_summary(merger, yearly_outputs, args.output_dir)
             
             print(f"\n📋 Processing summary written to: {summary_path}")
         
@@ -145,7 +291,7 @@ Examples:
             print(f"📅 Years processed: {len(yearly_outputs)}")
             print(f"📄 Total files processed: {sum(len(yo.series_files) for yo in yearly_outputs)}")
             
-            if not args.dry_run:
+            if not args.dry_run and not args.summary_only:
                 print(f"📁 Output files written to: {args.output_dir}")
                 for yearly_output in yearly_outputs:
                     print(f"   - {yearly_output.output_filename}")
@@ -163,38 +309,72 @@ Examples:
         sys.exit(1)
 
 
-def run_dry_run(merger: FileMerger, input_dir: str):
+def parse_year_selection(text: str):
+    """Parse a --years value such as '2005', '2005-2007' or '2001,2005-2007' into a set of years"""
+    years = set()
+    try:
+        for part in text.split(','):
+            first, _, last = part.strip().partition('-')
+            start = int(first)
+            end = int(last) if last else start
+            if end < start:
+                raise ValueError(part)
+            years.update(range(start, end + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid year selection '{text}', use e.g. 2005-2007 or 2001,2005")
+    return years
+
+
+def parse_non_negative_int(text: str) -> int:
+    """Parse a count option that must be 0 or more"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{text}'")
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {value}")
+    return value
+
+
+def write_summary(merger: FileMerger, yearly_outputs, output_dir: str) -> str:
+    """Write the processing summary and return its path"""
+    summary = merger.get_processing_summary(yearly_outputs)
+    os.makedirs(output_dir, exist_ok=True)
+    summary_path = os.path.join(output_dir, 'processing_summary.md')
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        f.write(summary)
+    return summary_path
+
+
+def run_dry_run(merger: FileMerger, input_dir: str, output_dir: str):
     """Run in dry-run mode to show what would be processed"""
-    # Find markdown files
-    md_files = []
-    for root, dirs, files in os.walk(input_dir):
-        for file in files:
-            if file.lower().endswith('.md'):
-                filepath = os.path.join(root, file)
-                md_files.append(filepath)
+    # Find markdown files the same way processing does
+    md_files = merger._find_markdown_files(input_dir, output_dir)
+    
+    filenames = [os.path.basename(filepath) for filepath in md_files]
+    years = merger.year_extractor.extract_years(filenames)
     
     print(f"🔍 Found {len(md_files)} markdown files:")
-    for filepath in md_files:
-        filename = os.path.basename(filepath)
-        year = merger.year_extractor.extract_year(filename)
+    for filename, year in zip(filenames, years):
         print(f"   {filename} -> {year if year else 'No year detected'}")
     
-    # Group by year
-    files_by_year = {}
-    for filepath in md_files:
-        filename = os.path.basename(filepath)
-        year = merger.year_extractor.extract_year(filename)
-        if year:
-            if year not in files_by_year:
-                files_by_year[year] = []
-            files_by_year[year].append(filename)
+    # Group by year, with the same selection as processing
+    files_by_year = {
+        year: [file_info.filepath for file_info in file_infos]
+        for year, file_infos in merger._group_files_by_year(md_files).items()
+    }
     
     print(f"\n📅 Would group into {len(files_by_year)} years:")
     for year in sorted(files_by_year.keys()):
         files = files_by_year[year]
         print(f"   {year}: {len(files)} files")
-        for filename in files:
-            print(f"      - {filename}")
+        for filepath in files:
+            # Only the header is read, the body is never parsed
+            try:
+                series_name, _ = merger.markdown_parser.scan_header(filepath)
+            except Exception as e:
+                series_name = f"unreadable: {e}"
+            print(f"      - {os.path.basename(filepath)}: {series_name or 'No series title'}")
     
     print(f"\n📄 Would generate output files:")
     for year in sorted(files_by_year.keys()):
@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+# Make the modules package importable when pytest is run from any directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def write_corpus(tmp_path):
+    """
+    Write an input directory with one file per series and year
+    
+    Each file is a series of its own with two events, Osaka on January nth
+    before Tokyo on March nth, where n is the series' position.
+    """
+    def write(years=(2001,), series=("alpha", "beta", "gamma"), directory=None):
+        directory = directory or tmp_path / "input"
+        directory.mkdir(exist_ok=True)
+        for year in years:
+            for day, name in enumerate(series, 1):
+                (directory / f"{name}{year % 100:02d}.md").write_text(
+                    f"# {name}\n\n3/{day}/{year} Tokyo\n1. A def. B\n\n1/{day}/{year} Osaka\n1. C def. D\n",
+                    encoding='utf-8')
+        return directory
+    return write
@@ -0,0 +1,106 @@
+import os
+
+import pytest
+
+from modules.build_manifest import BuildManifest, MANIFEST_FILENAME, hash_file
+from modules.file_merger import FileMerger
+from modules.format_converter import PARSER_VERSION
+
+
+def bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def rebuilt_years(merger, tmp_path):
+    outputs = merger.process_directory(str(tmp_path / "input"), str(tmp_path / "output"))
+    return [output.year for output in outputs if output.rebuilt]
+
+
+@pytest.fixture
+def built(tmp_path, write_corpus):
+    write_corpus(years=(2001, 2003), series=("alpha", "beta"))
+    assert rebuilt_years(FileMerger(), tmp_path) == [2001, 2003]
+    return tmp_path
+
+
+def test_unchanged_inputs_rebuild_nothing(built):
+    outputs = FileMerger().process_directory(str(built / "input"), str(built / "output"))
+    
+    assert [(output.year, output.rebuilt) for output in outputs] == [(2001, False), (2003, False)]
+    assert [output.event_count for output in outputs] == [4, 4]
+
+
+def test_touched_input_with_same_content_is_current(built):
+    bump_mtime(built / "input" / "alpha01.md")
+    
+    assert rebuilt_years(FileMerger(), built) == []
+
+
+def test_edited_input_rebuilds_only_its_year(built):
+    (built / "input" / "beta03.md").write_text("# beta\n\n5/6/2003 Kobe\n1. C def. D\n", encoding='utf-8')
+    bump_mtime(built / "input" / "beta03.md")
+    
+    assert rebuilt_years(FileMerger(), built) == [2003]
+    assert "Kobe" in (built / "output" / "2003_season.md").read_text(encoding='utf-8')
+
+
+def test_added_and_removed_inputs_rebuild_their_year(built):
+    (built / "input" / "gamma01.md").write_text("# gamma\n\n7/8/2001 Sendai\n1. E def. F\n", encoding='utf-8')
+    assert rebuilt_years(FileMerger(), built) == [2001]
+    
+    os.remove(built / "input" / "gamma01.md")
+    assert rebuilt_years(FileMerger(), built) == [2001]
+    assert "Sendai" not in (built / "output" / "2001_season.md").read_text(encoding='utf-8')
+
+
+def test_year_without_inputs_is_forgotten(built):
+    os.remove(built / "input" / "alpha03.md")
+    os.remove(built / "input" / "beta03.md")
+    FileMerger().process_directory(str(built / "input"), str(built / "output"))
+    
+    manifest = BuildManifest(str(built / "output"), PARSER_VERSION)
+    assert manifest.load()
+    assert list(manifest.years) == ["2001"]
+    assert all(record['year'] == 2001 for record in manifest.files.values())
+
+
+def test_modified_output_is_rebuilt(built):
+    season = built / "output" / "2001_season.md"
+    season.write_text("edited by hand\n", encoding='utf-8')
+    
+    assert rebuilt_years(FileMerger(), built) == [2001]
+    assert season.read_text(encoding='utf-8') != "edited by hand\n"
+
+
+def test_mapping_change_rebuilds_old_and_new_year(built):
+    merger = FileMerger()
+    merger.add_year_mapping("alpha01.md", 2003)
+    
+    assert rebuilt_years(merger, built) == [2001, 2003]
+    assert "# alpha" not in (built / "output" / "2001_season.md").read_text(encoding='utf-8')
+
+
+def test_manifest_of_another_parser_version_is_ignored(built):
+    assert not BuildManifest(str(built / "output"), -1).load()
+
+
+def test_unreadable_manifest_rebuilds_everything(built, caplog):
+    (built / "output" / MANIFEST_FILENAME).write_text("{not json", encoding='utf-8')
+    
+    assert rebuilt_years(FileMerger(), built) == [2001, 2003]
+    assert "Ignoring unreadable manifest" in caplog.text
+
+
+def test_record_year_stores_input_state(tmp_path):
+    path = tmp_path / "alpha01.md"
+    path.write_text("# alpha\n", encoding='utf-8')
+    manifest = BuildManifest(str(tmp_path / "output"), 1)
+    
+    manifest.record_year(2001, [str(path)], [], "2001_season.md", None)
+    
+    record = manifest.files[os.path.abspath(path)]
+    assert record['sha256'] == hash_file(str(path))
+    assert (record['year'], record['status'], record['event_count']) == (2001, 'error', 0)
+    assert manifest.is_year_current(2001, [str(path)])
+    assert not manifest.is_year_current(2002, [str(path)])
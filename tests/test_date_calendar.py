@@ -0,0 +1,73 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from modules.date_calendar import DateCalendar, default_calendar
+from modules.date_parser import DateParser
+
+
+@pytest.fixture(scope='module')
+def calendar():
+    return DateCalendar(2000, 2001)
+
+
+def test_ordinals_match_date_toordinal(calendar):
+    day = date(2000, 1, 1)
+    while day.year <= 2001:
+        assert calendar.ordinal(day.year, day.month, day.day) == day.toordinal()
+        day += timedelta(days=1)
+
+
+@pytest.mark.parametrize("year, month, day", [
+    (2001, 2, 29), (2000, 4, 31), (2000, 13, 1), (2000, 0, 1), (2000, 1, 0), (2000, 1, 32),
+    (1999, 12, 31), (2002, 1, 1),
+])
+def test_impossible_or_out_of_range_dates_have_no_ordinal(calendar, year, month, day):
+    assert calendar.ordinal(year, month, day) == 0
+    assert not calendar.is_valid(year, month, day)
+
+
+def test_leap_day_is_valid(calendar):
+    assert calendar.is_valid(2000, 2, 29)
+
+
+@pytest.mark.parametrize("day, rendered", [
+    (date(2001, 4, 1), "April 1st, 2001"),
+    (date(2001, 4, 2), "April 2nd, 2001"),
+    (date(2001, 4, 3), "April 3rd, 2001"),
+    (date(2001, 4, 11), "April 11th, 2001"),
+    (date(2001, 4, 12), "April 12th, 2001"),
+    (date(2001, 4, 13), "April 13th, 2001"),
+    (date(2001, 4, 21), "April 21st, 2001"),
+    (date(2001, 4, 22), "April 22nd, 2001"),
+    (date(2001, 4, 30), "April 30th, 2001"),
+])
+def test_rendering_uses_dragon_gate_suffixes(calendar, day, rendered):
+    assert calendar.format(day.toordinal()) == rendered
+    assert DateCalendar.render_date(day) == rendered
+
+
+def test_datetimes_are_shared(calendar):
+    ordinal = date(2001, 4, 26).toordinal()
+    
+    assert calendar.to_datetime(ordinal) == datetime(2001, 4, 26)
+    assert calendar.to_datetime(ordinal) is calendar.to_datetime(ordinal)
+
+
+def test_contains_covers_the_whole_range(calendar):
+    assert calendar.contains(date(2000, 1, 1).toordinal())
+    assert calendar.contains(date(2001, 12, 31).toordinal())
+    assert not calendar.contains(date(1999, 12, 31).toordinal())
+    assert not calendar.contains(date(2002, 1, 1).toordinal())
+
+
+def test_default_calendar_is_shared():
+    assert default_calendar() is default_calendar()
+    assert (default_calendar().start_year, default_calendar().end_year) == (1990, 2030)
+
+
+def test_parser_formats_ordinals_outside_the_calendar():
+    parser = DateParser(calendar=DateCalendar(2000, 2001))
+    
+    assert parser.format_date_ordinal(date(2001, 5, 3).toordinal()) == "May 3rd, 2001"
+    assert parser.format_date_ordinal(date(1985, 5, 3).toordinal()) == "May 3rd, 1985"
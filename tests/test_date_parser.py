@@ -0,0 +1,115 @@
+import pytest
+
+from modules.date_parser import DateParser
+
+
+def test_negative_cache_size_is_rejected():
+    with pytest.raises(ValueError):
+        DateParser(cache_size=-1)
+
+
+def test_cache_serves_repeated_lines():
+    parser = DateParser(cache_size=2)
+    
+    first = parser.extract_dates_from_text("4/26/2001 Gifu Industrial Hall")
+    second = parser.extract_dates_from_text("4/26/2001 Gifu Industrial Hall")
+    
+    assert first == second
+    assert parser.cache_stats()['hits'] == 1
+    assert parser.cache_stats()['misses'] == 1
+
+
+def test_cache_evicts_least_recently_used():
+    parser = DateParser(cache_size=2)
+    for text in ("1/1/2001 A", "2/2/2001 B", "1/1/2001 A", "3/3/2001 C"):
+        parser.extract_dates_from_text(text)
+    
+    assert list(parser._cache) == ["1/1/2001 A", "3/3/2001 C"]
+
+
+def test_cached_results_are_copies():
+    parser = DateParser(cache_size=4)
+    
+    first = parser.extract_dates_from_text("4/26/2001 Gifu")
+    first[0].line_number = 99
+    second = parser.extract_dates_from_text("4/26/2001 Gifu")
+    
+    assert second[0] is not first[0]
+    assert second[0].line_number is None
+    assert parser.extract_dates_from_text("4/26/2001 Gifu", line_number=7)[0].line_number == 7
+
+
+def test_cached_results_match_uncached():
+    cached = DateParser(cache_size=8)
+    uncached = DateParser()
+    lines = ["4/26/2001 Gifu", "November 25th, 2001 Shizuoka", "no date here", "4/26/2001 Gifu"]
+    
+    assert [cached.extract_dates_from_text(line, 1) for line in lines] == \
+        [uncached.extract_dates_from_text(line, 1) for line in lines]
+
+
+@pytest.mark.parametrize("text, expected, confidence", [
+    ("2001-04-26", "2001-04-26", 0.9),
+    ("4/26/2001 Gifu", "4/26/2001", 0.85),
+    ("04-26-2001", "04-26-2001", 0.8),
+    ("4.26.2001", "4.26.2001", 0.8),
+    ("NOVEMBER 25th, 2001 Shizuoka", "NOVEMBER 25th, 2001", 0.95),
+    ("Nov 25 2001", "Nov 25 2001", 0.9),
+    ("4/26/01 Gifu", "4/26/01", 0.6),
+    ("4-26-01 Gifu", "4-26-01", 0.6),
+])
+def test_each_date_form_is_found_once(text, expected, confidence):
+    dates = DateParser().extract_dates_from_text(text)
+    
+    assert [(d.original_text, d.confidence) for d in dates] == [(expected, confidence)]
+    assert text[dates[0].start:dates[0].end] == expected
+
+
+def test_longest_form_wins_over_its_two_digit_prefix():
+    dates = DateParser().extract_dates_from_text("4/26/2001 Gifu")
+    
+    assert [d.date.year for d in dates] == [2001]
+
+
+def test_dates_on_one_line_are_ordered_by_confidence():
+    dates = DateParser().extract_dates_from_text("3/4/2001 and December 1st, 2001")
+    
+    assert [d.original_text for d in dates] == ["December 1st, 2001", "3/4/2001"]
+
+
+def test_lines_without_dates_are_not_scanned(monkeypatch):
+    parser = DateParser()
+    monkeypatch.setattr(parser, '_scan_dates', lambda *args: pytest.fail("scanned"))
+    
+    for text in ("Tokyo Korakuen Hall", "1. CIMA def. Dragon Kid (12:34)", ""):
+        assert parser.extract_dates_from_text(text) == []
+
+
+def test_dates_outside_the_calendar_are_dropped():
+    parser = DateParser()
+    
+    assert parser.extract_dates_from_text("12/31/1989") == []
+    assert parser.extract_dates_from_text("2/29/2001") == []
+
+
+def test_batch_extraction_matches_scalar_extraction():
+    np = pytest.importorskip("numpy")
+    parser = DateParser()
+    lines = [
+        "4/26/2001 Gifu", "no date", "3/4/2001 and December 1st, 2001", "2001-04-26 and 4/26/2001",
+        "12/31/1989", "2/29/2000 leap", "Nov 3 01", "4/26/01 and 5/1/01", "",
+    ]
+    
+    dates, confidences, line_indices = parser.extract_dates_batch(lines)
+    
+    expected = [(index, np.datetime64(d.date.date(), 'D'), d.confidence)
+                for index, line in enumerate(lines) for d in parser.extract_dates_from_text(line)]
+    assert list(zip(line_indices.tolist(), dates, confidences.tolist())) == expected
+
+
+def test_batch_extraction_of_no_lines_is_empty():
+    pytest.importorskip("numpy")
+    
+    dates, confidences, line_indices = DateParser().extract_dates_batch([])
+    
+    assert len(dates) == len(confidences) == len(line_indices) == 0
@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+from modules.directory_watcher import DirectoryWatcher
+from modules.file_merger import FileMerger
+
+
+def edit(path, text):
+    stat = os.stat(path)
+    path.write_text(text, encoding='utf-8')
+    # Make the change visible even on coarse mtime clocks
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def parsed_files(monkeypatch):
+    parsed = []
+    parse_file = FileMerger._parse_file
+    
+    def counting_parse_file(self, file_info, *args, **kwargs):
+        parsed.append(file_info.filename)
+        return parse_file(self, file_info, *args, **kwargs)
+    
+    monkeypatch.setattr(FileMerger, '_parse_file', counting_parse_file)
+    return parsed
+
+
+def test_edit_in_up_to_date_year_parses_only_that_file(tmp_path, write_corpus, parsed_files):
+    write_corpus(years=(2001, 2003))
+    FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "output"))
+    
+    watcher = DirectoryWatcher(FileMerger(), str(tmp_path / "input"), str(tmp_path / "output"))
+    watcher.build()
+    parsed_files.clear()
+    
+    edit(tmp_path / "input" / "beta01.md", "# beta\n\n3/4/2001 Kobe\n1. C def. D\n")
+    
+    assert watcher.poll() == [2001]
+    assert parsed_files == ["beta01.md"]
+    
+    season = (tmp_path / "output" / "2001_season.md").read_text(encoding='utf-8')
+    assert "Tokyo" in season and "Kobe" in season
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_rebuild_matches_a_full_build(tmp_path, write_corpus, workers):
+    write_corpus(years=(2001, 2003))
+    FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "output"))
+    
+    watcher = DirectoryWatcher(FileMerger(), str(tmp_path / "input"), str(tmp_path / "output"))
+    watcher.build(workers=workers)
+    assert len(watcher._parsed) == 6
+    edit(tmp_path / "input" / "gamma03.md", "# gamma\n\n5/6/2003 Kobe\n1. E def. F\n")
+    watcher.poll()
+    
+    FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "fresh"))
+    for year in (2001, 2003):
+        season = f"{year}_season.md"
+        assert (tmp_path / "output" / season).read_bytes() == (tmp_path / "fresh" / season).read_bytes()
+
+
+@pytest.mark.parametrize("prebuilt", [False, True])
+def test_failed_file_is_only_retried_after_it_changes(tmp_path, write_corpus, parsed_files, prebuilt):
+    write_corpus(years=(2001, 2003))
+    broken = tmp_path / "input" / "delta01.md"
+    broken.write_bytes(b"# delta\n\n\xff\xfe\n")
+    if prebuilt:
+        FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "output"))
+        parsed_files.clear()
+    
+    watcher = DirectoryWatcher(FileMerger(), str(tmp_path / "input"), str(tmp_path / "output"))
+    watcher.build()
+    # A failure the manifest already records is not parsed again
+    assert parsed_files.count("delta01.md") == (0 if prebuilt else 1)
+    parsed_files.clear()
+    
+    edit(tmp_path / "input" / "alpha01.md", "# alpha\n\n3/4/2001 Osaka\n1. C def. D\n")
+    assert watcher.poll() == [2001]
+    assert parsed_files == ["alpha01.md"]
+    
+    parsed_files.clear()
+    edit(broken, "# delta\n\n7/8/2001 Sendai\n1. G def. H\n")
+    assert watcher.poll() == [2001]
+    assert parsed_files == ["delta01.md"]
+    assert "Sendai" in (tmp_path / "output" / "2001_season.md").read_text(encoding='utf-8')
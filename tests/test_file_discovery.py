@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+from modules.file_discovery import FileDiscovery
+from modules.file_merger import FileMerger
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "input"
+    for relpath in ("alpha01.md", "notes.txt", "UPPER02.MD", "2001/beta01.md", "2001/drafts/gamma01.md",
+                    "2002/beta02.md"):
+        path = root / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("# x\n", encoding='utf-8')
+    return root
+
+
+def relative(root, paths):
+    return [os.path.relpath(path, root).replace(os.sep, '/') for path in paths]
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_finds_markdown_files_sorted_by_relative_path(tree, workers):
+    found = FileDiscovery(workers=workers).find(str(tree))
+    
+    assert relative(tree, found) == [
+        "2001/beta01.md", "2001/drafts/gamma01.md", "2002/beta02.md", "UPPER02.MD", "alpha01.md"]
+
+
+def test_include_matches_relative_path_or_filename(tree):
+    assert relative(tree, FileDiscovery(include=["beta*"]).find(str(tree))) == ["2001/beta01.md", "2002/beta02.md"]
+    assert relative(tree, FileDiscovery(include=["2001/*"]).find(str(tree))) == [
+        "2001/beta01.md", "2001/drafts/gamma01.md"]
+
+
+def test_excluded_directory_is_not_scanned(tree):
+    found = FileDiscovery(exclude=["drafts"]).find(str(tree))
+    
+    assert "2001/drafts/gamma01.md" not in relative(tree, found)
+    assert "2001/beta01.md" in relative(tree, found)
+
+
+def test_output_directory_inside_input_is_skipped(tree):
+    output = tree / "yearly"
+    output.mkdir()
+    (output / "2001_season.md").write_text("# season\n", encoding='utf-8')
+    
+    found = FileDiscovery().find(str(tree), skip_dirs=[str(output), None])
+    
+    assert not [path for path in relative(tree, found) if path.startswith("yearly/")]
+
+
+def test_missing_directory_finds_nothing(tmp_path):
+    assert FileDiscovery().find(str(tmp_path / "missing")) == []
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink'), reason="needs symlinks")
+def test_symlinked_directories_are_followed_once(tree):
+    try:
+        os.symlink(tree / "2002", tree / "linked")
+        os.symlink(tree, tree / "2001" / "loop")
+    except OSError:
+        pytest.skip("cannot create symlinks")
+    
+    assert "linked/beta02.md" not in relative(tree, FileDiscovery().find(str(tree)))
+    
+    found = relative(tree, FileDiscovery(follow_symlinks=True).find(str(tree)))
+    assert len(found) == 5
+    assert found.count("2002/beta02.md") + found.count("linked/beta02.md") == 1
+
+
+def test_merger_never_reads_its_own_output(tree):
+    output_dir = tree / "yearly"
+    FileMerger().process_directory(str(tree), str(output_dir))
+    outputs = FileMerger().process_directory(str(tree), str(output_dir), force=True)
+    
+    assert [output.year for output in outputs] == [2001, 2002]
+    assert all(not file_info.filepath.startswith(str(output_dir))
+               for output in outputs for file_info in output.series_files)
@@ -0,0 +1,94 @@
+import os
+from datetime import datetime
+
+import pytest
+
+from modules.file_merger import FileMerger, YearlyOutput
+from modules.format_converter import WrestlingEvent
+
+
+def test_yearly_output_keeps_baseline_positional_fields():
+    output = YearlyOutput(2001, [], "content", "2001_season.md")
+    
+    assert output.merged_content == "content"
+    assert output.output_filename == "2001_season.md"
+    assert output.rebuilt
+
+
+def test_season_file_is_replaced_atomically(tmp_path, write_corpus):
+    write_corpus(series=("alpha", "beta"))
+    output_dir = tmp_path / "output"
+    
+    outputs = FileMerger(keep_content=True).process_directory(str(tmp_path / "input"), str(output_dir))
+    
+    season = (output_dir / "2001_season.md").read_text(encoding='utf-8')
+    assert outputs[0].merged_content == season
+    assert outputs[0].byte_count == os.path.getsize(output_dir / "2001_season.md")
+    assert outputs[0].event_count == 4
+    assert not [name for name in os.listdir(output_dir) if name.endswith('.tmp')]
+
+
+def test_events_of_a_series_are_merged_chronologically(tmp_path, write_corpus):
+    write_corpus(series=("alpha", "beta"))
+    output_dir = tmp_path / "output"
+    
+    FileMerger().process_directory(str(tmp_path / "input"), str(output_dir))
+    
+    season = (output_dir / "2001_season.md").read_text(encoding='utf-8')
+    assert season.index("Osaka") < season.index("Tokyo")
+    assert season.index("## alpha") < season.index("## beta")
+
+
+def make_events(*days):
+    return [WrestlingEvent(date=datetime(2001, 1, day), venue=label, city="", attendance=None,
+                           matches=[], original_content=[])
+            for label, day in days]
+
+
+def test_merge_events_is_a_stable_chronological_merge():
+    first = make_events(("a1", 3), ("a2", 5), ("a3", 9))
+    second = make_events(("b1", 1), ("b2", 5), ("b3", 7))
+    
+    merged = FileMerger().merge_events([first, second])
+    
+    assert [event.venue for event in merged] == ["b1", "a1", "a2", "b2", "b3", "a3"]
+
+
+def test_files_of_one_series_are_interleaved_by_date(tmp_path):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    (input_dir / "alpha01a.md").write_text(
+        "---\ntitle: Alpha\n---\n1/10/2001 Tokyo\n1. A def. B\n\n3/10/2001 Kobe\n1. A def. B\n", encoding='utf-8')
+    (input_dir / "alpha01b.md").write_text(
+        "---\ntitle: Alpha\n---\n2/10/2001 Osaka\n1. A def. B\n", encoding='utf-8')
+    (input_dir / "beta01.md").write_text("# Beta\n\n1/5/2001 Nagoya\n1. C def. D\n", encoding='utf-8')
+    
+    FileMerger().process_directory(str(input_dir), str(tmp_path / "output"))
+    
+    season = (tmp_path / "output" / "2001_season.md").read_text(encoding='utf-8')
+    assert season.count("## Alpha") == 1
+    assert season.index("## Beta") < season.index("## Alpha")
+    assert season.index("Tokyo") < season.index("Osaka") < season.index("Kobe")
+
+
+def test_summary_only_counts_match_a_full_build(tmp_path, write_corpus, monkeypatch):
+    write_corpus(series=("alpha", "beta"))
+    built = FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "built"))
+    
+    monkeypatch.setattr(FileMerger, '_parse_file', lambda *args, **kwargs: pytest.fail("parsed"))
+    summarized = FileMerger().summarize_directory(str(tmp_path / "input"), str(tmp_path / "summary"))
+    
+    assert [(o.year, o.event_count, [f.series_name for f in o.series_files]) for o in summarized] == \
+        [(o.year, o.event_count, [f.series_name for f in o.series_files]) for o in built]
+    assert not summarized[0].rebuilt
+    assert not (tmp_path / "summary").exists()
+
+
+def test_summary_only_reads_current_years_from_the_manifest(tmp_path, write_corpus, monkeypatch):
+    write_corpus(series=("alpha", "beta"))
+    FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "output"))
+    
+    monkeypatch.setattr(FileMerger, '_count_events', lambda *args: pytest.fail("counted"))
+    summarized = FileMerger().summarize_directory(str(tmp_path / "input"), str(tmp_path / "output"))
+    
+    assert [(output.year, output.event_count) for output in summarized] == [(2001, 4)]
@@ -0,0 +1,118 @@
+import re
+from datetime import datetime
+
+import pytest
+
+from modules.format_converter import FormatConverter, WrestlingEvent
+from modules.markdown_parser import ContentItem, MarkdownParser
+
+
+def make_event(date):
+    return WrestlingEvent(date=date, venue="", city="", attendance=None, matches=[], original_content=[])
+
+
+def test_date_key_is_day_ordinal():
+    event = make_event(datetime(2001, 4, 26))
+    assert event.date_key == datetime(2001, 4, 26).toordinal()
+
+
+def test_undated_event_sorts_first():
+    assert make_event(None).date_key == 0
+
+
+def test_date_key_follows_reassigned_date():
+    events = [make_event(datetime(2001, 5, 1)), make_event(datetime(2001, 6, 1))]
+    events[1].date = datetime(2001, 1, 1)
+    
+    events.sort(key=lambda e: e.date_key)
+    
+    assert [event.date.month for event in events] == [1, 5]
+
+
+DOCUMENT = """# Primera Special 2001
+
+4/26/2001 Gifu Industrial Hall 1050 Attendance
+
+① Singles Match
+SUWA vs Raimu Mishima
+(3:18 FFF)
+
+② Tag Team Match
+Dragon Kid & Genki Horiguchi vs Darkness Dragon & CIMA
+(16:45 Ultra Hurricanrana)
+
+5/15/2001 Osaka, Edion Arena 1850 Attendance
+
+① Singles Match
+Jorge Rivera vs Yasushi Kanda
+(4:50 No Contest due to M2K interference)
+"""
+
+
+def parse_items(text):
+    parser = MarkdownParser()
+    return parser.clean_content_for_processing(parser.parse_content(text).content_items)
+
+
+def test_each_line_is_date_scanned_once(monkeypatch):
+    converter = FormatConverter()
+    items = parse_items(DOCUMENT)
+    scanned = []
+    extract_dates = converter.date_parser.extract_dates_from_text
+    monkeypatch.setattr(converter.date_parser, 'extract_dates_from_text',
+                        lambda text, *args: scanned.append(text) or extract_dates(text, *args))
+    
+    converter._extract_events(items)
+    
+    assert scanned == [item.content for item in items]
+
+
+def test_events_and_matches_are_parsed_in_one_pass():
+    events = FormatConverter()._extract_events(parse_items(DOCUMENT))
+    
+    assert [(event.date.day, event.venue, event.city, event.attendance) for event in events] == [
+        (26, "Gifu Industrial Hall", "", 1050), (15, "Edion Arena", "Osaka", 1850)]
+    assert [[match.match_number for match in event.matches] for event in events] == [[1, 2], [1]]
+    
+    tag_match = events[0].matches[1]
+    assert tag_match.match_type == "Tag Team Match"
+    assert tag_match.participants == ["Dragon Kid", "Genki Horiguchi", "Darkness Dragon", "CIMA"]
+    assert (tag_match.time, tag_match.finish) == ("16:45", "Ultra Hurricanrana")
+    assert events[1].matches[0].winner_symbols == {"Jorge Rivera": '▲', "Yasushi Kanda": '▲'}
+
+
+def test_match_lines_before_the_first_event_are_ignored():
+    events = FormatConverter()._extract_events(parse_items("① Singles Match\nA vs B\n\n" + DOCUMENT))
+    
+    assert len(events) == 2
+    assert len(events[0].matches) == 2
+
+
+def header_with_substitutions(content, original_text):
+    """Venue, city and attendance as the regex-substituting header parser found them"""
+    attendance = None
+    attendance_match = re.search(r'(\d+)\s+attendance', content, re.IGNORECASE)
+    if attendance_match:
+        attendance = int(attendance_match.group(1))
+        content = re.sub(r'\s*\d+\s+attendance', '', content, flags=re.IGNORECASE)
+    content = content.replace(original_text, '').strip()
+    city, venue = [part.strip() for part in content.split(',', 1)] if ',' in content else ("", content)
+    return venue, city, attendance
+
+
+@pytest.mark.parametrize("line", [
+    "4/26/2001 Gifu Industrial Hall 1050 Attendance",
+    "12/24/2001 Tokyo, Korakuen Hall 2100 Attendance",
+    "Tokyo, Korakuen Hall 4/26/2001",
+    "2001-04-26 Nagoya, Aichi Prefectural Gym 300 attendance",
+    "November 25th, 2001 Shizuoka",
+    "4/26/2001",
+])
+def test_header_spans_match_substitution(line):
+    converter = FormatConverter()
+    item = ContentItem(type='content', content=line, line_number=1)
+    date = converter.date_parser.extract_dates_from_text(line)[0]
+    
+    event = converter._parse_event_header(item, date)
+    
+    assert (event.venue, event.city, event.attendance) == header_with_substitutions(line, date.original_text)
@@ -0,0 +1,165 @@
+import re
+import string
+import time
+
+import pytest
+
+from modules.format_converter import FormatConverter
+from modules.keyword_matcher import KeywordMatcher
+
+
+LINES = [
+    "1. Singles Match",
+    "Steel Cage Match",
+    "2. 6-Man Tag Match: CIMA & Dragon Kid vs Genki Horiguchi",
+    "Tag Team Match and a Battle Royal",
+    "Time Limit Draw (30:00)",
+    "double count out",
+    "CIMA def. Dragon Kid",
+    "",
+]
+
+
+def sequential_first(keywords, text, flags):
+    for pattern, value in keywords:
+        match = re.search(pattern, text, flags)
+        if match:
+            return value, match
+    return None
+
+
+def generated_vocabulary(size):
+    words = [''.join(string.ascii_lowercase[(n // 26 ** place) % 26] for place in range(4)) for n in range(size)]
+    return [(rf'{word}\s+match', word) for word in words]
+
+
+class CountingPattern:
+    """Wraps a compiled pattern and counts the searches run with it"""
+    
+    searches = 0
+    
+    def __init__(self, pattern):
+        self.pattern = pattern
+    
+    def search(self, text):
+        CountingPattern.searches += 1
+        return self.pattern.search(text)
+
+
+def assert_matches_sequential(keywords, matcher, text, flags):
+    expected = sequential_first(keywords, text, flags)
+    found = matcher.first(text)
+    
+    if expected is None:
+        assert found is None
+        assert not matcher.contains_any(text)
+    else:
+        assert found[0] is expected[0]
+        assert found[1].span() == expected[1].span()
+        assert matcher.contains_any(text)
+
+
+@pytest.mark.parametrize("vocabulary, matcher", [
+    ('match_type_patterns', 'match_type_matcher'),
+    ('special_results', 'special_result_matcher'),
+])
+@pytest.mark.parametrize("text", LINES)
+def test_first_matches_trying_each_pattern_in_order(text, vocabulary, matcher):
+    converter = FormatConverter()
+    
+    assert_matches_sequential(getattr(converter, vocabulary), getattr(converter, matcher), text, re.IGNORECASE)
+
+
+@pytest.mark.parametrize("pattern, text", [
+    (r'singles?\s+match', "SINGLE MATCH"),
+    (r'(?:steel|iron)\s+cage', "Iron Cage"),
+    (r'ladder|table', "Tables Match"),
+    (r'(?-i:CAGE)', "cage"),
+    (r'(?-i:CAGE)', "CAGE"),
+    (r'[st]ag+ed', "Staged"),
+    (r'ma{0,1}tch', "mtch"),
+    (r'kick', "\u212aICK"),
+])
+def test_literal_prefilter_does_not_miss_matches(pattern, text):
+    keywords = [(pattern, 'special'), (r'dragon\s+suplex', 'suplex')]
+    matcher = KeywordMatcher(keywords, re.IGNORECASE)
+    
+    assert_matches_sequential(keywords, matcher, text, re.IGNORECASE)
+
+
+def test_overlapping_literals_are_all_found():
+    keywords = [(r'cage\s+match', 'cage'), (r'steel\s+cage', 'steel'), (r'steelcage', 'joined'), (r'age', 'age')]
+    matcher = KeywordMatcher(keywords)
+    
+    assert [value for value, _ in matcher.find_all("steelcage steel cage match")] == ['cage', 'steel', 'joined', 'age']
+    assert [match.span() for _, match in matcher.find_all("steelcage steel cage match")][0] == (16, 26)
+
+
+def test_searches_per_line_do_not_grow_with_the_vocabulary(monkeypatch):
+    matchers = {}
+    for size in (10, 1000):
+        matcher = KeywordMatcher(FormatConverter().match_type_patterns + generated_vocabulary(size), re.IGNORECASE)
+        matcher._patterns = [CountingPattern(pattern) for pattern in matcher._patterns]
+        matchers[size] = matcher
+    
+    searches = {}
+    for size, matcher in matchers.items():
+        monkeypatch.setattr(CountingPattern, 'searches', 0)
+        for text in LINES:
+            matcher.first(text)
+        searches[size] = CountingPattern.searches
+    
+    assert searches[1000] == searches[10]
+    assert searches[10] <= 2 * len(LINES)
+
+
+def test_scan_time_stays_flat_as_the_vocabulary_grows():
+    timings = {}
+    for size in (10, 1000):
+        matcher = KeywordMatcher(FormatConverter().match_type_patterns + generated_vocabulary(size), re.IGNORECASE)
+        start = time.perf_counter()
+        for _ in range(200):
+            for text in LINES:
+                matcher.first(text)
+        timings[size] = time.perf_counter() - start
+    
+    # Trying the patterns one by one would take about 100 times as long
+    assert timings[1000] < 5 * timings[10]
+
+
+def test_earlier_keyword_wins_over_longer_later_one():
+    matcher = KeywordMatcher([(r'cage', 'cage'), (r'steel\s+cage', 'steel cage')])
+    
+    assert matcher.first("steel cage")[0] == 'cage'
+
+
+def test_empty_vocabulary_matches_nothing():
+    matcher = KeywordMatcher([])
+    
+    assert matcher.first("Singles Match") is None
+    assert not matcher.contains_any("Singles Match")
+
+
+def test_match_type_built_from_match_groups():
+    assert FormatConverter()._determine_match_type("② 8-Man Tag Match") == "8-Man Tag Match"
+
+
+def test_added_match_type_is_detected():
+    converter = FormatConverter()
+    assert not converter._is_match_line("Lumberjack Match")
+    
+    converter.add_match_type_pattern(r'lumberjack\s+match', 'Lumberjack Match', index=0)
+    
+    assert converter._is_match_line("Lumberjack Match")
+    assert converter._determine_match_type("Lumberjack Match") == 'Lumberjack Match'
+
+
+@pytest.mark.parametrize("finish, symbols", [
+    ("Time Limit Draw", ['△', '△']),
+    ("Double Count Out", ['▲', '▲']),
+    ("Pinfall", ['⭕️', '❌']),
+])
+def test_result_keywords_set_participant_symbols(finish, symbols):
+    result = FormatConverter()._determine_winner_symbols(["CIMA", "Dragon Kid"], {'finish': finish})
+    
+    assert [result["CIMA"], result["Dragon Kid"]] == symbols
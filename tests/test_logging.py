@@ -0,0 +1,24 @@
+import logging
+
+from modules.file_merger import FileMerger
+
+
+def test_default_level_emits_no_per_file_records(tmp_path, write_corpus, caplog):
+    write_corpus(years=(2001, 2005), series=("alpha", "beta"))
+    caplog.set_level(logging.INFO, logger='modules')
+    
+    FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "output"))
+    
+    assert caplog.records
+    assert all(record.levelno >= logging.INFO for record in caplog.records)
+    assert all(not record.getMessage().startswith((" ", "\n")) for record in caplog.records)
+
+
+def test_worker_records_are_replayed_in_file_order(tmp_path, write_corpus, caplog):
+    write_corpus(years=(2001, 2005), series=("alpha", "beta"))
+    caplog.set_level(logging.DEBUG, logger='modules')
+    
+    FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "output"), workers=2)
+    
+    parsed = [record.getMessage() for record in caplog.records if record.getMessage().startswith("Parsing: ")]
+    assert parsed == ["Parsing: alpha01.md", "Parsing: beta01.md", "Parsing: alpha05.md", "Parsing: beta05.md"]
@@ -0,0 +1,144 @@
+import itertools
+import re
+
+import pytest
+
+from modules.file_merger import FileInfo, FileMerger
+from modules.markdown_parser import MappedContentItems, MarkdownParser
+
+
+def test_mapped_parse_matches_regular_parse(tmp_path):
+    path = tmp_path / "series01.md"
+    path.write_text("---\ntitle: Series 1\n---\n# Night 1\n\n4/26/2001 Gifu\n1. A def. B\n", encoding='utf-8')
+    parser = MarkdownParser()
+    
+    regular = parser.parse_file(str(path))
+    mapped = parser.parse_file_mapped(str(path))
+    
+    assert isinstance(mapped.content_items, MappedContentItems)
+    assert mapped.series_name == regular.series_name == "Series 1"
+    assert list(mapped.content_items) == list(regular.content_items)
+    mapped.content_items.close()
+
+
+def test_mapping_is_closed_when_extraction_fails(tmp_path, monkeypatch):
+    path = tmp_path / "series01.md"
+    path.write_text("# Series 1\n4/26/2001 Gifu\n", encoding='utf-8')
+    merger = FileMerger(use_mmap=True)
+    
+    seen = []
+    
+    def fail(parsed_data, *args, **kwargs):
+        seen.append(parsed_data)
+        raise RuntimeError("extraction failed")
+    monkeypatch.setattr(merger, '_extract_events_from_file', fail)
+    
+    file_info = FileInfo(filepath=str(path), filename=path.name, year=2001, series_name="")
+    assert merger._parse_file(file_info) is None
+    assert seen[0].content_items._buffer is None
+
+
+def test_mapping_is_closed_when_parsing_fails(tmp_path, monkeypatch):
+    path = tmp_path / "series01.md"
+    path.write_text("# Series 1\n4/26/2001 Gifu\n", encoding='utf-8')
+    parser = MarkdownParser()
+    opened = []
+    
+    original_buffer = MappedContentItems.buffer
+    
+    def tracking_buffer(self):
+        opened.append(self)
+        return original_buffer.fget(self)
+    monkeypatch.setattr(MappedContentItems, 'buffer', property(tracking_buffer))
+    
+    def fail(raw):
+        raise RuntimeError("bad line")
+    monkeypatch.setattr(parser, '_content_span', fail)
+    
+    with pytest.raises(RuntimeError):
+        parser.parse_file_mapped(str(path))
+    assert opened and all(items._buffer is None for items in opened)
+
+
+def test_iter_items_streams_frontmatter_and_body(tmp_path):
+    path = tmp_path / "series01.md"
+    path.write_text("---\ntitle: Series 1\n---\n# Night 1\n\n4/26/2001 Gifu\n", encoding='utf-8')
+    
+    items = list(MarkdownParser().iter_items(str(path)))
+    
+    assert [item.type for item in items] == ['yaml', 'header', 'content']
+    assert items[2].content == "4/26/2001 Gifu"
+    assert items[2].line_number == 6
+
+
+def test_unterminated_frontmatter_is_bounded(tmp_path):
+    parser = MarkdownParser()
+    limit = parser.MAX_FRONTMATTER_LINES
+    consumed = []
+    
+    def lines():
+        yield '---'
+        for number in range(limit * 10):
+            consumed.append(number)
+            yield f"line {number}"
+    
+    yaml_content, yaml_text, replay, start = parser._split_frontmatter(lines())
+    
+    assert yaml_content is None and yaml_text is None and start == 1
+    assert len(consumed) == limit
+    assert replay == ['---'] + [f"line {number}" for number in range(limit)]
+
+
+def test_unterminated_frontmatter_is_parsed_as_content(tmp_path):
+    path = tmp_path / "series01.md"
+    path.write_text("---\n# Series 1\n4/26/2001 Gifu\n", encoding='utf-8')
+    
+    parsed = MarkdownParser().parse_file(str(path), keep_raw=False)
+    
+    assert parsed.series_name == "Series 1"
+    assert [item.content for item in parsed.content_items] == ['---', 'Series 1', '4/26/2001 Gifu']
+
+
+def strip_with_substitutions(text):
+    text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
+    text = re.sub(r'\*(.*?)\*', r'\1', text)
+    return re.sub(r'`(.*?)`', r'\1', text)
+
+
+def test_markup_stripper_matches_the_substitutions():
+    parser = MarkdownParser()
+    for length in range(1, 7):
+        for chars in itertools.product('*`a', repeat=length):
+            text = ''.join(chars)
+            assert parser._strip_inline_markup(text) == strip_with_substitutions(text), text
+
+
+def test_cleaning_keeps_lines_without_markup():
+    parser = MarkdownParser()
+    items = parser.parse_content("# Night 1\n\n**4/26/2001** Gifu\n1. `A` def. B\n").content_items
+    
+    cleaned = parser.clean_content_for_processing(items)
+    
+    assert [item.content for item in cleaned] == ["Night 1", "4/26/2001 Gifu", "1. A def. B"]
+    assert cleaned[0] is items[0]
+
+
+@pytest.mark.parametrize("text, series_name", [
+    ("---\ntitle: From Frontmatter\n---\n# Header\n", "From Frontmatter"),
+    ("---\nvenue: Korakuen\n---\n\n### Minor\n## From Header\n", "From Header"),
+    ("no header at all\n", ""),
+])
+def test_scan_header_matches_parse_file(tmp_path, text, series_name):
+    path = tmp_path / "series01.md"
+    path.write_text(text, encoding='utf-8')
+    parser = MarkdownParser()
+    
+    assert parser.scan_header(str(path))[0] == parser.parse_file(str(path)).series_name == series_name
+
+
+def test_scan_header_stops_before_the_body(tmp_path):
+    path = tmp_path / "series01.md"
+    body = b"4/26/2001 Gifu\n1. A def. B\n" * 10000
+    path.write_bytes(b"---\ntitle: Series 1\nvenue: Gifu\n---\n# Night 1\n" + body + b"\xff\xfe not utf-8\n")
+    
+    assert MarkdownParser().scan_header(str(path)) == ("Series 1", {'title': "Series 1", 'venue': "Gifu"})
@@ -0,0 +1,215 @@
+import logging
+import pickle
+import queue
+from concurrent.futures import Future
+
+import pytest
+
+from modules import file_merger as file_merger_module
+from modules import format_converter as format_converter_module
+from modules.file_merger import FileInfo, FileMerger
+from modules.format_converter import FormatConverter
+from modules.markdown_parser import ContentItem
+
+
+class LazyFuture(Future):
+    """Future that runs its call in this process when its result is asked for"""
+    
+    def __init__(self, executor, fn, args):
+        super().__init__()
+        self.executor = executor
+        self.call = (fn, args)
+    
+    def result(self, timeout=None):
+        if self.call is not None:
+            fn, args = self.call
+            self.call = None
+            self.executor.outstanding -= 1
+            self.set_result(fn(*args))
+        return super().result(timeout)
+
+
+class LazyExecutor:
+    """Stand-in for ProcessPoolExecutor that records how many calls are queued"""
+    
+    def __init__(self, max_workers=None, initializer=None, initargs=()):
+        self.outstanding = 0
+        self.peak = 0
+        LazyExecutor.last = self
+    
+    def submit(self, fn, *args):
+        self.outstanding += 1
+        self.peak = max(self.peak, self.outstanding)
+        return LazyFuture(self, fn, args)
+    
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def in_process_workers(monkeypatch):
+    monkeypatch.setattr(file_merger_module, 'ProcessPoolExecutor', LazyExecutor)
+    monkeypatch.setattr(file_merger_module, '_worker_merger', FileMerger(), raising=False)
+    monkeypatch.setattr(file_merger_module, '_worker_log', queue.SimpleQueue(), raising=False)
+
+
+def test_worker_returns_only_series_and_events(tmp_path, write_corpus, in_process_workers):
+    write_corpus(years=(2001, 2002, 2003))
+    path = tmp_path / "input" / "alpha01.md"
+
+    result, records, _ = file_merger_module._parse_file_in_worker(FileInfo(str(path), path.name, 2001, ""))
+
+    series_name, events = result
+    assert series_name == "alpha"
+    assert len(events) == 2
+
+
+def test_files_in_flight_are_bounded(tmp_path, write_corpus, in_process_workers):
+    write_corpus(years=(2001, 2002, 2003))
+
+    FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "output"), workers=2)
+
+    assert LazyExecutor.last.peak == FileMerger.PARSE_WINDOW_PER_WORKER * 2
+    assert LazyExecutor.last.outstanding == 0
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_collected_files_carry_no_parsed_lines(tmp_path, write_corpus, workers):
+    write_corpus(years=(2001, 2002, 2003))
+
+    outputs = FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "output"), workers=workers)
+
+    files = [file_info for output in outputs for file_info in output.series_files]
+    assert len(files) == 9
+    assert all(file_info.parsed_data is None and file_info.events is None for file_info in files)
+    assert all(file_info.event_count == 2 and file_info.series_name for file_info in files)
+    assert [output.event_count for output in outputs] == [6, 6, 6]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_events_are_kept_when_asked_for(tmp_path, write_corpus, workers):
+    write_corpus(years=(2001, 2002))
+
+    outputs = FileMerger(keep_events=True).process_directory(str(tmp_path / "input"), str(tmp_path / "output"),
+                                                             workers=workers)
+
+    files = [file_info for output in outputs for file_info in output.series_files]
+    assert all(file_info.parsed_data is None and len(file_info.events) == 2 for file_info in files)
+
+
+def test_parallel_output_matches_serial(tmp_path, write_corpus):
+    write_corpus(years=(2001, 2002, 2003))
+
+    serial = FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "serial"))
+    parallel = FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "parallel"), workers=2)
+
+    assert [output.year for output in parallel] == [2001, 2002, 2003]
+    for year in (2001, 2002, 2003):
+        season = f"{year}_season.md"
+        assert (tmp_path / "parallel" / season).read_bytes() == (tmp_path / "serial" / season).read_bytes()
+    assert [output.content_hash for output in parallel] == [output.content_hash for output in serial]
+
+
+def test_large_files_are_extracted_in_chunks_like_serial(tmp_path, write_corpus, monkeypatch):
+    write_corpus(years=(2001, 2002, 2003))
+    with open(tmp_path / "input" / "alpha02.md", 'a', encoding='utf-8') as f:
+        for day in range(1, 29):
+            f.write(f"\n2/{day}/2002 Sapporo\n1. E def. F\n")
+    
+    serial = FileMerger(date_cache_size=64).process_directory(str(tmp_path / "input"), str(tmp_path / "serial"))
+    
+    monkeypatch.setattr(FileMerger, 'LARGE_FILE_BYTES', 200)
+    monkeypatch.setattr(file_merger_module, '_usable_cpus', lambda: 2)
+    merger = FileMerger(date_cache_size=64)
+    merger.process_directory(str(tmp_path / "input"), str(tmp_path / "parallel"), workers=2)
+    
+    season = "2002_season.md"
+    assert (tmp_path / "parallel" / season).read_bytes() == (tmp_path / "serial" / season).read_bytes()
+    assert merger.date_parser.cache_hits + merger.date_parser.cache_misses > 0
+
+
+class PicklingExecutor:
+    """Runs map calls in this process, passing arguments and results through pickle like a process pool"""
+    
+    def __init__(self):
+        self.sent = 0
+        self.calls = 0
+    
+    def map(self, fn, *iterables):
+        results = []
+        for args in zip(*iterables):
+            payload = pickle.dumps(args)
+            self.sent += len(payload)
+            self.calls += 1
+            results.append(pickle.loads(pickle.dumps(fn(*pickle.loads(payload)))))
+        return results
+
+
+def test_chunks_send_each_line_to_a_worker_once(monkeypatch):
+    monkeypatch.setattr(format_converter_module, '_chunk_converter', None)
+    items = []
+    for day in range(1, 29):
+        items.append(ContentItem('content', f"2/{day}/2002 Sapporo, Korakuen Hall", line_number=3 * day))
+        items.append(ContentItem('content', "① Singles Match", line_number=3 * day + 1))
+        items.append(ContentItem('content', "CIMA def. Dragon Kid (12:34)", line_number=3 * day + 2))
+    executor = PicklingExecutor()
+    
+    events = FormatConverter()._extract_events_parallel(items, executor, 4)
+    
+    assert events == FormatConverter()._extract_events(items)
+    assert all(event.original_content[0] is items[3 * index] for index, event in enumerate(events))
+    assert executor.calls == 4
+    # One pass over the lines: no dates or items go out, and no second round
+    assert executor.sent < sum(len(pickle.dumps(item.content)) for item in items)
+
+
+def test_large_file_is_not_chunked_without_spare_cpus(tmp_path, write_corpus, monkeypatch):
+    write_corpus(years=(2001,))
+    serial = FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "serial"))
+    
+    monkeypatch.setattr(FileMerger, 'LARGE_FILE_BYTES', 20)
+    monkeypatch.setattr(file_merger_module, '_usable_cpus', lambda: 1)
+    monkeypatch.setattr(format_converter_module, '_extract_chunk', None)
+    parallel = FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "parallel"), workers=2)
+    
+    assert [output.content_hash for output in parallel] == [output.content_hash for output in serial]
+
+
+def test_chunk_workers_share_the_worker_date_cache(monkeypatch):
+    package_logger = logging.getLogger('modules')
+    monkeypatch.setattr(package_logger, 'handlers', list(package_logger.handlers))
+    monkeypatch.setattr(package_logger, 'propagate', package_logger.propagate)
+    monkeypatch.setattr(package_logger, 'level', package_logger.level)
+    monkeypatch.setattr(format_converter_module, '_chunk_converter', None)
+    
+    file_merger_module._init_worker({'date_cache_size': 16}, logging.INFO)
+    
+    converter = format_converter_module._get_chunk_converter()
+    assert converter is file_merger_module._worker_merger.format_converter
+    assert converter.date_parser.cache_size == 16
+
+
+def test_unparsable_file_is_skipped_like_serial(tmp_path, write_corpus, caplog):
+    write_corpus(years=(2001, 2002, 2003))
+    (tmp_path / "input" / "delta02.md").write_bytes(b"# delta\n\n\xff\xfe\n")
+    
+    outputs = FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "output"), workers=2)
+    
+    assert [output.year for output in outputs] == [2001, 2002, 2003]
+    assert [len(output.series_files) for output in outputs] == [3, 3, 3]
+    assert "Cannot parse delta02.md" in caplog.text
+
+
+def test_more_workers_than_files(tmp_path):
+    (tmp_path / "input").mkdir()
+    (tmp_path / "input" / "alpha01.md").write_text("# alpha\n\n1/2/2001 Tokyo\n1. A def. B\n", encoding='utf-8')
+    
+    outputs = FileMerger().process_directory(str(tmp_path / "input"), str(tmp_path / "output"), workers=4)
+    
+    assert [(output.year, output.event_count) for output in outputs] == [(2001, 1)]
@@ -0,0 +1,103 @@
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from modules import parse_cache
+from modules.format_converter import WrestlingEvent
+from modules.parse_cache import ParseCache
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'process_wrestling_results.py')
+
+
+def make_events():
+    return [WrestlingEvent(date=datetime(2001, 4, 26), venue="Hall", city="Gifu", attendance=1050,
+                           matches=[], original_content=[])]
+
+
+def test_store_and_load(tmp_path):
+    cache = ParseCache(str(tmp_path), parser_version=1)
+    cache.store("ab" * 32, "Series 1", make_events())
+    
+    series_name, events = cache.load("ab" * 32)
+    
+    assert series_name == "Series 1"
+    assert events[0].city == "Gifu" and events[0].date_key == datetime(2001, 4, 26).toordinal()
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_other_parser_versions_are_not_read(tmp_path):
+    ParseCache(str(tmp_path), parser_version=1).store("ab" * 32, "Series 1", make_events())
+    
+    assert ParseCache(str(tmp_path), parser_version=2).load("ab" * 32) is None
+
+
+def test_unreadable_entry_is_dropped(tmp_path):
+    cache = ParseCache(str(tmp_path), parser_version=1)
+    path = cache._entry_path("cd" * 32)
+    os.makedirs(os.path.dirname(path))
+    with open(path, 'wb') as f:
+        f.write(b"not a pickle")
+    
+    assert cache.load("cd" * 32) is None
+    assert not os.path.exists(path)
+
+
+def test_prune_removes_least_recently_used(tmp_path):
+    cache = ParseCache(str(tmp_path), parser_version=1)
+    for index, content_hash in enumerate(("aa" * 32, "bb" * 32, "cc" * 32)):
+        cache.store(content_hash, "Series", make_events())
+        os.utime(cache._entry_path(content_hash), (1000 + index, 1000 + index))
+    cache.max_bytes = os.path.getsize(cache._entry_path("cc" * 32)) * 2
+    
+    cache.prune()
+    
+    assert [os.path.exists(cache._entry_path(h)) for h in ("aa" * 32, "bb" * 32, "cc" * 32)] == [False, True, True]
+
+
+def test_temporary_files_in_progress_are_kept(tmp_path):
+    cache = ParseCache(str(tmp_path), parser_version=1, max_bytes=0)
+    os.makedirs(tmp_path / "ab")
+    fresh = tmp_path / "ab" / "fresh.tmp"
+    stale = tmp_path / "ab" / "stale.tmp"
+    fresh.write_bytes(b"x")
+    stale.write_bytes(b"x")
+    old = time.time() - parse_cache.STALE_TEMP_SECONDS - 10
+    os.utime(stale, (old, old))
+    
+    cache.prune()
+    assert fresh.exists() and not stale.exists()
+    
+    cache.clear()
+    assert fresh.exists()
+
+
+def test_cli_does_not_cache_by_default(tmp_path):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    (input_dir / "series01.md").write_text("# Series 1\n\n4/26/2001 Gifu\n1. A def. B\n", encoding='utf-8')
+    env = dict(os.environ, XDG_CACHE_HOME=str(tmp_path / "cache"))
+    
+    subprocess.run([sys.executable, SCRIPT, str(input_dir), str(tmp_path / "output")],
+                   env=env, check=True, capture_output=True)
+    assert not (tmp_path / "cache").exists()
+    
+    subprocess.run([sys.executable, SCRIPT, str(input_dir), str(tmp_path / "output"), '--cache', '--force'],
+                   env=env, check=True, capture_output=True)
+    assert (tmp_path / "cache" / "wrestling_results" / "parse").is_dir()
+
+
+def test_cli_prunes_to_cache_max_mb(tmp_path, write_corpus):
+    input_dir = write_corpus()
+    cache_dir = tmp_path / "cache"
+    
+    def run(*args):
+        subprocess.run([sys.executable, SCRIPT, str(input_dir), str(tmp_path / "output"),
+                        '--cache-dir', str(cache_dir), '--force', *args], check=True, capture_output=True)
+    
+    run()
+    assert len(list(cache_dir.glob("*/*.pickle"))) == 3
+    
+    run('--cache-max-mb', '0')
+    assert not list(cache_dir.glob("*/*.pickle"))
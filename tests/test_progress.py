@@ -0,0 +1,92 @@
+import io
+import logging
+
+from modules import progress as progress_module
+from modules.progress import ProgressReporter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+    
+    def monotonic(self):
+        return self.now
+
+
+def make_reporter(monkeypatch, interval=0.5):
+    clock = FakeClock()
+    monkeypatch.setattr(progress_module.time, 'monotonic', clock.monotonic)
+    stream = io.StringIO()
+    return ProgressReporter(stream=stream, interval=interval, enabled=True), stream, clock
+
+
+def test_disabled_for_non_terminal_streams():
+    assert not ProgressReporter(stream=io.StringIO()).enabled
+
+
+def test_updates_outside_a_run_are_ignored():
+    reporter = ProgressReporter(enabled=False)
+    reporter.update(1, 10)
+    assert reporter.files == 0
+
+
+def test_counts_without_drawing_when_disabled():
+    stream = io.StringIO()
+    reporter = ProgressReporter(stream=stream, enabled=False)
+    reporter.start(3)
+    reporter.update(1, 10)
+    reporter.update(1, 5)
+    reporter.finish()
+    
+    assert (reporter.files, reporter.events) == (2, 15)
+    assert stream.getvalue() == ""
+
+
+def test_redraws_at_most_once_per_interval(monkeypatch):
+    reporter, stream, clock = make_reporter(monkeypatch)
+    reporter.start(10)
+    
+    reporter.update(1, 10)
+    assert stream.getvalue() == ""
+    
+    clock.now += 1.0
+    reporter.update(1, 10)
+    assert stream.getvalue() == "\r2/10 files  2.0 files/s  20 events/s  ETA 0:04"
+    
+    clock.now += 0.1
+    reporter.update(1, 10)
+    assert stream.getvalue().count("\r") == 1
+
+
+def test_finish_clears_the_line(monkeypatch):
+    reporter, stream, clock = make_reporter(monkeypatch)
+    reporter.start(2)
+    clock.now += 1.0
+    reporter.update(1)
+    width = len(stream.getvalue()) - 1
+    
+    reporter.finish()
+    
+    assert stream.getvalue().endswith("\r" + " " * width + "\r")
+
+
+def test_log_records_clear_the_line_and_force_a_redraw(monkeypatch):
+    reporter, stream, clock = make_reporter(monkeypatch)
+    reporter.start(4)
+    clock.now += 1.0
+    reporter.update(1)
+    
+    record = logging.LogRecord('modules', logging.INFO, __file__, 1, "message", None, None)
+    assert reporter.filter(record)
+    assert stream.getvalue().endswith("\r")
+    
+    reporter.update(1)
+    assert stream.getvalue().count("files/s") == 2
+
+
+def test_eta_formats_hours():
+    reporter = ProgressReporter(enabled=False)
+    reporter.total_files = 7201
+    reporter.files = 1
+    assert reporter._format_eta(1.0) == "2:00:00"
+    assert reporter._format_eta(0.0) == "?"
@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from modules.file_merger import FileMerger
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'process_wrestling_results.py')
+
+
+def run(input_dir, output_dir, *args):
+    subprocess.run([sys.executable, SCRIPT, str(input_dir), str(output_dir), *args],
+                   check=True, capture_output=True)
+
+
+def snapshot(output_dir):
+    return {
+        name: (os.stat(output_dir / name).st_mtime_ns, (output_dir / name).read_bytes())
+        for name in os.listdir(output_dir) if name.endswith('_season.md')
+    }
+
+
+@pytest.mark.parametrize("filters", [
+    ['--series', 'alpha*'],
+    ['--years', '2001'],
+    ['--series', 'beta*', '--years', '2003-2005'],
+])
+def test_filtered_run_leaves_other_output_untouched(tmp_path, write_corpus, filters):
+    input_dir, output_dir = tmp_path / "input", tmp_path / "output"
+    write_corpus(years=(2001, 2003, 2005, 2007))
+    run(input_dir, output_dir)
+    seasons = snapshot(output_dir)
+    summary = (output_dir / "processing_summary.md").read_text(encoding='utf-8')
+    
+    run(input_dir, output_dir, '--force', *filters)
+    
+    assert {name: content for name, (_, content) in snapshot(output_dir).items()} == \
+        {name: content for name, (_, content) in seasons.items()}
+    assert (output_dir / "processing_summary.md").read_text(encoding='utf-8') == summary
+    
+    # Nothing narrowed was recorded: an unfiltered run finds every year current
+    filtered = snapshot(output_dir)
+    run(input_dir, output_dir)
+    assert snapshot(output_dir) == filtered
+
+
+def test_years_outside_the_selection_are_not_rewritten(tmp_path, write_corpus):
+    input_dir, output_dir = tmp_path / "input", tmp_path / "output"
+    write_corpus(years=(2001, 2003, 2005, 2007))
+    run(input_dir, output_dir)
+    before = snapshot(output_dir)
+    
+    run(input_dir, output_dir, '--force', '--years', '2001')
+    after = snapshot(output_dir)
+    
+    assert after['2001_season.md'][0] != before['2001_season.md'][0]
+    assert {name: after[name] for name in after if name != '2001_season.md'} == \
+        {name: before[name] for name in before if name != '2001_season.md'}
+
+
+def test_series_selects_whole_years():
+    merger = FileMerger(series=['alpha0*'])
+    
+    groups = merger._group_files_by_year(['in/alpha01.md', 'in/beta01.md', 'in/beta03.md', 'in/alpha1999.md'])
+    
+    assert {year: [f.filename for f in files] for year, files in groups.items()} == \
+        {2001: ['alpha01.md', 'beta01.md']}
+
+
+def test_unselected_files_are_never_opened(tmp_path, write_corpus, monkeypatch):
+    input_dir = tmp_path / "input"
+    write_corpus(years=(2001, 2003, 2005, 2007))
+    merger = FileMerger(years=[2005])
+    opened = []
+    original_parse = merger._parse_file
+    
+    def tracking_parse(file_info, *args, **kwargs):
+        opened.append(file_info.filename)
+        return original_parse(file_info, *args, **kwargs)
+    monkeypatch.setattr(merger, '_parse_file', tracking_parse)
+    
+    merger.process_directory(str(input_dir), str(tmp_path / "output"))
+    
+    assert sorted(opened) == ['alpha05.md', 'beta05.md', 'gamma05.md']
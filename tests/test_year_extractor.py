@@ -0,0 +1,79 @@
+import pytest
+
+from modules.year_extractor import YearExtractor
+
+
+@pytest.mark.parametrize("filename, year", [
+    ('primera01.md', 2001),        # manual mapping
+    ('noseporque.md', None),       # mapped to no year
+    ('finalgate07.md', 2007),      # 2-digit year at the end
+    ('series3_2007.md', 2007),     # 4-digit year
+    ('final13_99', 1999),          # no extension, 99 is 1999
+    ('tour2045.md', 2004),         # 2045 is out of range, '04' is the last 2-digit number
+    ('unknown.md', None),
+])
+def test_extract_year(filename, year):
+    assert YearExtractor().extract_year(filename) == year
+
+
+def test_extract_years_keeps_order():
+    extractor = YearExtractor()
+    assert extractor.extract_years(['a2005.md', 'b.md', 'a2005.md', 'C99']) == [2005, None, 2005, 1999]
+
+
+def test_group_files_by_year_accepts_an_iterator():
+    groups = YearExtractor().group_files_by_year(iter(['b2005.md', 'a2005.md', 'x2001.md', 'none.md']))
+    assert groups == {2005: ['a2005.md', 'b2005.md'], 2001: ['x2001.md']}
+
+
+def test_new_mapping_replaces_cached_result():
+    extractor = YearExtractor()
+    assert extractor.extract_year('special2005.md') == 2005
+    
+    extractor.add_manual_mapping('Special2005', 2010)
+    
+    assert extractor.extract_year('special2005.md') == 2010
+
+
+def test_load_yaml_mapping_file(tmp_path):
+    path = tmp_path / "mappings.yaml"
+    path.write_text("foo.md: 2005\nBar: null\n", encoding='utf-8')
+    extractor = YearExtractor()
+    
+    assert extractor.load_mapping_file(str(path)) == 2
+    assert extractor.extract_years(['foo', 'bar.md']) == [2005, None]
+
+
+def test_load_json_mapping_file(tmp_path):
+    path = tmp_path / "mappings.json"
+    path.write_text('{"foo.md": 2006, "qux07.md": null}', encoding='utf-8')
+    extractor = YearExtractor()
+    extractor.extract_year('qux07.md')
+    
+    extractor.load_mapping_file(str(path))
+    
+    assert extractor.extract_years(['foo.md', 'qux07.md']) == [2006, None]
+
+
+def test_load_csv_mapping_file_with_header(tmp_path):
+    path = tmp_path / "mappings.csv"
+    path.write_text("filename,year\nfoo.md,2007\nbar2001.md,\n\nZed.MD,none\n", encoding='utf-8')
+    extractor = YearExtractor()
+    
+    assert extractor.load_mapping_file(str(path)) == 3
+    assert extractor.extract_years(['foo', 'bar2001', 'zed']) == [2007, None, None]
+
+
+@pytest.mark.parametrize("name, content", [
+    ("list.yaml", "- a\n- b\n"),
+    ("bad.json", '{"a.md": "x"}'),
+    ("fraction.json", '{"a.md": 2005.5}'),
+    ("wide.csv", "a.md,2005,extra\n"),
+    ("mappings.txt", "a.md=2005\n"),
+])
+def test_invalid_mapping_files_are_rejected(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content, encoding='utf-8')
+    
+    with pytest.raises(ValueError):
+        YearExtractor().load_mapping_file(str(path))